@@ -17,12 +17,27 @@ import certifi
 import itertools
 import fcntl
 import shlex
-import ssl
 import socket
 import base64
-import http.client
-
-from datetime import datetime
+import http.server
+import functools
+import mimetypes
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeoutError
+import queue
+import hashlib
+import select
+import struct
+import array
+import random
+import email.utils
+import glob
+import fnmatch
+
+from datetime import datetime, timezone
+from collections import OrderedDict
+from collections.abc import Mapping
 from base64 import b64encode
 
 import xml.etree.ElementTree as ET
@@ -64,50 +79,88 @@ if not os.path.exists(env_vars_path):
 
 print(f"Env vars file path is: {env_vars_path}")
 
-# Read variables from the file
-with open(env_vars_path, 'r') as f:
-    lines = f.readlines()
-
 separate_appids = None
+env_vars_keys = set()
+env_vars_mtime = None
+
+# Read variables from the file into os.environ and refresh the module globals built from them
+def load_env_vars():
+    global separate_appids, env_vars_keys, env_vars_mtime
+    global steamid3, logged_in_home, compat_tool_name
+    global epic_games_launcher, ubisoft_connect_launcher, ea_app_launcher, gog_galaxy_launcher, bnet_launcher
+    global amazon_launcher, itchio_launcher, legacy_launcher, vkplay_launcher, hoyoplay_launcher, gamejolt_launcher
+    global minecraft_launcher, indie_launcher, stove_launcher, humble_launcher, gryphlink_launcher
+    global chromedirectory, names_str, websites_str, custom_names, custom_websites, base_launch_options
+
+    env_vars_mtime = os.stat(env_vars_path).st_mtime_ns
+
+    with open(env_vars_path, 'r') as f:
+        lines = f.readlines()
+
+    separate_appids = None
+    loaded_keys = set()
+
+    for line in lines:
+        if line.startswith('export '):
+            line = line[7:]  # Remove 'export '
+
+        # Parse the name and value
+        if '=' in line:
+            name, value = line.strip().split('=', 1)
+            os.environ[name] = value
+            loaded_keys.add(name)
+
+            # Track separate_appids if explicitly set to false
+            if name == 'separate_appids' and value.strip().lower() == 'false':
+                separate_appids = value.strip()
+
+    # Drop variables that were removed from the file since the last load
+    for name in env_vars_keys - loaded_keys:
+        os.environ.pop(name, None)
+    env_vars_keys = loaded_keys
+
+    # Variables from NonSteamLaunchers.sh
+    steamid3 = os.environ['steamid3']
+    logged_in_home = os.environ['logged_in_home']
+    compat_tool_name = os.environ['compat_tool_name']
+    #Scanner Variables
+    epic_games_launcher = os.environ.get('epic_games_launcher', '')
+    ubisoft_connect_launcher = os.environ.get('ubisoft_connect_launcher', '')
+    ea_app_launcher = os.environ.get('ea_app_launcher', '')
+    gog_galaxy_launcher = os.environ.get('gog_galaxy_launcher', '')
+    bnet_launcher = os.environ.get('bnet_launcher', '')
+    amazon_launcher = os.environ.get('amazon_launcher', '')
+    itchio_launcher = os.environ.get('itchio_launcher', '')
+    legacy_launcher = os.environ.get('legacy_launcher', '')
+    vkplay_launcher = os.environ.get('vkplay_launcher', '')
+    hoyoplay_launcher = os.environ.get('hoyoplay_launcher', '')
+    gamejolt_launcher = os.environ.get('gamejolt_launcher', '')
+    minecraft_launcher = os.environ.get('minecraft_launcher', '')
+    indie_launcher = os.environ.get('indie_launcher', '')
+    stove_launcher = os.environ.get('stove_launcher', '')
+    humble_launcher = os.environ.get('humble_launcher', '')
+    gryphlink_launcher = os.environ.get('gryphlink_launcher', '')
+
+    #Streaming
+    chromedirectory = os.environ.get('chromedirectory')
+    names_str = os.environ.get("custom_website_names_str", "")
+    websites_str = os.environ.get("custom_websites_str", "")
+    custom_names = [n.strip() for n in names_str.split(",") if n.strip()]
+    custom_websites = [w.strip() for w in websites_str.split(",") if w.strip()]
+    base_launch_options = os.environ.get("customchromelaunchoptions")
+
+# Reload env_vars only when NonSteamLaunchers.sh (or the scanner itself) changed the file
+def reload_env_vars_if_changed():
+    try:
+        if os.stat(env_vars_path).st_mtime_ns == env_vars_mtime:
+            return False
+    except FileNotFoundError:
+        return False
+    print("env_vars changed. Reloading variables.")
+    load_env_vars()
+    return True
 
-for line in lines:
-    if line.startswith('export '):
-        line = line[7:]  # Remove 'export '
-
-    # Parse the name and value
-    if '=' in line:
-        name, value = line.strip().split('=', 1)
-        os.environ[name] = value
-
-        # Track separate_appids if explicitly set to false
-        if name == 'separate_appids' and value.strip().lower() == 'false':
-            separate_appids = value.strip()
-
-
-
-
-
-# Variables from NonSteamLaunchers.sh
-steamid3 = os.environ['steamid3']
-logged_in_home = os.environ['logged_in_home']
-compat_tool_name = os.environ['compat_tool_name']
-#Scanner Variables
-epic_games_launcher = os.environ.get('epic_games_launcher', '')
-ubisoft_connect_launcher = os.environ.get('ubisoft_connect_launcher', '')
-ea_app_launcher = os.environ.get('ea_app_launcher', '')
-gog_galaxy_launcher = os.environ.get('gog_galaxy_launcher', '')
-bnet_launcher = os.environ.get('bnet_launcher', '')
-amazon_launcher = os.environ.get('amazon_launcher', '')
-itchio_launcher = os.environ.get('itchio_launcher', '')
-legacy_launcher = os.environ.get('legacy_launcher', '')
-vkplay_launcher = os.environ.get('vkplay_launcher', '')
-hoyoplay_launcher = os.environ.get('hoyoplay_launcher', '')
-gamejolt_launcher = os.environ.get('gamejolt_launcher', '')
-minecraft_launcher = os.environ.get('minecraft_launcher', '')
-indie_launcher = os.environ.get('indie_launcher', '')
-stove_launcher = os.environ.get('stove_launcher', '')
-humble_launcher = os.environ.get('humble_launcher', '')
-gryphlink_launcher = os.environ.get('gryphlink_launcher', '')
+load_env_vars()
 
 
 #Variables of the Launchers
@@ -145,15 +198,6 @@ stoveshortcutdirectory = os.environ.get('stoveshortcutdirectory')
 bigfishshortcutdirectory = os.environ.get('bigfishshortcutdirectory')
 
 repaireaappshortcutdirectory = os.environ.get('repaireaappshortcutdirectory')
-#Streaming
-chromedirectory = os.environ.get('chromedirectory')
-names_str = os.environ.get("custom_website_names_str", "")
-websites_str = os.environ.get("custom_websites_str", "")
-custom_names = [n.strip() for n in names_str.split(",") if n.strip()]
-custom_websites = [w.strip() for w in websites_str.split(",") if w.strip()]
-base_launch_options = os.environ.get("customchromelaunchoptions")
-
-
 
 
 
@@ -166,6 +210,254 @@ print(sys.path)
 
 # Now import your modules after the single insert
 import vdf
+import urllib3
+
+
+
+#HTTP connection pool
+# One PoolManager for every HTTP request the scanner makes, so calls to the same host reuse kept-alive connections.
+# block=True turns HTTP_CONNECTIONS_PER_HOST into a hard limit on concurrent requests per host
+HTTP_CONNECTIONS_PER_HOST = 8
+HTTP_TIMEOUT = urllib3.Timeout(connect=10, read=30)
+http_pool = urllib3.PoolManager(
+    num_pools=20,
+    maxsize=HTTP_CONNECTIONS_PER_HOST,
+    block=True,
+    timeout=HTTP_TIMEOUT,
+    # Retries are done by http_request, which knows about rate limits. urllib3 only follows redirects
+    retries=urllib3.Retry(total=None, connect=0, read=0, status=0, other=0, redirect=5, raise_on_status=False),
+    ca_certs=certifi.where(),
+)
+
+#Request scheduling
+# Every host gets a token bucket instead of fixed sleeps between requests. 429/503 answers with Retry-After
+# pause the whole host, other failures are retried with jittered exponential backoff
+HTTP_MAX_CONCURRENCY = 16
+HTTP_MAX_ATTEMPTS = 4
+HTTP_BACKOFF_BASE = 0.5
+HTTP_BACKOFF_CAP = 30
+# Longer Retry-After waits fail the request instead of stalling the scan
+HTTP_MAX_RETRY_AFTER = 120
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Requests per second and burst size
+HOST_RATE_LIMITS = {
+    "store.steampowered.com": (1, 2),
+    "api.steampowered.com": (1, 2),
+    "steamdeckrepo.com": (1, 2),
+    "nonsteamlaunchers.onrender.com": (8, 16),
+}
+DEFAULT_HOST_RATE_LIMIT = (20, 40)
+
+http_slots = threading.BoundedSemaphore(HTTP_MAX_CONCURRENCY)
+host_buckets = {}
+host_buckets_lock = threading.Lock()
+
+class HostBucket:
+    def __init__(self, host, rate, burst):
+        self.host = host
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                wait = self.blocked_until - now
+                if wait > HTTP_MAX_RETRY_AFTER:
+                    raise Exception(f"{self.host} is rate limited for another {int(wait)}s")
+                if wait <= 0:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def block(self, seconds):
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+def host_bucket(url):
+    host = urllib3.util.parse_url(url).host or ""
+    with host_buckets_lock:
+        bucket = host_buckets.get(host)
+        if bucket is None:
+            rate, burst = HOST_RATE_LIMITS.get(host, DEFAULT_HOST_RATE_LIMIT)
+            bucket = host_buckets[host] = HostBucket(host, rate, burst)
+        return bucket
+
+def backoff_delay(attempt, base=HTTP_BACKOFF_BASE, cap=HTTP_BACKOFF_CAP):
+    delay = min(cap, base * 2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+def parse_retry_after(value):
+    if not value:
+        return None
+    try:
+        return max(0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0, (email.utils.parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+def http_request(method, url, headers=None, timeout=None, attempts=HTTP_MAX_ATTEMPTS, preload_content=True):
+    bucket = host_bucket(url)
+    for attempt in range(attempts):
+        last_attempt = attempt == attempts - 1
+        bucket.acquire()
+        try:
+            with http_slots:
+                response = http_pool.request(method, url, headers=headers, timeout=timeout or HTTP_TIMEOUT,
+                                             preload_content=preload_content)
+        except urllib3.exceptions.HTTPError as e:
+            if last_attempt:
+                raise
+            delay = backoff_delay(attempt)
+            print(f"Request to {url} failed ({e}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+            continue
+
+        if response.status not in HTTP_RETRY_STATUSES or last_attempt:
+            return response
+        if not preload_content:
+            response.drain_conn()
+            response.release_conn()
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            # Holds back every request to this host, not only this one
+            bucket.block(retry_after)
+            print(f"{bucket.host} answered {response.status}, waiting {retry_after:.0f}s as asked")
+        else:
+            delay = backoff_delay(attempt)
+            print(f"{bucket.host} answered {response.status}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+#End of Request scheduling
+
+def http_get_json(url, headers=None, timeout=None):
+    response = http_request("GET", url, headers, timeout)
+    if response.status != 200:
+        raise Exception(f"Failed to fetch {url}, status code {response.status}")
+    return json.loads(response.data)
+#End of HTTP connection pool
+
+
+
+#Downloads
+# Files are written to <name>.part and only renamed into place once their size matches what the server announced,
+# so Steam never sees a truncated file. A .part left by an interrupted run is resumed with a Range request
+DOWNLOAD_TIMEOUT = urllib3.Timeout(connect=10, read=60)
+DOWNLOAD_MIN_BUFFER = 64 * 1024
+DOWNLOAD_MAX_BUFFER = 1024 * 1024
+
+def content_range(value):
+    # "bytes 100-199/1000" -> (100, 1000), the total may be "*"
+    match = re.match(r'bytes (\d+)-\d+/(\d+|\*)', value or "")
+    if not match:
+        match = re.match(r'bytes \*/(\d+)', value or "")
+        return (None, int(match.group(1))) if match else (None, None)
+    total = match.group(2)
+    return int(match.group(1)), int(total) if total != "*" else None
+
+def discard_partial_download(part_path):
+    for path in (part_path, part_path + ".json"):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+# Returns the HTTP status, 200 once the file is complete at file_path
+def download_file(url, file_path, headers=None, timeout=DOWNLOAD_TIMEOUT):
+    part_path = file_path + ".part"
+    meta_path = part_path + ".json"
+    request_headers = dict(headers or {})
+    # Sizes are checked against the bytes on the wire
+    request_headers["Accept-Encoding"] = "identity"
+
+    offset = 0
+    try:
+        meta = load_json_file(meta_path)
+        offset = os.path.getsize(part_path)
+    except (OSError, ValueError):
+        meta = None
+    validator = meta and meta.get("url") == url and (meta.get("etag") or meta.get("last_modified"))
+    if offset and validator:
+        request_headers["Range"] = f"bytes={offset}-"
+        # Makes the server send the whole file instead if it changed since the .part was started
+        request_headers["If-Range"] = validator
+    else:
+        offset = 0
+
+    response = http_request("GET", url, headers=request_headers, timeout=timeout, preload_content=False)
+    streaming = False
+    try:
+        if response.status == 416 and offset:
+            total = content_range(response.headers.get("Content-Range"))[1]
+            if total == offset:
+                os.replace(part_path, file_path)
+                discard_partial_download(part_path)
+                return 200
+            print(f"Partial download of {url} is no longer valid, starting over")
+            discard_partial_download(part_path)
+            return download_file(url, file_path, headers, timeout)
+
+        if response.status == 206 and offset:
+            start, total = content_range(response.headers.get("Content-Range"))
+            if start != offset:
+                discard_partial_download(part_path)
+                return download_file(url, file_path, headers, timeout)
+            mode = 'ab'
+            print(f"Resuming download of {url} at {offset} bytes")
+        elif response.status == 200:
+            offset = 0
+            mode = 'wb'
+            length = response.headers.get("Content-Length")
+            total = int(length) if length and length.isdigit() else None
+        else:
+            return response.status
+
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(meta_path, 'w') as f:
+            json.dump({"url": url, "etag": response.headers.get("ETag"),
+                       "last_modified": response.headers.get("Last-Modified")}, f)
+
+        streaming = True
+        with open(part_path, mode) as f:
+            buffer_size = DOWNLOAD_MIN_BUFFER
+            while True:
+                started = time.monotonic()
+                chunk = response.read(buffer_size, decode_content=False)
+                if not chunk:
+                    break
+                f.write(chunk)
+                # Bigger reads while the connection keeps up
+                if len(chunk) == buffer_size and buffer_size < DOWNLOAD_MAX_BUFFER and time.monotonic() - started < 0.05:
+                    buffer_size *= 2
+            f.flush()
+            os.fsync(f.fileno())
+        streaming = False
+
+        size = os.path.getsize(part_path)
+        if total is not None and size != total:
+            raise Exception(f"Incomplete download of {url}: {size} of {total} bytes")
+        os.replace(part_path, file_path)
+        discard_partial_download(part_path)
+        return 200
+    finally:
+        if streaming:
+            # Don't hand a half read connection back to the pool
+            response.close()
+        else:
+            response.drain_conn()
+        response.release_conn()
+#End of Downloads
 
 
 
@@ -179,7 +471,7 @@ service_content = f"""
 Description=NSL Game Scanner
 
 [Service]
-ExecStart=/usr/bin/python3 '{logged_in_home}/.config/systemd/user/NSLGameScanner.py'
+ExecStart=/usr/bin/python3 '{logged_in_home}/.config/systemd/user/NSLGameScanner.py' --daemon
 Restart=always
 RestartSec=20
 StartLimitBurst=40
@@ -189,30 +481,41 @@ StartLimitInterval=240
 WantedBy=default.target
 """
 
-# Check if the service file already exists
-if not os.path.exists(service_path):
-    # Create the service file
-    with open(service_path, 'w') as f:
-        f.write(service_content)
+def install_service():
+    # Check if the service file already exists
+    if not os.path.exists(service_path):
+        # Create the service file
+        with open(service_path, 'w') as f:
+            f.write(service_content)
 
-    print("Service file created.")
+        print("Service file created.")
+    else:
+        # Older installs restarted a one-shot scan every 20 seconds, move them to the resident daemon
+        with open(service_path, 'r') as f:
+            current_content = f.read()
+
+        if current_content != service_content:
+            with open(service_path, 'w') as f:
+                f.write(service_content)
+            subprocess.run(['systemctl', '--user', 'daemon-reload'])
+            print("Service file updated.")
 
 
-# Check if the service is already running
-result = subprocess.run(['systemctl', '--user', 'is-active', 'nslgamescanner.service'], stdout=subprocess.PIPE)
-if result.stdout.decode('utf-8').strip() != 'active':
-    # Reload the systemd manager configuration
-    subprocess.run(['systemctl', '--user', 'daemon-reload'])
+    # Check if the service is already running
+    result = subprocess.run(['systemctl', '--user', 'is-active', 'nslgamescanner.service'], stdout=subprocess.PIPE)
+    if result.stdout.decode('utf-8').strip() != 'active':
+        # Reload the systemd manager configuration
+        subprocess.run(['systemctl', '--user', 'daemon-reload'])
 
-    # Enable the service to start on boot
-    subprocess.run(['systemctl', '--user', 'enable', 'nslgamescanner.service'])
+        # Enable the service to start on boot
+        subprocess.run(['systemctl', '--user', 'enable', 'nslgamescanner.service'])
 
-    # Start the service immediately
-    #subprocess.run(['systemctl', '--user', 'start', 'nslgamescanner.service'])
+        # Start the service immediately
+        #subprocess.run(['systemctl', '--user', 'start', 'nslgamescanner.service'])
 
-    print("Service started.")
-else:
-    print("Service is already running.")
+        print("Service started.")
+    else:
+        print("Service is already running.")
 
 
 
@@ -229,8 +532,6 @@ def single_instance():
         print("Another instance is already running. Exiting.")
         sys.exit(0)
 
-single_instance()
-
 
 #Code
 def get_steam_shortcut_id(exe_path, display_name):
@@ -245,8 +546,120 @@ def get_unsigned_shortcut_id(signed_shortcut_id):
     # print(f"Unsigned ID: {unsigned.value}")
     return unsigned.value
 
-# Initialize an empty dictionary to serve as the cache
-api_cache = {}
+#API Cache
+# SteamGridDB and Steam store lookups survive restarts in an SQLite file. Lookups that found nothing are kept
+# for a shorter time, and the least recently used rows go once the cache holds API_CACHE_MAX_ENTRIES. Expired and
+# surplus rows are removed once per scan cycle, by report()
+API_CACHE_PATH = f"{logged_in_home}/.config/systemd/user/apicache.db"
+API_CACHE_MAX_ENTRIES = 20000
+API_CACHE_TTL = {
+    "sgdb_search": 7 * 86400,
+    "sgdb_artwork": 3 * 86400,
+    "steam_storesearch": 7 * 86400,
+    "steam_cdn_asset": 30 * 86400,
+}
+API_CACHE_NEGATIVE_TTL = 6 * 3600
+
+class ApiCache:
+    MISS = object()
+
+    def __init__(self, path, max_entries):
+        self.path = path
+        self.max_entries = max_entries
+        self.conn = None
+        self.lock = threading.Lock()
+        # Only filled while the cache file is unusable, bounded like the file
+        self.memory = OrderedDict()
+        self.counters = {"hits": 0, "negative_hits": 0, "misses": 0}
+
+    def connect(self):
+        if self.conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self.conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    value TEXT,
+                    expires REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )""")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        return self.conn
+
+    @staticmethod
+    def make_key(endpoint, params):
+        return endpoint + ":" + json.dumps(params, sort_keys=True)
+
+    def get(self, endpoint, params):
+        key = self.make_key(endpoint, params)
+        now = time.time()
+        with self.lock:
+            try:
+                conn = self.connect()
+                row = conn.execute("SELECT value, expires FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None and row[1] > now:
+                    conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+                    value = json.loads(row[0]) if row[0] is not None else None
+                    self.counters["hits" if value is not None else "negative_hits"] += 1
+                    return value
+            except (sqlite3.Error, OSError) as e:
+                # A broken cache file must not stop the scan, fall back to memory for this run
+                print(f"API cache unavailable: {e}")
+                if key in self.memory:
+                    self.memory.move_to_end(key)
+                    self.counters["hits"] += 1
+                    return self.memory[key]
+            self.counters["misses"] += 1
+            return self.MISS
+
+    # None is stored as a negative result
+    def put(self, endpoint, params, value):
+        key = self.make_key(endpoint, params)
+        now = time.time()
+        ttl = API_CACHE_TTL.get(endpoint, 86400) if value is not None else API_CACHE_NEGATIVE_TTL
+        with self.lock:
+            try:
+                conn = self.connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, endpoint, value, expires, last_used) VALUES (?, ?, ?, ?, ?)",
+                    (key, endpoint, json.dumps(value) if value is not None else None, now + ttl, now))
+            except (sqlite3.Error, OSError) as e:
+                print(f"API cache unavailable: {e}")
+                self.memory[key] = value
+                self.memory.move_to_end(key)
+                while len(self.memory) > self.max_entries:
+                    self.memory.popitem(last=False)
+
+    def evict(self, conn, now):
+        conn.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+        conn.execute(
+            "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,))
+
+    def report(self):
+        with self.lock:
+            counters = dict(self.counters)
+            for name in self.counters:
+                self.counters[name] = 0
+            if self.conn is not None:
+                try:
+                    self.evict(self.conn, time.time())
+                except (sqlite3.Error, OSError) as e:
+                    print(f"API cache unavailable: {e}")
+        if any(counters.values()):
+            print(f"API cache: {counters['hits']} hits, {counters['negative_hits']} cached misses, {counters['misses']} lookups")
+
+api_cache = ApiCache(API_CACHE_PATH, API_CACHE_MAX_ENTRIES)
+
+# fetch() returns None when the API has nothing for these params. Exceptions are not cached
+def cached_api_call(endpoint, params, fetch):
+    value = api_cache.get(endpoint, params)
+    if value is ApiCache.MISS:
+        value = fetch()
+        api_cache.put(endpoint, params, value)
+    return value
+#End of API Cache
 
 #API KEYS FOR NONSTEAMLAUNCHER USE ONLY
 BASE_URL = 'https://nonsteamlaunchers.onrender.com/api'
@@ -257,42 +670,295 @@ new_shortcuts_added = False
 shortcuts_updated = False
 shortcut_id = None  # Initialize shortcut_id
 
-gridp64 = ""
-grid64 = ""
-logo64 = ""
-hero64 = ""
+
+#Binary VDF
+# Same input, output and errors as vdf.binary_loads/binary_dumps. The vendored parser reads one byte at a time from a
+# file object, this one scans the whole buffer with find() and unpack_from(). The buffer is also decoded once as latin-1,
+# which maps every byte to one character, so ASCII strings are plain str slices and only the rest are decoded as UTF-8
+VDF_INT32 = struct.Struct('<i')
+VDF_UINT64 = struct.Struct('<Q')
+VDF_INT64 = struct.Struct('<q')
+VDF_FLOAT32 = struct.Struct('<f')
+
+def vdf_binary_loads(b, mapper=dict, merge_duplicate_keys=True, alt_format=False, raise_on_remaining=True):
+    if not isinstance(b, (bytes, bytearray, memoryview)):
+        raise TypeError("Expected s to be bytes, got %s" % type(b))
+    data = bytes(b)
+    text = data.decode('latin-1')
+    find = text.find
+    unpack_int32 = VDF_INT32.unpack_from
+    end_type = 0x0B if alt_format else 0x08
+    length = len(data)
+
+    stack = [mapper()]
+    current = stack[0]
+    pos = 0
+    while pos < length:
+        t = data[pos]
+        pos += 1
+        if t == end_type:
+            if len(stack) > 1:
+                stack.pop()
+                current = stack[-1]
+                continue
+            break
+
+        end = find('\x00', pos)
+        if end == -1:
+            raise SyntaxError("Unterminated cstring (offset: %d)" % pos)
+        key = text[pos:end]
+        if not key.isascii():
+            key = data[pos:end].decode('utf-8', 'replace')
+        pos = end + 1
+
+        if t == 0x01:
+            end = find('\x00', pos)
+            if end == -1:
+                raise SyntaxError("Unterminated cstring (offset: %d)" % pos)
+            value = text[pos:end]
+            if not value.isascii():
+                value = data[pos:end].decode('utf-8', 'replace')
+            current[key] = value
+            pos = end + 1
+        elif t == 0x02:
+            current[key] = unpack_int32(data, pos)[0]
+            pos += 4
+        elif t == 0x00:
+            if merge_duplicate_keys and key in current:
+                nested = current[key]
+            else:
+                nested = current[key] = mapper()
+            stack.append(nested)
+            current = nested
+        elif t == 0x04:
+            current[key] = vdf.POINTER(unpack_int32(data, pos)[0])
+            pos += 4
+        elif t == 0x06:
+            current[key] = vdf.COLOR(unpack_int32(data, pos)[0])
+            pos += 4
+        elif t == 0x07:
+            current[key] = vdf.UINT_64(VDF_UINT64.unpack_from(data, pos)[0])
+            pos += 8
+        elif t == 0x0A:
+            current[key] = vdf.INT_64(VDF_INT64.unpack_from(data, pos)[0])
+            pos += 8
+        elif t == 0x03:
+            current[key] = VDF_FLOAT32.unpack_from(data, pos)[0]
+            pos += 4
+        elif t == 0x05:
+            end = find('\x00\x00', pos)
+            if end == -1:
+                raise SyntaxError("Unterminated cstring (offset: %d)" % pos)
+            end += (end - pos) % 2
+            current[key] = data[pos:end].decode('utf-16')
+            pos = end + 2
+        else:
+            raise SyntaxError("Unknown data type at offset %d: %s" % (pos - 1, repr(bytes([t]))))
+
+    if len(stack) != 1:
+        raise SyntaxError("Reached EOF, but Binary VDF is incomplete")
+    if raise_on_remaining and pos < length:
+        raise SyntaxError("Binary VDF ended at offset %d, but there is more data remaining" % (pos - 1))
+    return stack[0]
+
+def vdf_binary_dumps(obj, alt_format=False):
+    if not isinstance(obj, Mapping):
+        raise TypeError("Expected obj to be type of Mapping")
+    if not obj:
+        return b''
+    end = b'\x0b' if alt_format else b'\x08'
+    parts = []
+    append = parts.append
+    pack_int32 = VDF_INT32.pack
+    # Every shortcut repeats the same keys
+    encoded_keys = {}
+
+    def dump(mapping):
+        for key, value in mapping.items():
+            k = encoded_keys.get(key)
+            if k is None:
+                if not isinstance(key, str):
+                    raise TypeError("dict keys must be of type str, got %s" % type(key))
+                k = encoded_keys[key] = key.encode('utf-8') + b'\x00'
+
+            # Exact types first, the vdf int subclasses and other mappings take the slower checks below
+            value_type = type(value)
+            if value_type is str:
+                try:
+                    append(b'\x01' + k + value.encode('utf-8') + b'\x00')
+                except UnicodeEncodeError:
+                    append(b'\x05' + k + value.encode('utf-16') + b'\x00\x00')
+            elif value_type is int:
+                append(b'\x02' + k + pack_int32(value))
+            elif value_type is dict:
+                append(b'\x00' + k)
+                dump(value)
+            elif isinstance(value, Mapping):
+                append(b'\x00' + k)
+                dump(value)
+            elif isinstance(value, vdf.UINT_64):
+                append(b'\x07' + k + VDF_UINT64.pack(value))
+            elif isinstance(value, vdf.INT_64):
+                append(b'\x0a' + k + VDF_INT64.pack(value))
+            elif isinstance(value, str):
+                try:
+                    append(b'\x01' + k + value.encode('utf-8') + b'\x00')
+                except UnicodeEncodeError:
+                    append(b'\x05' + k + value.encode('utf-16') + b'\x00\x00')
+            elif isinstance(value, float):
+                append(b'\x03' + k + VDF_FLOAT32.pack(value))
+            elif isinstance(value, vdf.COLOR):
+                append(b'\x06' + k + pack_int32(value))
+            elif isinstance(value, vdf.POINTER):
+                append(b'\x04' + k + pack_int32(value))
+            elif isinstance(value, int):
+                append(b'\x02' + k + pack_int32(value))
+            else:
+                raise TypeError("Unsupported type: %s" % type(value))
+        append(end)
+
+    dump(obj)
+    return b''.join(parts)
+
+def synthetic_shortcuts(count):
+    entries = {}
+    for i in range(count):
+        entries[str(i)] = {
+            'appid': -1000000 - i,
+            'AppName': f"Benchmark Game {i}",
+            'Exe': f'"/home/deck/.local/share/Steam/steamapps/compatdata/NonSteamLaunchers/pfx/drive_c/Games/{i}/game.exe"',
+            'StartDir': f'"/home/deck/.local/share/Steam/steamapps/compatdata/NonSteamLaunchers/pfx/drive_c/Games/{i}/"',
+            'icon': f"/home/deck/.steam/root/userdata/1/config/grid/{i}-icon.ico",
+            'ShortcutPath': "",
+            'LaunchOptions': f'STEAM_COMPAT_DATA_PATH="/home/deck/.local/share/Steam/steamapps/compatdata/NonSteamLaunchers/" %command% -game {i}',
+            'IsHidden': 0,
+            'AllowDesktopConfig': 1,
+            'AllowOverlay': 1,
+            'OpenVR': 0,
+            'Devkit': 0,
+            'DevkitGameID': "",
+            'DevkitOverrideAppID': 0,
+            'LastPlayTime': 1700000000 + i,
+            'FlatpakAppID': "",
+            'tags': {'0': "NonSteamLaunchers", '1': "Favorite"},
+        }
+    return {'shortcuts': entries}
+
+def run_vdf_benchmark(counts=(1000, 5000, 10000), rounds=3):
+    for count in counts:
+        shortcuts = synthetic_shortcuts(count)
+        data = vdf.binary_dumps(shortcuts)
+        assert vdf_binary_dumps(shortcuts) == data
+        assert vdf_binary_loads(data) == vdf.binary_loads(data)
+        print(f"shortcuts.vdf with {count} entries ({len(data) // 1024} KB), {rounds} rounds")
+
+        for name, func, arg in (
+            ("vdf.binary_loads", vdf.binary_loads, data),
+            ("vdf_binary_loads", vdf_binary_loads, data),
+            ("vdf.binary_dumps", vdf.binary_dumps, shortcuts),
+            ("vdf_binary_dumps", vdf_binary_dumps, shortcuts),
+        ):
+            started = time.perf_counter()
+            for _ in range(rounds):
+                func(arg)
+            print(f"  {name}: {(time.perf_counter() - started) / rounds * 1000:.1f} ms")
+#End of Binary VDF
+
+
+
+#Shortcuts Writer
+# The file is written next to the old one, fsynced and renamed over it, so an interrupted write leaves the previous
+# shortcuts.vdf intact
+shortcuts_write_lock = threading.Lock()
+
+def write_shortcuts_atomically(path, shortcuts):
+    data = vdf_binary_dumps(shortcuts)
+    with shortcuts_write_lock:
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as file:
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+            os.chmod(tmp_path, 0o755)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        try:
+            dir_fd = os.open(os.path.dirname(path), os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
+#End of Shortcuts Writer
 
 
 def create_empty_shortcuts():
     return {'shortcuts': {}}
 
-def write_shortcuts_to_file(shortcuts_file, shortcuts):
-    with open(shortcuts_file, 'wb') as file:
-        file.write(vdf.binary_dumps(shortcuts))
-    os.chmod(shortcuts_file, 0o755)
-
 # Define the path to the shortcuts file
 shortcuts_file = f"{logged_in_home}/.steam/root/userdata/{steamid3}/config/shortcuts.vdf"
 
-# Check if the file exists
-if os.path.exists(shortcuts_file):
-    # If the file is not executable, write the shortcuts dictionary and make it executable
-    if not os.access(shortcuts_file, os.X_OK):
-        print("The file is not executable. Writing an empty shortcuts dictionary and making it executable.")
-        shortcuts = create_empty_shortcuts()
-        write_shortcuts_to_file(shortcuts_file, shortcuts)
+# Steam owns shortcuts.vdf while it runs and new shortcuts go through its API, so this is not called after every scan
+def write_shortcuts_to_file(shortcuts_file, shortcuts):
+    write_shortcuts_atomically(shortcuts_file, shortcuts)
+shortcuts = None
+shortcuts_mtime = None
+
+def load_shortcuts():
+    global shortcuts, shortcuts_mtime
+
+    # Check if the file exists
+    if os.path.exists(shortcuts_file):
+        # If the file is not executable, write the shortcuts dictionary and make it executable
+        if not os.access(shortcuts_file, os.X_OK):
+            print("The file is not executable. Writing an empty shortcuts dictionary and making it executable.")
+            shortcuts = create_empty_shortcuts()
+            write_shortcuts_to_file(shortcuts_file, shortcuts)
+        else:
+            # Load the existing shortcuts
+            with open(shortcuts_file, 'rb') as file:
+                try:
+                    shortcuts = vdf_binary_loads(file.read())
+                except (SyntaxError, struct.error) as e:
+                    print(f"Error reading file: {e}. The file might be corrupted or unreadable.")
+                    print("Exiting the program. Please check the shortcuts.vdf file.")
+                    sys.exit(1)
+        shortcuts_mtime = os.stat(shortcuts_file).st_mtime_ns
+        index_shortcuts()
     else:
-        # Load the existing shortcuts
+        print("The shortcuts.vdf file does not exist.")
+        sys.exit(1)
+
+# Steam rewrites shortcuts.vdf after it applies the shortcuts we hand it, pick that up between scans
+def reload_shortcuts_if_changed():
+    global shortcuts, shortcuts_mtime
+    try:
+        mtime = os.stat(shortcuts_file).st_mtime_ns
+    except FileNotFoundError:
+        print("The shortcuts.vdf file does not exist. Keeping the loaded shortcuts.")
+        return False
+
+    if mtime == shortcuts_mtime:
+        return False
+
+    try:
         with open(shortcuts_file, 'rb') as file:
-            try:
-                shortcuts = vdf.binary_loads(file.read())
-            except vdf.VDFError as e:
-                print(f"Error reading file: {e}. The file might be corrupted or unreadable.")
-                print("Exiting the program. Please check the shortcuts.vdf file.")
-                sys.exit(1)
-else:
-    print("The shortcuts.vdf file does not exist.")
-    sys.exit(1)
+            shortcuts = vdf_binary_loads(file.read())
+        shortcuts_mtime = mtime
+        index_shortcuts()
+        print("shortcuts.vdf changed. Reloaded shortcuts.")
+        return True
+    except (SyntaxError, struct.error) as e:
+        print(f"Error reading file: {e}. Keeping the loaded shortcuts.")
+        return False
 
 
 
@@ -300,21 +966,16 @@ else:
 
 
 
+# Returns the paths of the downloaded artwork in the grid folder
 def get_sgdb_art(game_id, app_id):
-    global grid64
-    global gridp64
-    global logo64
-    global hero64
-    print(f"Downloading icons artwork...")
-    download_artwork(game_id, "icons", app_id)
-    print(f"Downloading logos artwork...")
-    logo64 = download_artwork(game_id, "logos", app_id)
-    print(f"Downloading heroes artwork...")
-    hero64 = download_artwork(game_id, "heroes", app_id)
-    print("Downloading grids artwork of size 600x900...")
-    gridp64 = download_artwork(game_id, "grids", app_id, "600x900")
-    print("Downloading grids artwork of size 920x430...")
-    grid64 = download_artwork(game_id, "grids", app_id, "920x430")
+    print(f"Downloading icons, logos, heroes and grids artwork...")
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        pool.submit(download_artwork, game_id, "icons", app_id)
+        logo = pool.submit(download_artwork, game_id, "logos", app_id)
+        hero = pool.submit(download_artwork, game_id, "heroes", app_id)
+        gridp = pool.submit(download_artwork, game_id, "grids", app_id, "600x900")
+        grid = pool.submit(download_artwork, game_id, "grids", app_id, "920x430")
+    return {'WideGrid': grid.result(), 'Grid': gridp.result(), 'Hero': hero.result(), 'Logo': logo.result()}
 
 
 def download_artwork(game_id, art_type, shortcut_id, dimensions=None):
@@ -322,7 +983,6 @@ def download_artwork(game_id, art_type, shortcut_id, dimensions=None):
         print("Invalid game ID. Skipping download.")
         return
 
-    cache_key = (game_id, art_type, dimensions)
     if dimensions is not None:
         filename = get_file_name(art_type, shortcut_id, dimensions)
     else:
@@ -340,29 +1000,24 @@ def download_artwork(game_id, art_type, shortcut_id, dimensions=None):
     # Check if the file already exists
     if file_exists_with_any_ext(file_path):
         print(f"Artwork for {art_type} already exists. Skipping download.")
-        with open(file_path, 'rb') as image_file:
-            return b64encode(image_file.read()).decode('utf-8')
+        return file_path
 
     # If the artwork is not found locally, proceed with the download process
-    if cache_key in api_cache:
-        data = api_cache[cache_key]
-    else:
-        try:
-            print(f"Game ID: {game_id}")
-            url = f"{BASE_URL}/{art_type}/game/{game_id}"
-            if dimensions:
-                url += f"?dimensions={dimensions}"
-            print(f"Request URL: {url}")
-
-            with urllib.request.urlopen(url) as response:
-                if response.status != 200:
-                    raise Exception(f"Failed to fetch data, status code {response.status}")
-                data = json.load(response)
-            api_cache[cache_key] = data
-        except (urllib.error.URLError, Exception) as e:
-            print(f"Error making API call: {e}")
-            api_cache[cache_key] = None
-            return
+    def fetch():
+        print(f"Game ID: {game_id}")
+        url = f"{BASE_URL}/{art_type}/game/{game_id}"
+        if dimensions:
+            url += f"?dimensions={dimensions}"
+        print(f"Request URL: {url}")
+
+        data = http_get_json(url)
+        return data if data and data.get('data') else None
+
+    try:
+        data = cached_api_call("sgdb_artwork", [game_id, art_type, dimensions], fetch)
+    except (urllib.error.URLError, Exception) as e:
+        print(f"Error making API call: {e}")
+        return
 
     if not data or 'data' not in data:
         print(f"No data available for {game_id}. Skipping download.")
@@ -372,57 +1027,55 @@ def download_artwork(game_id, art_type, shortcut_id, dimensions=None):
     for artwork in data['data']:
         image_url = artwork['thumb']
         print(f"Downloading image from: {image_url}")
+        try:
+            status = download_file(image_url, file_path, headers={
+                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64)",
+                "Referer": "https://www.steamgriddb.com/",
+            })
+            if status != 200:
+                print(f"Error downloading image: status code {status}")
+                continue
+            note_grid_file(file_path)
+            print(f"Downloaded and saved {art_type} to: {file_path}")
 
-        # Try both .png and .ico formats
-        for ext in ['png', 'ico']:
-            try:
-                alt_file_path = file_path.replace('.png', f'.{ext}')
-                # Use urllib to download the image
-                req = urllib.request.Request(image_url)
-                req.add_header("User-Agent", "Mozilla/5.0 (X11; Linux x86_64)")
-                req.add_header("Referer", "https://www.steamgriddb.com/")
+            # Steam gets the file (or its base64) later, when the shortcut is committed
+            return file_path
+        except Exception as e:
+            print(f"Error downloading image: {e}")
 
-                with urllib.request.urlopen(req) as response:
-                    if response.status == 200:
-                        image_data = response.read()
+    print(f"Artwork download failed for {game_id}. No image could be downloaded.")
+    return None
 
 
-                        # Save the image data to local file
-                        with open(alt_file_path, 'wb') as file:
-                            file.write(image_data)
-                        print(f"Downloaded and saved {art_type} to: {alt_file_path}")
 
-                        # Return base64 encoded image data
-                        return b64encode(image_data).decode('utf-8')
-            except (urllib.error.URLError, Exception) as e:
-                print(f"Error downloading image in {ext}: {e}")
+# Both the SteamGridDB game id and the Steam store app id come from this search
+def search_sgdb(game_name):
+    def fetch():
+        encoded_game_name = urllib.parse.quote(game_name)
+        url = f"{BASE_URL}/search/{encoded_game_name}"
+        print(f"Encoded game name: {encoded_game_name}")
+        print(f"Request URL: {url}")
 
-    print(f"Artwork download failed for {game_id}. Neither PNG nor ICO was available.")
-    return None
+        response = http_request("GET", url)
+        # Manually check if the status code is 200
+        if response.status != 200:
+            raise Exception(f"Unexpected status code {response.status}")
+        data = json.loads(response.data)
+        return data if data.get('data') else None
 
+    return cached_api_call("sgdb_search", [game_name], fetch)
 
 
 def get_game_id(game_name):
     print(f"Searching for game ID for: {game_name}")
     try:
-        encoded_game_name = urllib.parse.quote(game_name)
-        url = f"{BASE_URL}/search/{encoded_game_name}"
-        print(f"Encoded game name: {encoded_game_name}")
-        print(f"Request URL: {url}")
-
-        # Open the URL and get the response
-        with urllib.request.urlopen(url) as response:
-            # Manually check if the status code is 200
-            if response.status == 200:
-                data = json.load(response)
-                if data.get('data'):
-                    game_id = data['data'][0]['id']
-                    print(f"Found game ID: {game_id}")
-                    return game_id
-                else:
-                    print(f"No game ID found for game name: {game_name}")
-            else:
-                print(f"Error: Unexpected status code {response.status}")
+        data = search_sgdb(game_name)
+        if data:
+            game_id = data['data'][0]['id']
+            print(f"Found game ID: {game_id}")
+            return game_id
+        else:
+            print(f"No game ID found for game name: {game_name}")
         return None
     except Exception as e:
         print(f"Error searching for game ID: {e}")
@@ -433,7 +1086,7 @@ def get_file_name(art_type, shortcut_id, dimensions=None):
     singular_art_type = art_type.rstrip('s')
     if art_type == 'icons':
         # Check for the existing .png file first
-        if os.path.exists(f"{logged_in_home}/.steam/root/userdata/{steamid3}/config/grid/{shortcut_id}-{singular_art_type}.png"):
+        if grid_file_exists(f"{logged_in_home}/.steam/root/userdata/{steamid3}/config/grid/{shortcut_id}-{singular_art_type}.png"):
             return f"{shortcut_id}-{singular_art_type}.png"
         # Fallback to .ico if .png doesn't exist
         else:
@@ -458,77 +1111,217 @@ def is_match(name1, name2):
 
 
 
-steam_applist_cache = None
+#Steam App Index
+# Resolves store app ids from a local copy of Steam's app list, so most games never need the storesearch API.
+# The snapshot is downloaded and refreshed weekly, a failed download is tried again after STEAM_APPLIST_RETRY.
+# Steam's GetAppList JSON, or a plain list of {appid, name}, can also be imported by saving it at STEAM_APPLIST_PATH
+STEAM_APPLIST_URL = "https://api.steampowered.com/ISteamApps/GetAppList/v2/"
+STEAM_APPLIST_PATH = f"{logged_in_home}/.config/systemd/user/steamapplist.json"
+STEAM_APPLIST_MAX_AGE = 7 * 86400
+STEAM_APPLIST_RETRY = 3600
+
+def normalize_name(name):
+    name = name.lower()
+    name = re.sub(r'[®™]', '', name)
+    name = re.sub(r'[-–—:]', ' ', name)
+    name = ' '.join(name.split())
+    return name
+
+def name_trigrams(name):
+    return {name[i:i + 3] for i in range(len(name) - 2)}
+
+class SteamAppIndex:
+    # The app list has no app types, a name shared by several apps (a game, its soundtrack, a remake) is left
+    # to the store search
+    AMBIGUOUS = -1
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.next_check = 0
+        self.snapshot_mtime = None
+        # names, appids, exact and trigrams of the loaded snapshot, replaced as a whole when it is reloaded
+        self.index = {"names": [], "appids": [], "exact": {}, "trigrams": None}
+
+    # Returns when the snapshot has to be checked again
+    def refresh_snapshot(self):
+        now = time.time()
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            mtime = None
+        if mtime is not None and now - mtime < STEAM_APPLIST_MAX_AGE:
+            return mtime + STEAM_APPLIST_MAX_AGE
+        try:
+            response = http_request("GET", STEAM_APPLIST_URL, timeout=urllib3.Timeout(connect=10, read=60))
+            if response.status != 200:
+                raise Exception(f"status code {response.status}")
+            json.loads(response.data)
+            with open(self.path + ".tmp", 'wb') as f:
+                f.write(response.data)
+            os.replace(self.path + ".tmp", self.path)
+            print(f"Downloaded the Steam app list to {self.path}")
+            return now + STEAM_APPLIST_MAX_AGE
+        except Exception as e:
+            # An old snapshot is still better than none
+            print(f"Could not download the Steam app list: {e}")
+            return now + STEAM_APPLIST_RETRY
+
+    # Returns (mtime, index) of the snapshot on disk, or None when it is the one already loaded
+    def parse_snapshot(self):
+        try:
+            mtime = os.path.getmtime(self.path)
+            if mtime == self.snapshot_mtime:
+                return None
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"No usable Steam app list at {self.path}: {e}")
+            return None
+
+        names = []
+        appids = []
+        exact = {}
+        apps = data.get("applist", {}).get("apps", []) if isinstance(data, dict) else data
+        for app in apps:
+            name = normalize_name(str(app.get("name") or ""))
+            if not name or not app.get("appid"):
+                continue
+            names.append(name)
+            appids.append(str(app["appid"]))
+            exact[name] = len(names) - 1 if name not in exact else self.AMBIGUOUS
+        return mtime, {"names": names, "appids": appids, "exact": exact, "trigrams": None}
+
+    def load(self):
+        with self.lock:
+            if time.time() < self.next_check:
+                return self.index
+            # Claims the check, other artwork workers keep using the current index while this one downloads
+            self.next_check = time.time() + STEAM_APPLIST_RETRY
+
+        next_check = self.refresh_snapshot()
+        snapshot = self.parse_snapshot()
+
+        with self.lock:
+            self.next_check = next_check
+            if snapshot is not None:
+                self.snapshot_mtime, self.index = snapshot
+                print(f"Loaded {len(self.index['names'])} Steam apps into the local name index")
+            return self.index
+
+    def build_trigrams(self, index):
+        trigrams = {}
+        for i, name in enumerate(index["names"]):
+            for gram in name_trigrams(name):
+                postings = trigrams.get(gram)
+                if postings is None:
+                    postings = trigrams[gram] = array.array('I')
+                postings.append(i)
+        index["trigrams"] = trigrams
+
+    # Only a name that belongs to exactly one app
+    def lookup(self, game_name):
+        index = self.load()
+        target = normalize_name(game_name)
+        if not target:
+            return None
+        i = index["exact"].get(target)
+        if i == self.AMBIGUOUS:
+            print(f"Several Steam apps are named {game_name}, asking the store search")
+            return None
+        return index["appids"][i] if i is not None else None
+
+    # An app whose name contains the whole game name, for when the store search has nothing
+    def partial_lookup(self, game_name):
+        index = self.load()
+        target = normalize_name(game_name)
+        # Short names match too much
+        grams = name_trigrams(target)
+        if len(grams) < 3 or not index["names"]:
+            return None
+        with self.lock:
+            if index["trigrams"] is None:
+                self.build_trigrams(index)
+        postings = sorted((index["trigrams"].get(gram, ()) for gram in grams), key=len)
+        if not postings or not postings[0]:
+            return None
+        candidates = set(postings[0])
+        for other in postings[1:]:
+            candidates.intersection_update(other)
+            if not candidates:
+                return None
+
+        names = index["names"]
+        matches = [i for i in candidates if target in names[i]]
+        if not matches:
+            return None
+        best = min(matches, key=lambda i: (len(names[i]), i))
+        print(f"Using partial Steam app list match: {names[best]} ({index['appids'][best]})")
+        return index["appids"][best]
+
+steam_app_index = SteamAppIndex(STEAM_APPLIST_PATH)
+#End of Steam App Index
+
 
 
 def get_steam_store_appid(steam_store_game_name):
-    search_url = f"{BASE_URL}/search/{urllib.parse.quote(steam_store_game_name)}"
     try:
-        with urllib.request.urlopen(search_url) as response:
-            data = json.load(response)
-            if 'data' in data and data['data']:
-                steam_store_appid = data['data'][0].get('steam_store_appid')
-                if steam_store_appid:
-                    print(f"Found App ID for {steam_store_game_name} via primary source: {steam_store_appid}")
-                    return steam_store_appid
+        data = search_sgdb(steam_store_game_name)
+        if data:
+            steam_store_appid = data['data'][0].get('steam_store_appid')
+            if steam_store_appid:
+                print(f"Found App ID for {steam_store_game_name} via primary source: {steam_store_appid}")
+                return steam_store_appid
     except (urllib.error.URLError, Exception) as e:
         print(f"Primary store App ID lookup failed for {steam_store_game_name}: {e}")
 
-    global steam_applist_cache
-    if steam_applist_cache is None:
-        steam_applist_cache = {}
-
-    def normalize_name(name):
-        name = name.lower()
-        name = re.sub(r'[®™]', '', name)
-        name = re.sub(r'[-–—:]', ' ', name)
-        name = ' '.join(name.split())
-        return name
-
-    if steam_store_game_name not in steam_applist_cache:
-        time.sleep(0.5) 
+    appid = steam_app_index.lookup(steam_store_game_name)
+    if appid:
+        print(f"Found App ID for {steam_store_game_name} via local Steam app list: {appid}")
+        return appid
 
+    def fetch():
         query = urllib.parse.quote(steam_store_game_name)
         url = f"https://store.steampowered.com/api/storesearch/?term={query}&l=english&cc=US"
 
-        try:
-            with urllib.request.urlopen(url, timeout=10) as response:
-                data = json.load(response)
-
-            if not data.get("items"):
-                relaxed_name = steam_store_game_name.replace(" - ", " ")
-                relaxed_query = urllib.parse.quote(relaxed_name)
-                relaxed_url = f"https://store.steampowered.com/api/storesearch/?term={relaxed_query}&l=english&cc=US"
+        data = http_get_json(url, timeout=10)
 
-                print(f"No exact Steam results. Trying relaxed search: {relaxed_name}")
+        if not data.get("items"):
+            relaxed_name = steam_store_game_name.replace(" - ", " ")
+            relaxed_query = urllib.parse.quote(relaxed_name)
+            relaxed_url = f"https://store.steampowered.com/api/storesearch/?term={relaxed_query}&l=english&cc=US"
 
-                with urllib.request.urlopen(relaxed_url, timeout=10) as response:
-                    data = json.load(response)
+            print(f"No exact Steam results. Trying relaxed search: {relaxed_name}")
 
-        except (urllib.error.URLError, Exception) as e:
-            print(f"Fallback Steam lookup failed for {steam_store_game_name}: {e}")
-            return None
+            data = http_get_json(relaxed_url, timeout=10)
 
         target = normalize_name(steam_store_game_name)
-        fallback_appid = None
 
         for item in data.get("items", []):
             item_name = normalize_name(item.get("name", ""))
 
             if item_name == target:
-                fallback_appid = str(item.get("id"))
-                break
+                return str(item.get("id"))
 
             if target in item_name or item_name in target:
-                fallback_appid = str(item.get("id"))
-                print(f"Using partial Steam match: {item.get('name')} ({fallback_appid})")
-                break
+                print(f"Using partial Steam match: {item.get('name')} ({item.get('id')})")
+                return str(item.get("id"))
+        return None
+
+    try:
+        fallback_appid = cached_api_call("steam_storesearch", [steam_store_game_name], fetch)
+    except (urllib.error.URLError, Exception) as e:
+        print(f"Fallback Steam lookup failed for {steam_store_game_name}: {e}")
+        fallback_appid = None
 
-        steam_applist_cache[steam_store_game_name] = fallback_appid
+    if fallback_appid:
+        print(f"Found App ID for {steam_store_game_name} via fallback Steam search API: {fallback_appid}")
+        return fallback_appid
 
-    if steam_applist_cache[steam_store_game_name]:
-        print(f"Found App ID for {steam_store_game_name} via fallback Steam search API: {steam_applist_cache[steam_store_game_name]}")
-        return steam_applist_cache[steam_store_game_name]
+    appid = steam_app_index.partial_lookup(steam_store_game_name)
+    if appid:
+        print(f"Found App ID for {steam_store_game_name} via local Steam app list: {appid}")
+        return appid
 
     print(f"No App ID found for {steam_store_game_name} in fallback Steam search API.")
     return None
@@ -604,38 +1397,67 @@ def create_steam_store_app_manifest_file(steam_store_appid, steam_store_game_nam
 
 
 
-def get_steam_fallback_url(steam_store_appid, art_type):
-    base_url = f"https://shared.steamstatic.com/store_item_assets/steam/apps/{steam_store_appid}/"
+#Steam CDN fallback artwork
+# Candidates in order of preference. The first one that exists is downloaded by the same request that finds it,
+# and which one that was is remembered per app id in the API cache
+STEAM_ASSET_BASE_URL = "https://shared.steamstatic.com/store_item_assets/steam/apps/{appid}/"
+STEAM_FALLBACK_ASSETS = {
+    "icons": ["icon.png", "icon.ico"],
+    "logos": ["logo_2x.png", "logo.png"],
+    "heroes": ["library_hero_2x.jpg", "library_hero.jpg"],
+    "grids_600x900": ["library_600x900_2x.jpg", "library_600x900.jpg"],
+    "grids_920x430": ["header_2x.jpg", "header.jpg"],
+}
 
-    candidates = []
+def steam_fallback_file_name(art_type, shortcut_id, ext):
     if art_type == "icons":
-        candidates = [base_url + "icon.png", base_url + "icon.ico"]
+        return get_file_name("icons", shortcut_id)
     elif art_type == "logos":
-        candidates = [base_url + "logo_2x.png", base_url + "logo.png"]
+        return f"{shortcut_id}_logo.{ext}"
     elif art_type == "heroes":
-        candidates = [base_url + "library_hero_2x.jpg", base_url + "library_hero.jpg"]
+        return f"{shortcut_id}_hero.{ext}"
     elif art_type == "grids_600x900":
-        candidates = [base_url + "library_600x900_2x.jpg", base_url + "library_600x900.jpg"]
-    elif art_type == "grids_920x430":
-        candidates = [base_url + "header_2x.jpg", base_url + "header.jpg"]
+        return f"{shortcut_id}p.{ext}"
     else:
+        return f"{shortcut_id}.{ext}"
+
+# Returns the path the artwork was saved to, or None when Steam has none of the candidates
+def download_steam_fallback_art(steam_store_appid, art_type, shortcut_id):
+    names = STEAM_FALLBACK_ASSETS[art_type]
+    cache_params = [str(steam_store_appid), art_type]
+    known = api_cache.get("steam_cdn_asset", cache_params)
+    if known is None:
         return None
-
-    for url in candidates:
-        try:
-            with urllib.request.urlopen(url) as response:
-                if response.status == 200:
-                    return url
-        except (urllib.error.URLError, Exception) as e:
-            print(f"Error checking fallback URL: {url} — {e}")
+    if known is not ApiCache.MISS and known in names:
+        names = [known] + [name for name in names if name != known]
+
+    base_url = STEAM_ASSET_BASE_URL.format(appid=steam_store_appid)
+    missing = True
+    for name in names:
+        filename = steam_fallback_file_name(art_type, shortcut_id, name.rsplit('.', 1)[-1])
+        file_path = f"{logged_in_home}/.steam/root/userdata/{steamid3}/config/grid/{filename}"
+        status = download_file(base_url + name, file_path)
+        if status != 200:
+            if status not in (403, 404):
+                missing = False
             continue
+        note_grid_file(file_path)
+
+        if known != name:
+            api_cache.put("steam_cdn_asset", cache_params, name)
+        return file_path
+
+    # Only remembered when Steam said none of them exist, not when it failed to answer
+    if missing:
+        api_cache.put("steam_cdn_asset", cache_params, None)
     return None
+#End of Steam CDN fallback artwork
 
 
 
 def file_exists_with_any_ext(base_path):
     for ext in ['png', 'jpg', 'ico']:
-        if os.path.exists(f"{base_path}.{ext}"):
+        if grid_file_exists(f"{base_path}.{ext}"):
             return True
     return False
 
@@ -644,89 +1466,238 @@ def file_exists_with_any_ext(base_path):
 
 
 
-def tag_artwork_files(shortcut_id, game_name, steamid3, logged_in_home):
-    grid_dir = f"{logged_in_home}/.steam/root/userdata/{steamid3}/config/grid"
-    base_name = str(shortcut_id)
-
-    patterns = [
-        f"{base_name}-icon",
-        f"{base_name}_logo",
-        f"{base_name}_hero",
-        f"{base_name}p",
-        f"{base_name}"
-    ]
+#Grid Snapshot
+# The file names in a grid folder, from one os.scandir per scan cycle, so checking which artwork a shortcut has does
+# not stat every candidate name. Artwork the scanner downloads or deletes is added and dropped as that happens
+GRID_ART_PATTERN = re.compile(r"(\d+)(-icon|_logo|_hero|p)?\.(png|jpg|ico)")
+GRID_ART_TYPES = {"-icon": "icons", "_logo": "logos", "_hero": "heroes", "p": "grids_600x900", "": "grids_920x430"}
+GRID_ART_EXTENSIONS = ("png", "jpg", "ico")
 
-    found_files = []
+class GridSnapshot:
+    def __init__(self, grid_dir):
+        self.grid_dir = grid_dir
+        self.lock = threading.Lock()
+        self.names = None
+        # shortcut id -> art type -> extensions
+        self.art = {}
 
-    for pattern in patterns:
-        for ext in ['png', 'jpg', 'ico']:
-            file_path = os.path.join(grid_dir, f"{pattern}.{ext}")
-            if os.path.exists(file_path):
-                found_files.append(file_path)
+    def invalidate(self):
+        with self.lock:
+            self.names = None
+            self.art = {}
 
-    for file_path in found_files:
+    def build(self):
+        self.names = set()
+        self.art = {}
         try:
-            # Check if file already has the correct tag
-            result = subprocess.run(
-                ['getfattr', '-n', 'user.xdg.tags', '--only-values', file_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True
-            )
+            with os.scandir(self.grid_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        self.index_name(entry.name, True)
+        except FileNotFoundError:
+            pass
+
+    def index_name(self, name, present):
+        match = GRID_ART_PATTERN.fullmatch(name)
+        if present:
+            self.names.add(name)
+        else:
+            self.names.discard(name)
+        if not match:
+            return
+        shortcut_id, suffix, ext = match.groups()
+        art_types = self.art.setdefault(shortcut_id, {})
+        extensions = art_types.setdefault(GRID_ART_TYPES[suffix or ""], set())
+        if present:
+            extensions.add(ext)
+        else:
+            extensions.discard(ext)
+
+    def exists(self, name):
+        with self.lock:
+            if self.names is None:
+                self.build()
+            return name in self.names
+
+    # Artwork file names of a shortcut, icon first and then logo, hero, portrait grid and wide grid
+    def files_of(self, shortcut_id):
+        with self.lock:
+            if self.names is None:
+                self.build()
+            art_types = self.art.get(str(shortcut_id), {})
+            return [f"{shortcut_id}{suffix}.{ext}"
+                    for suffix, art_type in GRID_ART_TYPES.items()
+                    for ext in GRID_ART_EXTENSIONS if ext in art_types.get(art_type, ())]
+
+    def update(self, name, present):
+        with self.lock:
+            # Not scanned yet, the next scan sees the change
+            if self.names is not None:
+                self.index_name(name, present)
+
+grid_indexes = {}
+grid_indexes_lock = threading.Lock()
+
+# One GridSnapshot and one ArtworkTagIndex per grid folder
+def grid_index(index_class, grid_dir):
+    key = (index_class, os.path.normpath(grid_dir))
+    with grid_indexes_lock:
+        index = grid_indexes.get(key)
+        if index is None:
+            index = grid_indexes[key] = index_class(key[1])
+        return index
+
+# Called at the start of every scan cycle, files may have been changed between cycles
+def invalidate_grid_indexes():
+    with grid_indexes_lock:
+        indexes = list(grid_indexes.values())
+    for index in indexes:
+        index.invalidate()
+
+def grid_snapshot(grid_dir):
+    return grid_index(GridSnapshot, grid_dir)
+
+def grid_file_exists(path):
+    return grid_snapshot(os.path.dirname(path)).exists(os.path.basename(path))
+
+def note_grid_file(path, present=True):
+    grid_snapshot(os.path.dirname(path)).update(os.path.basename(path), present)
+    # A download replaces the file with a new one that has no tags, they are read again when asked for
+    artwork_tags(os.path.dirname(path)).forget(os.path.basename(path))
+#End of Grid Snapshot
+
+
+
+#Artwork Tags
+# Artwork in the grid folder is tagged with the name of its game in the user.xdg.tags attribute. The tags of a grid
+# folder are read once per scan cycle, the first time they are needed, and kept current as files are tagged or deleted
+ARTWORK_TAG_ATTR = "user.xdg.tags"
+
+def read_xattr_tags(path):
+    try:
+        value = os.getxattr(path, ARTWORK_TAG_ATTR)
+    except OSError:
+        return None
+    return value.decode('utf-8', 'replace').strip().split(',')
+
+class ArtworkTagIndex:
+    def __init__(self, grid_dir):
+        self.grid_dir = grid_dir
+        self.lock = threading.Lock()
+        # file name -> tags, None until the folder is scanned
+        self.tags = None
+        # tag -> file names
+        self.files = {}
+
+    def invalidate(self):
+        with self.lock:
+            self.tags = None
+            self.files = {}
+
+    def build(self):
+        self.tags = {}
+        self.files = {}
+        try:
+            with os.scandir(self.grid_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        continue
+                    self.index_file(entry.name, read_xattr_tags(entry.path))
+        except FileNotFoundError:
+            print(f"Grid path not found: {self.grid_dir}")
+
+    def index_file(self, name, tags):
+        for tag in self.tags.pop(name, None) or ():
+            names = self.files.get(tag)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self.files[tag]
+        if tags is None:
+            return
+        self.tags[name] = tags
+        for tag in tags:
+            self.files.setdefault(tag, set()).add(name)
+
+    def tags_of(self, name):
+        with self.lock:
+            if self.tags is None:
+                self.build()
+            if name not in self.tags:
+                # Written after the folder was scanned
+                tags = read_xattr_tags(os.path.join(self.grid_dir, name))
+                if tags is None:
+                    return []
+                self.index_file(name, tags)
+            return list(self.tags[name])
+
+    def files_tagged(self, tag):
+        with self.lock:
+            if self.tags is None:
+                self.build()
+            return sorted(self.files.get(tag, ()))
+
+    def set_tag(self, name, tag):
+        with self.lock:
+            if self.tags is None:
+                self.build()
+            os.setxattr(os.path.join(self.grid_dir, name), ARTWORK_TAG_ATTR, tag.encode('utf-8'))
+            self.index_file(name, [tag])
+
+    def forget(self, name):
+        with self.lock:
+            if self.tags is not None:
+                self.index_file(name, None)
+
+    def remove(self, name):
+        with self.lock:
+            try:
+                os.remove(os.path.join(self.grid_dir, name))
+            finally:
+                if self.tags is not None:
+                    self.index_file(name, None)
+                grid_snapshot(self.grid_dir).update(name, False)
+
+def artwork_tags(grid_dir):
+    return grid_index(ArtworkTagIndex, grid_dir)
 
-            existing_tags = result.stdout.strip().split(',') if result.returncode == 0 else []
 
-            if game_name in existing_tags:
+def tag_artwork_files(shortcut_id, game_name, steamid3, logged_in_home):
+    grid_dir = f"{logged_in_home}/.steam/root/userdata/{steamid3}/config/grid"
+    tags = artwork_tags(grid_dir)
+
+    for file_name in grid_snapshot(grid_dir).files_of(shortcut_id):
+        file_path = os.path.join(grid_dir, file_name)
+        try:
+            # Check if file already has the correct tag
+            if game_name in tags.tags_of(file_name):
                 print(f"Already tagged: {file_path}")
                 continue
 
-            subprocess.run(
-                ['setfattr', '-n', 'user.xdg.tags', '-v', game_name, file_path],
-                check=True
-            )
+            tags.set_tag(file_name, game_name)
             print(f"Tagged {file_path} with '{game_name}'")
-        except subprocess.CalledProcessError as e:
+        except OSError as e:
             print(f"Failed to tag {file_path}: {e}")
 
 
 
 def delete_old_artwork_by_tag(appname, shortcut_id, steamid3, logged_in_home):
     grid_path = os.path.join(logged_in_home, ".steam", "root", "userdata", str(steamid3), "config", "grid")
+    tags = artwork_tags(grid_path)
 
-    try:
-        for filename in os.listdir(grid_path):
-            filepath = os.path.join(grid_path, filename)
-
-            # Skip directories and .ico files
-            if os.path.isdir(filepath) or filename.endswith(".ico"):
-                continue
-
-            # Skip any files tagged for the current shortcut ID
-            if str(shortcut_id) in filename:
-                continue
-
-            try:
-                result = subprocess.run(
-                    ['getfattr', '-n', 'user.xdg.tags', '--only-values', filepath],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.DEVNULL,
-                    text=True
-                )
-
-                if result.returncode != 0:
-                    continue  # No tag present
-
-                tags = result.stdout.strip().split(',')
-
-                if appname in tags:
-                    os.remove(filepath)
-                    print(f"Deleted old artwork tagged '{appname}': {filepath}")
-
-            except Exception as e:
-                print(f"Failed to process {filepath}: {e}")
+    for filename in tags.files_tagged(appname):
+        # Skip .ico files and any files tagged for the current shortcut ID
+        if filename.endswith(".ico") or str(shortcut_id) in filename:
+            continue
 
-    except FileNotFoundError:
-        print(f"Grid path not found: {grid_path}")
+        filepath = os.path.join(grid_path, filename)
+        try:
+            tags.remove(filename)
+            print(f"Deleted old artwork tagged '{appname}': {filepath}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Failed to process {filepath}: {e}")
 
 
 
@@ -734,150 +1705,219 @@ def delete_old_artwork_by_tag(appname, shortcut_id, steamid3, logged_in_home):
 
 #for local check
 def file_tagged_with_appname(filepath, appname):
-    try:
-        result = subprocess.run(
-            ['getfattr', '-n', 'user.xdg.tags', '--only-values', filepath],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-            text=True
-        )
-        if result.returncode != 0:
-            return False
-        tags = result.stdout.strip().split(',')
-        return appname in tags
-    except Exception as e:
-        print(f"Failed to get tags for {filepath}: {e}")
-        return False
+    return appname in (read_xattr_tags(filepath) or [])
+#End of Artwork Tags
+
+
+
+
+
+#Game Tracking
+# Installed games per launcher, keyed by (launcher, appname). The rows stay in memory for the life of the process and
+# each scan only writes the rows whose state changed. A row also keeps the exe, start dir and launch options of the
+# shortcut NSL made for the game, so only that exact shortcut is ever removed without asking
+TRACKING_DB_PATH = f"{logged_in_home}/.config/systemd/user/installedapps.db"
+LEGACY_TRACKING_PATH = f"{logged_in_home}/.config/systemd/user/installedapps.json"
+TRACKING_DB_VERSION = 2
+
+class TrackingStore:
+    def __init__(self, path, legacy_path):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.conn = None
+        # (launcher, appname) -> [first_seen, last_seen, still_installed, [exe, start dir, launch options] or None]
+        self.apps = None
+
+    def connect(self):
+        if self.conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self.conn = sqlite3.connect(self.path)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS installed_apps (
+                    launcher TEXT NOT NULL,
+                    appname TEXT NOT NULL,
+                    first_seen TEXT NOT NULL,
+                    last_seen TEXT NOT NULL,
+                    still_installed INTEGER NOT NULL,
+                    shortcut TEXT,
+                    PRIMARY KEY (launcher, appname)
+                ) WITHOUT ROWID""")
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            if version == 0:
+                self.import_legacy()
+            elif version == 1:
+                with self.conn:
+                    self.conn.execute("ALTER TABLE installed_apps ADD COLUMN shortcut TEXT")
+            if version < TRACKING_DB_VERSION:
+                self.conn.execute(f"PRAGMA user_version = {TRACKING_DB_VERSION}")
+        return self.conn
+
+    # One time import of the installedapps.json master list
+    def import_legacy(self):
+        rows = []
+        if os.path.exists(self.legacy_path):
+            try:
+                with open(self.legacy_path, "r") as f:
+                    master_list = json.load(f)
+                if not isinstance(master_list, dict):
+                    raise ValueError("Expected dictionary.")
+                for launcher, games in master_list.items():
+                    for appname, game in games.items():
+                        now = datetime.utcnow().isoformat() + "Z"
+                        rows.append((launcher, appname, game.get("first_seen", now), game.get("last_seen", now),
+                                     1 if game.get("still_installed", True) else 0, None))
+            except Exception as e:
+                print(f"Failed to import master list: {e}")
+                rows = []
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO installed_apps VALUES (?, ?, ?, ?, ?, ?)", rows)
+        if rows:
+            print(f"Imported {len(rows)} tracked games from {self.legacy_path}")
+
+    def load(self):
+        if self.apps is None:
+            try:
+                rows = self.connect().execute(
+                    "SELECT launcher, appname, first_seen, last_seen, still_installed, shortcut FROM installed_apps").fetchall()
+                self.apps = {(launcher, appname): [first_seen, last_seen, bool(still_installed),
+                                                   json.loads(shortcut) if shortcut else None]
+                             for launcher, appname, first_seen, last_seen, still_installed, shortcut in rows}
+            except (sqlite3.Error, ValueError) as e:
+                print(f"Failed to load master list: {e}")
+                return {}
+        return self.apps
 
+    def apply(self, upserts):
+        apps = self.load()
+        for launcher, appname, first_seen, last_seen, still_installed, shortcut in upserts:
+            apps[(launcher, appname)] = [first_seen, last_seen, still_installed, shortcut]
+        try:
+            with self.connect() as conn:
+                conn.executemany("INSERT OR REPLACE INTO installed_apps VALUES (?, ?, ?, ?, ?, ?)",
+                                 [(*row[:4], 1 if row[4] else 0, json.dumps(row[5]) if row[5] else None)
+                                  for row in upserts])
+        except sqlite3.Error as e:
+            # The next process reloads from disk, this one keeps going with the rows in memory
+            print(f"Failed to save master list: {e}")
+
+tracking_store = TrackingStore(TRACKING_DB_PATH, LEGACY_TRACKING_PATH)
+
+# [exe, start dir, launch options] of the shortcut prepare_shortcut() made or found for each app name this cycle
+shortcut_targets = {}
+
+# The shortcut NSL made for a game, if it is still there exactly as NSL made it
+def find_nsl_shortcut(appname, shortcut):
+    if not shortcut:
+        return None
+    exe, start_dir, launch_options = shortcut
+    entry = shortcut_index.find(appname, exe, start_dir)
+    if entry is None or entry.get('LaunchOptions', '') != launch_options:
+        return None
+    return entry
 
+def shortcut_appid(entry):
+    appid = entry.get('appid', entry.get('AppID')) if entry else None
+    # shortcuts.vdf keeps the appid as a signed 32 bit value
+    return appid & 0xFFFFFFFF if appid else None
+#End of Game Tracking
 
 
 
 def scan_and_track_games(logged_in_home, steamid3):
-    def normalize_appname(name):
-        return name.strip().lower() if name else ""
-
-    shortcuts_path = f"{logged_in_home}/.steam/root/userdata/{steamid3}/config/shortcuts.vdf"
-    installed_apps_path = f"{logged_in_home}/.config/systemd/user/installedapps.json"
-
     current_scan = {}
-    master_list = {}
-    previous_master_list = {}
-
-    def load_master_list():
-        nonlocal master_list, previous_master_list
-        if os.path.exists(installed_apps_path):
-            try:
-                with open(installed_apps_path, "r") as f:
-                    master_list_raw = json.load(f)
-                    if not isinstance(master_list_raw, dict):
-                        raise ValueError("Expected dictionary.")
-                    master_list = master_list_raw
-                    previous_master_list = json.loads(json.dumps(master_list))  # deep copy
-            except Exception as e:
-                print(f"Failed to load master list: {e}")
-                master_list = {}
-                previous_master_list = {}
-        else:
-            master_list = {}
-            previous_master_list = {}
+    tracked = tracking_store.load()
+    shortcut_targets.clear()
 
     def track_game(appname, launcher):
-        now = datetime.utcnow().isoformat() + "Z"
-        if launcher not in current_scan:
-            current_scan[launcher] = {}
-        current_scan[launcher][appname] = {
-            "first_seen": master_list.get(launcher, {}).get(appname, {}).get("first_seen", now),
-            "last_seen": now,
-            "still_installed": True
-        }
-
-    def load_shortcuts_appid_map():
-        if not os.path.isfile(shortcuts_path):
-            print("shortcuts.vdf not found!")
+        current_scan[(launcher, appname)] = shortcut_targets.get(appname)
+
+    # removals is a list of (launcher, appname, shortcut, confirm). Shortcuts still exactly as NSL made them are
+    # removed right away, for everything else Steam asks the user first
+    def uninstall_removed_apps(removals):
+        # Steam may have rewritten shortcuts.vdf since it was indexed, the appids come from Steam
+        reload_shortcuts_if_changed()
+        batch = []
+        for launcher, appname, shortcut, confirm in removals:
+            entry = find_nsl_shortcut(appname, shortcut)
+            if entry is None and shortcut:
+                print(f"Shortcut for '{appname}' was changed or removed outside NSL. Leaving it alone.")
+                continue
+            if entry is None:
+                # Tracked before NSL recorded its shortcuts, only the name is known
+                entry = shortcut_index.find_by_normalized_name(appname)
+                confirm = True
+            appid = shortcut_appid(entry)
+            if appid:
+                batch.append((launcher, appname, appid, confirm))
+            else:
+                print(f"AppID not found for '{appname}'")
+        if not batch:
             return {}
 
+        results = None
         try:
-            with open(shortcuts_path, "rb") as f:
-                data = vdf.binary_load(f)
-
-            shortcuts = data.get("shortcuts", data)
-            appid_map = {}
-            for key, entry in shortcuts.items():
-                appname = entry.get("AppName") or entry.get("appname")
-                appid = entry.get("appid") or entry.get("AppID")
-                if appname and appid:
-                    norm_name = normalize_appname(appname)
-                    appid_map[norm_name] = appid
-            return appid_map
+            results = remove_shortcuts(get_devtools_client(TARGET_TITLE),
+                                       [{"appid": appid, "confirm": confirm} for launcher, appname, appid, confirm in batch])
         except Exception as e:
-            print(f"Failed to load shortcuts.vdf: {e}")
-            return {}
+            print(f"Failed to connect for shortcut removal: {e}")
 
-    def uninstall_removed_apps(removed_appnames, appid_map):
-        for appname in removed_appnames:
-            norm_name = normalize_appname(appname)
-            appid = appid_map.get(norm_name)
-            if appid:
-                try:
-                    subprocess.run(["steam", f"steam://uninstall/{appid}"], check=True)
-                    print(f"Uninstall command sent for '{appname}' (AppID: {appid})")
-                except subprocess.CalledProcessError:
-                    print(f"Uninstall failed for '{appname}' (AppID: {appid})")
-            else:
-                print(f"AppID not found for '{appname}'")
+        removed_apps = {}
+        for index, (launcher, appname, appid, confirm) in enumerate(batch):
+            if results is not None:
+                result = results[index]
+                if not (isinstance(result, dict) and result.get('success')):
+                    print(f"Uninstall failed for '{appname}' (AppID: {appid}): {result}")
+                elif confirm:
+                    print(f"Asked Steam to uninstall '{appname}' (AppID: {appid}), waiting for the user to confirm")
+                else:
+                    print(f"Removed shortcut for '{appname}' (AppID: {appid})")
+                    removed_apps.setdefault(launcher, []).append(appname)
+                continue
+            # Steam's JS context is not reachable, ask the client directly. Steam shows its confirmation dialog
+            try:
+                subprocess.run(["steam", f"steam://uninstall/{appid}"], check=True)
+                print(f"Uninstall command sent for '{appname}' (AppID: {appid})")
+            except (subprocess.CalledProcessError, OSError):
+                print(f"Uninstall failed for '{appname}' (AppID: {appid})")
+        return removed_apps
 
     def finalize_game_tracking():
         now = datetime.utcnow().isoformat() + "Z"
-        removed_apps = {}
-
-        for launcher in list(master_list.keys()):
-            if launcher not in current_scan:
-                removed_apps[launcher] = list(master_list[launcher].keys())
-                del master_list[launcher]
-            else:
-                for appname in list(master_list[launcher].keys()):
-                    if appname not in current_scan[launcher]:
-                        was_installed = previous_master_list.get(launcher, {}).get(appname, {}).get("still_installed", True)
-                        if was_installed:
-                            removed_apps.setdefault(launcher, []).append(appname)
-                        master_list[launcher][appname]["still_installed"] = False
-                        master_list[launcher][appname]["last_seen"] = now
-
-        for launcher, games in current_scan.items():
-            if launcher not in master_list:
-                master_list[launcher] = {}
-            master_list[launcher].update(games)
-
-        # Remove volatile fields (like "last_seen") for comparison
-        def cleaned(data):
-            if isinstance(data, dict):
-                return {k: cleaned(v) for k, v in data.items() if k != "last_seen"}
-            elif isinstance(data, list):
-                return [cleaned(i) for i in data]
-            else:
-                return data
-
-        # Only write to file if the cleaned data has meaningful changes
-        if cleaned(master_list) != cleaned(previous_master_list):
-            os.makedirs(os.path.dirname(installed_apps_path), exist_ok=True)
-            with open(installed_apps_path, "w") as f:
-                json.dump(master_list, f, indent=4)
-            print("Master list updated and saved.")
+        removals = []
+        upserts = []
+
+        # A launcher missing from the scan entirely is as likely an unmounted SD card or a broken prefix as an
+        # uninstall, so its games are never removed without Steam asking the user
+        scanned_launchers = {launcher for launcher, appname in current_scan}
+        for key in sorted(tracked.keys() - current_scan.keys()):
+            launcher, appname = key
+            first_seen, last_seen, still_installed, shortcut = tracked[key]
+            if still_installed:
+                removals.append((launcher, appname, shortcut, launcher not in scanned_launchers))
+                upserts.append((launcher, appname, first_seen, now, False, shortcut))
+
+        for key, shortcut in current_scan.items():
+            state = tracked.get(key)
+            if state is None:
+                upserts.append((*key, now, now, True, shortcut))
+            elif not state[2] or (shortcut and shortcut != state[3]):
+                upserts.append((*key, state[0], now, True, shortcut or state[3]))
+
+        if upserts:
+            tracking_store.apply(upserts)
+            print(f"Master list updated and saved ({len(upserts)} changed).")
         else:
             print("No meaningful changes to master list. Skipping write.")
 
-        if removed_apps:
-            print(f"Removed apps: {removed_apps}")
-            appid_map = load_shortcuts_appid_map()
-            for launcher, apps in removed_apps.items():
-                uninstall_removed_apps(apps, appid_map)
+        removed_apps = {}
+        if removals:
+            print(f"Removed apps: {[f'{appname} ({launcher})' for launcher, appname, shortcut, confirm in removals]}")
+            removed_apps = uninstall_removed_apps(removals)
         else:
             print("No newly removed apps detected.")
 
         return removed_apps
 
-    load_master_list()
     return track_game, finalize_game_tracking
 
 
@@ -962,24 +2002,11 @@ def create_exec_line_from_entry(logged_in_home, new_entry, m_gameid):
         print(f"Compat prefix: {compat_data_prefix}")
 
 
-        dir_path = os.path.expanduser("~/.steam/root/compatibilitytools.d")
-        pattern = re.compile(r"UMU-Proton-(\d+(?:\.\d+)*)(?:-(\d+(?:\.\d+)*))?")
-
-        try:
-            umu_folders = [
-                (tuple(map(int, (m.group(1) + '.' + (m.group(2) or '0')).split('.'))), name)
-                for name in os.listdir(dir_path)
-                if (m := pattern.match(name)) and os.path.isdir(os.path.join(dir_path, name))
-            ]
-            if umu_folders:
-                compat_tool_name = max(umu_folders)[1]  # Most recent version
-                print(f"Found UMU Proton: {compat_tool_name}")
-            else:
-                print("No valid UMU Proton compatibility tool folders found.")
-                compat_tool_name = None
-        except Exception as e:
-            print(f"Error reading UMU Proton folders: {e}")
-            compat_tool_name = None
+        compat_tool_name = compat_tools.latest_umu_proton()  # Most recent version
+        if compat_tool_name:
+            print(f"Found UMU Proton: {compat_tool_name}")
+        else:
+            print("No valid UMU Proton compatibility tool folders found.")
 
         if compat_tool_name:
             proton_path = os.path.join(logged_in_home, f".local/share/Steam/compatibilitytools.d/{compat_tool_name}")
@@ -1144,29 +2171,88 @@ def create_exec_line_from_entry(logged_in_home, new_entry, m_gameid):
 
 
 
-def check_if_shortcut_exists(display_name, exe_path, start_dir, launch_options):
-    stripped_exe_path = exe_path.strip('\"') if exe_path else exe_path
-    stripped_start_dir = start_dir.strip('\"') if start_dir else start_dir
+#Shortcut Index
+# Hash lookups over shortcuts.vdf for the duplicate checks and for picking the key of a new shortcut, instead of
+# walking every shortcut for every game. Rebuilt whenever shortcuts.vdf is (re)loaded and updated on every insert
+class ShortcutIndex:
+    def __init__(self, entries):
+        self.entries = entries
+        self.by_target = {}
+        self.websites = {}
+        self.by_name = {}
+        self.by_normalized_name = {}
+        self.by_appid = {}
+        self.next_key = 0
+        for entry in entries.values():
+            self.index_entry(entry)
+        self.advance_key()
+
+    def index_entry(self, entry):
+        names = {name for name in (entry.get('appname'), entry.get('AppName')) if name}
+        exes = {exe.strip('"') for exe in (entry.get('exe'), entry.get('Exe')) if exe}
+        start_dir = entry.get('StartDir')
+        for name in names:
+            self.by_name.setdefault(name, entry)
+            self.by_normalized_name.setdefault(name.strip().lower(), entry)
+            if start_dir:
+                for exe in exes:
+                    self.by_target.setdefault((name, exe, start_dir.strip('"')), entry)
+            if entry.get('exe') and entry['exe'].strip('"') == '/app/bin/chrome' and entry.get('LaunchOptions'):
+                self.websites.setdefault(name, []).append(entry['LaunchOptions'])
+        appid = entry.get('appid', entry.get('AppID'))
+        if appid is not None:
+            self.by_appid.setdefault(appid, entry)
 
-    for s in shortcuts['shortcuts'].values():
-        # Non-Chrome shortcut check: We remove the launch options comparison for non-Chrome shortcuts
-        if (s.get('appname') == display_name or s.get('AppName') == display_name) and \
-           ((s.get('exe') and s.get('exe').strip('\"') == stripped_exe_path) or (s.get('Exe') and s.get('Exe').strip('\"') == stripped_exe_path)) and \
-           s.get('StartDir') and s.get('StartDir').strip('\"') == stripped_start_dir:
+    def advance_key(self):
+        while str(self.next_key) in self.entries:
+            self.next_key += 1
 
-            # Check if the launch options are different (for non-Chrome, no comparison is done, so add a warning here)
-            if s.get('LaunchOptions') != launch_options:
-                print(f"Launch options for {display_name} differ from the default. This could be due to the user manually modifying the launch options. Will skip creation")
+    def insert(self, entry):
+        key = str(self.next_key)
+        self.entries[key] = entry
+        self.index_entry(entry)
+        self.advance_key()
+        return key
 
-            print(f"Existing shortcut found for game {display_name}. Skipping creation.")
-            return True
+    def find(self, display_name, exe_path, start_dir):
+        if not exe_path or not start_dir:
+            return None
+        return self.by_target.get((display_name, exe_path.strip('"'), start_dir.strip('"')))
 
-        # Chrome (website) shortcut check
-        if (s.get('appname') == display_name or s.get('AppName') == display_name) and \
-           (s.get('exe') and s.get('exe').strip('\"') == '/app/bin/chrome') and \
-           s.get('LaunchOptions') and launch_options in s.get('LaunchOptions'):
-            print(f"Existing website shortcut found for {display_name}. Skipping creation.")
-            return True
+    def has_website(self, display_name, launch_options):
+        return any(launch_options in existing for existing in self.websites.get(display_name, ()))
+
+    def find_by_name(self, appname):
+        return self.by_name.get(appname)
+
+    def find_by_normalized_name(self, appname):
+        return self.by_normalized_name.get(appname.strip().lower())
+
+    def find_by_appid(self, appid):
+        return self.by_appid.get(appid)
+
+shortcut_index = None
+
+def index_shortcuts():
+    global shortcut_index
+    shortcut_index = ShortcutIndex(shortcuts.setdefault('shortcuts', {}))
+#End of Shortcut Index
+
+
+def check_if_shortcut_exists(display_name, exe_path, start_dir, launch_options):
+    existing = shortcut_index.find(display_name, exe_path, start_dir)
+    if existing is not None:
+        # Check if the launch options are different (for non-Chrome, no comparison is done, so add a warning here)
+        if existing.get('LaunchOptions') != launch_options:
+            print(f"Launch options for {display_name} differ from the default. This could be due to the user manually modifying the launch options. Will skip creation")
+
+        print(f"Existing shortcut found for game {display_name}. Skipping creation.")
+        return True
+
+    # Chrome (website) shortcut check
+    if shortcut_index.has_website(display_name, launch_options):
+        print(f"Existing website shortcut found for {display_name}. Skipping creation.")
+        return True
 
     return False
 
@@ -1174,7 +2260,9 @@ def check_if_shortcut_exists(display_name, exe_path, start_dir, launch_options):
 # Start of Refactoring code from the .sh file
 
 
-track_game, finalize_tracking = scan_and_track_games(logged_in_home, steamid3)
+# Set up at the start of every scan cycle by run_scan_cycle()
+track_game = None
+finalize_tracking = None
 
 
 
@@ -1230,6 +2318,18 @@ function sleep(ms) {
   return new Promise(resolve => setTimeout(resolve, ms));
 }
 
+async function fetchImageAsBase64(url) {
+  const response = await fetch(url);
+  if (!response.ok) throw new Error("HTTP " + response.status);
+  const blob = await response.blob();
+  return await new Promise((resolve, reject) => {
+    const reader = new FileReader();
+    reader.onload = () => resolve(reader.result.split(",", 2)[1]);
+    reader.onerror = () => reject(reader.error);
+    reader.readAsDataURL(blob);
+  });
+}
+
 window.createShortcut = async function(data) {
   console.log("createShortcut called with", data);
 
@@ -1293,9 +2393,18 @@ window.createShortcut = async function(data) {
     ];
 
     for (const art of artworks) {
-      if (data[art.key]) {
-        const format = detectImageFormat(data[art.key]);
-        await SteamClient.Apps.SetCustomArtworkForApp(shortcutId, data[art.key], format, art.type);
+      let image = data[art.key];
+      // Artwork served from the grid folder by the scanner
+      if (!image && data[art.key + "Url"]) {
+        try {
+          image = await fetchImageAsBase64(data[art.key + "Url"]);
+        } catch (fetchErr) {
+          console.warn(`Failed to fetch ${art.key} artwork:`, fetchErr);
+        }
+      }
+      if (image) {
+        const format = detectImageFormat(image);
+        await SteamClient.Apps.SetCustomArtworkForApp(shortcutId, image, format, art.type);
         console.log(`${art.key} artwork set as ${format}`);
       }
     }
@@ -1405,7 +2514,39 @@ window.createShortcut = async function(data) {
     return { success: false, message: e.message || e.toString() };
   }
 };
-"""
+
+// Batch entry point: creates the shortcuts one after another and returns one result per entry, in the same order
+window.createShortcuts = async function(entries) {
+  const results = [];
+  for (const data of entries) {
+    try {
+      results.push(await window.createShortcut(data));
+    } catch (e) {
+      results.push({ success: false, message: e.message || e.toString() });
+    }
+  }
+  return results;
+};
+
+// Batch removal: returns one result per removal, in the same order. A removal with confirm set goes through
+// Steam's own uninstall dialog, the others are removed right away
+window.removeShortcuts = async function(removals) {
+  const results = [];
+  for (const { appid, confirm } of removals) {
+    try {
+      if (confirm) {
+        SteamClient.URL.ExecuteSteamURL(`steam://uninstall/${appid}`);
+      } else {
+        await SteamClient.Apps.RemoveShortcut(appid);
+      }
+      results.push({ success: true, appid, confirm });
+    } catch (e) {
+      results.push({ success: false, appid, confirm, message: e.message || e.toString() });
+    }
+  }
+  return results;
+};
+"""
 
 
 
@@ -1875,7 +3016,7 @@ def fetch_targets(host, port, max_retries=15, base_delay=2):
     """Fetch debugger targets from Steam CEF debugger, with retry logic.
 
     Steam's CEF debugger on port 8080 may not be listening on first run.
-    Retries with exponential backoff (capped at 10s) up to max_retries times.
+    Retries with jittered exponential backoff (capped at 10s) up to max_retries times.
 
     Old behavior: called sys.exit(0) on any connection failure (silent exit).
     New behavior: retries up to max_retries times, then raises the last error.
@@ -1885,31 +3026,27 @@ def fetch_targets(host, port, max_retries=15, base_delay=2):
     last_error = None
     for attempt in range(max_retries):
         try:
-            conn = http.client.HTTPConnection(host, port, timeout=5)
-            conn.request("GET", "/json")
-            resp = conn.getresponse()
+            resp = http_request("GET", f"http://{host}:{port}/json", timeout=5, attempts=1)
 
             if resp.status != 200:
                 msg = f"Failed to fetch targets: {resp.status} {resp.reason}"
                 print(msg)
                 raise Exception(msg)
 
-            data = resp.read()
-            targets = json.loads(data)
+            targets = json.loads(resp.data)
 
             if attempt > 0:
                 print(f"Connected to Steam debugger on attempt {attempt + 1}/{max_retries}")
 
             return targets
 
-        except (ConnectionRefusedError, socket.timeout,
-                http.client.CannotSendRequest, http.client.RemoteDisconnected,
+        except (ConnectionRefusedError, socket.timeout, urllib3.exceptions.HTTPError,
                 OSError, Exception) as e:
             last_error = e
             if attempt < max_retries - 1:
-                delay = min(base_delay * (attempt + 1), 10)
+                delay = backoff_delay(attempt, base_delay, 10)
                 print(f"Steam debugger not ready (attempt {attempt + 1}/{max_retries}), "
-                      f"retrying in {delay}s... ({e})")
+                      f"retrying in {delay:.1f}s... ({e})")
                 time.sleep(delay)
             else:
                 print(f"ERROR: Could not connect to Steam debugger at {host}:{port} "
@@ -1918,12 +3055,6 @@ def fetch_targets(host, port, max_retries=15, base_delay=2):
                 print(f"  -dev -cef-enable-debugging -cef-single-process")
                 raise last_error
 
-        finally:
-            try:
-                conn.close()
-            except:
-                pass
-
 # Find websocket debugger URL for the target title
 def get_ws_url_by_title(host, port, title):
     targets = fetch_targets(host, port)
@@ -1965,173 +3096,432 @@ def create_websocket_connection(ws_url):
 
     return sock
 
-# Send a text frame (masked) over WebSocket
-def send_ws_text(sock, message):
-    frame = bytearray()
-    frame.append(0x81)  # FIN + opcode text frame
-    length = len(message)
-    mask_bit = 0x80
+#WebSocket frames
+WS_OP_CONTINUATION = 0x0
+WS_OP_TEXT = 0x1
+WS_OP_BINARY = 0x2
+WS_OP_CLOSE = 0x8
+WS_OP_PING = 0x9
+WS_OP_PONG = 0xA
+WS_RECV_SIZE = 65536
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# XOR the whole payload with the repeated 4 byte key at once instead of byte by byte
+def mask_payload(data, mask_key):
+    length = len(data)
+    if not length:
+        return b""
+    if numpy is not None and length >= 4096:
+        key = numpy.frombuffer(mask_key * (length // 4 + 1), dtype=numpy.uint8, count=length)
+        return numpy.bitwise_xor(numpy.frombuffer(data, dtype=numpy.uint8), key).tobytes()
+    key = (mask_key * (length // 4 + 1))[:length]
+    return (int.from_bytes(data, 'little') ^ int.from_bytes(key, 'little')).to_bytes(length, 'little')
+
+def encode_ws_frame(opcode, payload, fin=True):
+    header = bytearray()
+    header.append((0x80 if fin else 0) | opcode)
+    length = len(payload)
+    mask_bit = 0x80  # Client frames are always masked
 
     if length <= 125:
-        frame.append(length | mask_bit)
+        header.append(length | mask_bit)
     elif length <= 65535:
-        frame.append(126 | mask_bit)
-        frame += length.to_bytes(2, 'big')
+        header.append(126 | mask_bit)
+        header += length.to_bytes(2, 'big')
     else:
-        frame.append(127 | mask_bit)
-        frame += length.to_bytes(8, 'big')
+        header.append(127 | mask_bit)
+        header += length.to_bytes(8, 'big')
 
     mask_key = os.urandom(4)
-    frame += mask_key
+    header += mask_key
+    return bytes(header) + mask_payload(payload, mask_key)
+
+# Send a text frame (masked) over WebSocket
+def send_ws_text(sock, message):
+    sock.sendall(encode_ws_frame(WS_OP_TEXT, message.encode('utf-8')))
+
+# Keeps whatever a recv returned past the current frame, so one recv can feed many frames
+class WebSocketReader:
+    def __init__(self, sock, send_lock=None):
+        self.sock = sock
+        self.send_lock = send_lock or threading.Lock()
+        self.buffer = bytearray()
+        self.pos = 0
+
+    def fill(self, needed):
+        while len(self.buffer) - self.pos < needed:
+            chunk = self.sock.recv(WS_RECV_SIZE)
+            if not chunk:
+                return False
+            if self.pos:
+                del self.buffer[:self.pos]
+                self.pos = 0
+            self.buffer += chunk
+        return True
 
-    msg_bytes = message.encode('utf-8')
-    masked_bytes = bytearray(b ^ mask_key[i % 4] for i, b in enumerate(msg_bytes))
-    frame += masked_bytes
+    def take(self, size):
+        data = bytes(self.buffer[self.pos:self.pos + size])
+        self.pos += size
+        return data
 
-    sock.send(frame)
+    # Returns (fin, opcode, payload) or None when the connection ended
+    def read_frame(self):
+        if not self.fill(2):
+            return None
+        first, second = self.buffer[self.pos], self.buffer[self.pos + 1]
+        header_len = 2
+        payload_len = second & 0x7f
+        if payload_len == 126:
+            header_len = 4
+        elif payload_len == 127:
+            header_len = 10
+        masked = second & 0x80
+        if masked:
+            header_len += 4
+        if not self.fill(header_len):
+            return None
 
-# Receive a single text message from WebSocket
-def recv_ws_message(sock):
-    first_byte = sock.recv(1)
-    if not first_byte:
-        return None
-    fin = (first_byte[0] & 0x80) >> 7
-    opcode = first_byte[0] & 0x0f
-
-    if opcode == 0x8:
-        return None  # Close frame
-    if opcode != 0x1:
-        return None  # Not text frame
-
-    second_byte = sock.recv(1)
-    masked = (second_byte[0] & 0x80) >> 7
-    payload_len = second_byte[0] & 0x7f
-
-    if payload_len == 126:
-        extended = sock.recv(2)
-        payload_len = int.from_bytes(extended, 'big')
-    elif payload_len == 127:
-        extended = sock.recv(8)
-        payload_len = int.from_bytes(extended, 'big')
-
-    if masked:
-        mask_key = sock.recv(4)
-    else:
-        mask_key = None
+        if payload_len == 126:
+            payload_len = int.from_bytes(self.buffer[self.pos + 2:self.pos + 4], 'big')
+        elif payload_len == 127:
+            payload_len = int.from_bytes(self.buffer[self.pos + 2:self.pos + 10], 'big')
+        mask_key = bytes(self.buffer[self.pos + header_len - 4:self.pos + header_len]) if masked else None
+        self.pos += header_len
 
-    payload = bytearray()
-    while len(payload) < payload_len:
-        chunk = sock.recv(payload_len - len(payload))
-        if not chunk:
-            break
-        payload.extend(chunk)
+        if not self.fill(payload_len):
+            return None
+        payload = self.take(payload_len)
+        if mask_key:
+            payload = mask_payload(payload, mask_key)
+        return bool(first & 0x80), first & 0x0f, payload
+
+    def send_frame(self, opcode, payload):
+        with self.send_lock:
+            self.sock.sendall(encode_ws_frame(opcode, payload))
+
+    # Returns the next complete text or binary message, None once the connection is closed
+    def recv_message(self):
+        fragments = []
+        message_opcode = None
+        while True:
+            frame = self.read_frame()
+            if frame is None:
+                return None
+            fin, opcode, payload = frame
+
+            if opcode == WS_OP_PING:
+                self.send_frame(WS_OP_PONG, payload)
+                continue
+            if opcode == WS_OP_PONG:
+                continue
+            if opcode == WS_OP_CLOSE:
+                try:
+                    self.send_frame(WS_OP_CLOSE, payload[:2])
+                except OSError:
+                    pass
+                return None
+
+            if opcode != WS_OP_CONTINUATION:
+                message_opcode = opcode
+                fragments = []
+            elif message_opcode is None:
+                continue  # Continuation of a message we never saw the start of
+            fragments.append(payload)
+            if not fin:
+                continue
+
+            data = b"".join(fragments)
+            if message_opcode == WS_OP_TEXT:
+                return data.decode('utf-8')
+            return data
 
-    if masked and mask_key:
-        payload = bytearray(b ^ mask_key[i % 4] for i, b in enumerate(payload))
+def run_websocket_benchmark(size=1024 * 1024, rounds=5):
+    def legacy_mask(data, mask_key):
+        return bytearray(b ^ mask_key[i % 4] for i, b in enumerate(data))
+
+    payload = json.dumps({"Grid": base64.b64encode(os.urandom(size * 3 // 4)).decode('utf-8')}).encode('utf-8')
+    mask_key = os.urandom(4)
+    assert bytes(legacy_mask(payload, mask_key)) == mask_payload(payload, mask_key)
+    print(f"Masking a {len(payload)} byte payload, {rounds} rounds (numpy {'available' if numpy else 'not available'})")
 
-    return payload.decode('utf-8')
+    for name, func in (("per-byte", legacy_mask), ("int.from_bytes", mask_payload)):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            func(payload, mask_key)
+        print(f"  {name}: {(time.perf_counter() - started) / rounds * 1000:.2f} ms per payload")
 
+    # Full round trip through a socket pair: encode, send, buffered read and unmask
+    server, client = socket.socketpair()
+    try:
+        frames = [encode_ws_frame(WS_OP_TEXT, payload) for _ in range(rounds)]
+        sender = threading.Thread(target=lambda: [server.sendall(frame) for frame in frames], daemon=True)
+        reader = WebSocketReader(client)
+        started = time.perf_counter()
+        sender.start()
+        for _ in range(rounds):
+            reader.recv_message()
+        sender.join()
+        print(f"  frame round trip: {(time.perf_counter() - started) / rounds * 1000:.2f} ms per message")
+    finally:
+        server.close()
+        client.close()
+#End of WebSocket frames
 
 
 
 
-# Inject JS code and call createShortcut(data) directly
-def recv_ws_message_for_id(sock, expected_id):
-    while True:
-        message = recv_ws_message(sock)
-        if message is None:
-            return None
+
+#DevTools client
+# One long-lived connection per Steam CEF target. A reader thread hands replies to the Future waiting on their id,
+# everything else (console events and such) goes to a separate queue
+DEVTOOLS_TIMEOUT = 30
+DEVTOOLS_EVENT_QUEUE = 1000
+
+class DevToolsClient:
+    def __init__(self, ws_url):
+        self.ws_url = ws_url
+        self.sock = create_websocket_connection(ws_url)
+        self.ids = itertools.count(1)
+        self.pending = {}
+        # lock only guards pending and alive, send_lock keeps whole frames together on the socket. A large send
+        # must not hold up the reader thread handing out replies or answering pings
+        self.lock = threading.Lock()
+        self.send_lock = threading.Lock()
+        self.reader = WebSocketReader(self.sock, self.send_lock)
+        self.events = queue.Queue(maxsize=DEVTOOLS_EVENT_QUEUE)
+        self.alive = True
+        threading.Thread(target=self.read_loop, name="devtools-reader", daemon=True).start()
+
+    def read_loop(self):
+        try:
+            while True:
+                message = self.reader.recv_message()
+                if message is None:
+                    break
+                try:
+                    data = json.loads(message)
+                except ValueError:
+                    continue
+
+                future = None
+                if "id" in data:
+                    with self.lock:
+                        future = self.pending.pop(data["id"], None)
+                if future is not None:
+                    future.set_result(data)
+                else:
+                    self.queue_event(data)
+        except Exception as e:
+            if self.alive:
+                print(f"DevTools connection to {self.ws_url} lost: {e}")
+        finally:
+            self.shutdown()
+
+    def queue_event(self, data):
+        # Nobody reads old events once the queue is full, drop the oldest
+        try:
+            self.events.put_nowait(data)
+        except queue.Full:
+            try:
+                self.events.get_nowait()
+                self.events.put_nowait(data)
+            except (queue.Empty, queue.Full):
+                pass
+
+    def next_event(self, timeout=None):
+        return self.events.get(timeout=timeout)
+
+    def send(self, method, params=None):
+        future = Future()
+        with self.lock:
+            if not self.alive:
+                raise ConnectionError(f"DevTools connection to {self.ws_url} is closed")
+            request_id = next(self.ids)
+            self.pending[request_id] = future
+        future.request_id = request_id
+        message = {"id": request_id, "method": method}
+        if params:
+            message["params"] = params
         try:
-            data = json.loads(message)
-            if data.get("id") == expected_id:
-                return data
-            # Otherwise, it’s an event or unrelated message — ignore and continue waiting
+            data = json.dumps(message)
+            with self.send_lock:
+                send_ws_text(self.sock, data)
         except Exception:
-            continue
+            with self.lock:
+                self.pending.pop(request_id, None)
+            raise
+        return future
+
+    def wait(self, future, timeout=DEVTOOLS_TIMEOUT):
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            with self.lock:
+                self.pending.pop(future.request_id, None)
+            raise TimeoutError(f"No reply from {self.ws_url} within {timeout}s")
+
+    def call(self, method, params=None, timeout=DEVTOOLS_TIMEOUT):
+        return self.wait(self.send(method, params), timeout)
+
+    def evaluate_async(self, expression, await_promise=False, return_by_value=False):
+        params = {"expression": expression}
+        if await_promise:
+            params["awaitPromise"] = True
+        if return_by_value:
+            params["returnByValue"] = True
+        return self.send("Runtime.evaluate", params)
+
+    def evaluate(self, expression, await_promise=False, return_by_value=False, timeout=DEVTOOLS_TIMEOUT):
+        return self.wait(self.evaluate_async(expression, await_promise, return_by_value), timeout)
+
+    def shutdown(self):
+        with self.lock:
+            self.alive = False
+            pending, self.pending = self.pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError(f"DevTools connection to {self.ws_url} closed"))
+        try:
+            self.sock.close()
+        except Exception:
+            pass
+
+    def close(self):
+        self.alive = False
+        try:
+            # Wakes the reader thread up, it finishes the shutdown
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except Exception:
+            pass
+        self.shutdown()
+
+devtools_clients = {}
+devtools_lock = threading.Lock()
+
+def get_devtools_client(title):
+    with devtools_lock:
+        client = devtools_clients.get(title)
+    if client is not None and client.alive:
+        return client
+
+    # Finding the target can take several retries, callers for other targets should not wait on that
+    ws_url = get_ws_url_by_title(WS_HOST, WS_PORT, title)
+    print(f"Connecting to WebSocket URL: {ws_url}")
+    client = DevToolsClient(ws_url)
+    with devtools_lock:
+        existing = devtools_clients.get(title)
+        if existing is None or not existing.alive:
+            devtools_clients[title] = client
+            return client
+    # Another thread connected first
+    client.close()
+    return existing
+
+# Steam recreated its pages, the next get_devtools_client() call connects again
+def close_devtools_clients():
+    with devtools_lock:
+        clients = list(devtools_clients.values())
+        devtools_clients.clear()
+    for client in clients:
+        client.close()
+
+def evaluate_value(response):
+    return (response or {}).get("result", {}).get("result", {}).get("value")
+#End of DevTools client
 
 
 ###Shortcut Creation ONLY
-eval_id_counter = itertools.count(1000)
-def inject_and_create_shortcut(ws_socket, shortcut_data):
-    try:
-        # Generate unique IDs
-        enable_id = next(eval_id_counter)
-        injected_check_id = next(eval_id_counter)
-        inject_js_id = next(eval_id_counter)
-        create_shortcut_id = next(eval_id_counter)
-
-        # Enable Runtime domain
-        send_ws_text(ws_socket, json.dumps({
-            "id": enable_id,
-            "method": "Runtime.enable"
-        }))
-        recv_ws_message_for_id(ws_socket, enable_id)
-
-        # Step 0: Check if JS is already injected
-        send_ws_text(ws_socket, json.dumps({
-            "id": injected_check_id,
-            "method": "Runtime.evaluate",
-            "params": {
-                "expression": "window.__injectedSteamMod === true",
-                "returnByValue": True
-            }
-        }))
-        injected_check = recv_ws_message_for_id(ws_socket, injected_check_id)
-        already_injected = injected_check.get("result", {}).get("result", {}).get("value") is True
+# Upper bound for the JSON of one createShortcuts() call, artwork makes entries large
+SHORTCUT_BATCH_BYTES = 16 * 1024 * 1024
+SHORTCUT_BATCH_SIZE = 50
+# Bumped whenever the functions in JS_CODE change
+SHORTCUT_JS_VERSION = 2
+
+def inject_shortcut_js(client):
+    # Step 0: Check if JS is already injected
+    # Steam's JS context outlives the scanner, a copy injected by an older version is replaced
+    injected_check = client.evaluate(f"window.__injectedSteamMod === true && window.__nslShortcutJsVersion === {SHORTCUT_JS_VERSION}", return_by_value=True)
+    if evaluate_value(injected_check) is True:
+        print("JS already injected. Skipping re-injection.")
+        return True
 
-        if not already_injected:
-            # Step 1: Inject JS
-            wrapped_code = f"(async () => {{ {JS_CODE}; window.__injectedSteamMod = true; return 'Injection successful!'; }})()"
-
-            send_ws_text(ws_socket, json.dumps({
-                "id": inject_js_id,
-                "method": "Runtime.evaluate",
-                "params": {
-                    "expression": wrapped_code,
-                    "awaitPromise": True,
-                }
-            }))
-            injection_response = recv_ws_message_for_id(ws_socket, inject_js_id)
-            if not injection_response or injection_response.get("result", {}).get("result", {}).get("value") != "Injection successful!":
-                print("JS injection failed or response invalid:")
-                print(injection_response)
-                return None
-            print("JS injected successfully.")
-        else:
-            print("JS already injected. Skipping re-injection.")
-
-        # Step 2: Call createShortcut with shortcut_data
-        shortcut_json_str = json.dumps(shortcut_data)
-        eval_expression = f"window.createShortcut({shortcut_json_str})"
-
-        send_ws_text(ws_socket, json.dumps({
-            "id": create_shortcut_id,
-            "method": "Runtime.evaluate",
-            "params": {
-                "expression": eval_expression,
-                "awaitPromise": True,
-                "returnByValue": True
-            }
-        }))
+    # Step 1: Inject JS
+    wrapped_code = f"(async () => {{ {JS_CODE}; window.__injectedSteamMod = true; window.__nslShortcutJsVersion = {SHORTCUT_JS_VERSION}; return 'Injection successful!'; }})()"
 
-        shortcut_result = recv_ws_message_for_id(ws_socket, create_shortcut_id)
-        if not shortcut_result:
-            print("No response from createShortcut call.")
-            return None
+    injection_response = client.evaluate(wrapped_code, await_promise=True)
+    if not injection_response or evaluate_value(injection_response) != "Injection successful!":
+        print("JS injection failed or response invalid:")
+        print(injection_response)
+        return False
+    print("JS injected successfully.")
+    return True
+
+def chunk_shortcut_payloads(shortcut_data_list):
+    chunk = []
+    chunk_bytes = 0
+    for shortcut_data in shortcut_data_list:
+        payload = json.dumps(shortcut_data)
+        if chunk and (chunk_bytes + len(payload) > SHORTCUT_BATCH_BYTES or len(chunk) >= SHORTCUT_BATCH_SIZE):
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+        chunk.append(payload)
+        chunk_bytes += len(payload) + 1
+    if chunk:
+        yield chunk
+
+# Returns one createShortcut() result per entry ({success, shortcutId, m_gameid} or {success: false, message}), None if the call failed
+def create_shortcuts(client, shortcut_data_list):
+    results = []
+    try:
+        if not inject_shortcut_js(client):
+            return [None] * len(shortcut_data_list)
+    except Exception as e:
+        print(f"Exception during shortcut injection: {e}")
+        return [None] * len(shortcut_data_list)
 
-        return shortcut_result
+    for chunk in chunk_shortcut_payloads(shortcut_data_list):
+        print(f"Creating {len(chunk)} shortcuts in one call...")
+        try:
+            # Every shortcut waits for Steam a few times, give big chunks more time
+            response = client.evaluate(f"window.createShortcuts([{','.join(chunk)}])",
+                                       await_promise=True, return_by_value=True, timeout=DEVTOOLS_TIMEOUT + 5 * len(chunk))
+            values = evaluate_value(response)
+            if isinstance(values, list) and len(values) == len(chunk):
+                results.extend(values)
+                continue
+            print("createShortcuts returned unexpected structure:", response)
+        except Exception as e:
+            print(f"Exception during shortcut creation: {e}")
+        results.extend([None] * len(chunk))
+    return results
 
+# removals is a list of {appid, confirm}. Returns one removeShortcuts() result per removal ({success, appid, confirm, message}),
+# None if the call failed
+def remove_shortcuts(client, removals):
+    try:
+        if not inject_shortcut_js(client):
+            return None
+        response = client.evaluate(f"window.removeShortcuts({json.dumps(removals)})",
+                                   await_promise=True, return_by_value=True, timeout=DEVTOOLS_TIMEOUT + len(removals))
+        values = evaluate_value(response)
+        if isinstance(values, list) and len(values) == len(removals):
+            return values
+        print("removeShortcuts returned unexpected structure:", response)
     except Exception as e:
-        print(f"Exception during shortcut injection or creation: {e}")
-        return None
+        print(f"Exception during shortcut removal: {e}")
+    return None
 ###END of Shortcut creation
 
 
 
 
 ###For Uninstall Notifications only
-def send_launcher_notification(ws_socket, message_text, removed_apps):
-    notify_id = next(eval_id_counter)
+def send_launcher_notification(client, message_text, removed_apps):
     launcher_list = list(removed_apps.keys())
     js_launchers = json.dumps(launcher_list)
     js_message = json.dumps(message_text)
@@ -2194,57 +3584,20 @@ def send_launcher_notification(ws_socket, message_text, removed_apps):
     }})();
     """
 
-    send_ws_text(ws_socket, json.dumps({
-        "id": notify_id,
-        "method": "Runtime.evaluate",
-        "params": {
-            "expression": JS_notify,
-            "awaitPromise": False,
-            "returnByValue": True
-        }
-    }))
-
-    result = recv_ws_message_for_id(ws_socket, notify_id)
+    result = client.evaluate(JS_notify, return_by_value=True)
     return result
 
 
-def inject_js_only(ws_socket):
+def inject_js_only(client):
     try:
-        enable_id = next(eval_id_counter)
-        inject_check_id = next(eval_id_counter)
-
-        # Enable Runtime domain
-        send_ws_text(ws_socket, json.dumps({
-            "id": enable_id,
-            "method": "Runtime.enable"
-        }))
-        recv_ws_message_for_id(ws_socket, enable_id)
-
         # Check if JS is already injected
-        send_ws_text(ws_socket, json.dumps({
-            "id": inject_check_id,
-            "method": "Runtime.evaluate",
-            "params": {
-                "expression": "window.__injectedSteamMod === true",
-                "returnByValue": True
-            }
-        }))
-        injected_check = recv_ws_message_for_id(ws_socket, inject_check_id)
-        already_injected = injected_check.get("result", {}).get("result", {}).get("value") is True
+        injected_check = client.evaluate("window.__injectedSteamMod === true", return_by_value=True)
+        already_injected = evaluate_value(injected_check) is True
 
         if not already_injected:
             print("Re-injecting Steam JS...")
-            inject_id = next(eval_id_counter)
             wrapped_code = f"(async () => {{ {JS_notify}; window.__injectedSteamMod = true; return 'Injected Successfully'; }})()"
-            send_ws_text(ws_socket, json.dumps({
-                "id": inject_id,
-                "method": "Runtime.evaluate",
-                "params": {
-                    "expression": wrapped_code,
-                    "awaitPromise": True,
-                }
-            }))
-            result = recv_ws_message_for_id(ws_socket, inject_id)
+            result = client.evaluate(wrapped_code, await_promise=True)
             print("Injection result:", result)
         else:
             print("JS already injected. No re-injection needed.")
@@ -2256,20 +3609,6 @@ def inject_js_only(ws_socket):
 
 
 #Watch only
-ws_url = get_ws_url_by_title(WS_HOST, WS_PORT, TARGET_TITLE)
-
-ws_socket = create_websocket_connection(ws_url)
-
-eval_id_counter = itertools.count(1)
-enable_id = next(eval_id_counter)
-
-# Enable Runtime
-send_ws_text(ws_socket, json.dumps({
-    "id": enable_id,
-    "method": "Runtime.enable"
-}))
-recv_ws_message_for_id(ws_socket, enable_id)
-
 watch_code = r'''if (!window.__watcherInjected) {
     window.__watcherInjected = true;
 
@@ -2324,35 +3663,20 @@ watch_code = r'''if (!window.__watcherInjected) {
     })();
 }'''
 
-def inject_watcher_once(ws_socket, watch_code):
-    inject_id = next(eval_id_counter)
-    check_id = next(eval_id_counter)
-
+def inject_watcher_once(client, watch_code):
     # Check if watcher already injected
-    send_ws_text(ws_socket, json.dumps({
-        "id": check_id,
-        "method": "Runtime.evaluate",
-        "params": {
-            "expression": "window.__watcherInjected === true",
-            "returnByValue": True
-        }
-    }))
-    result = recv_ws_message_for_id(ws_socket, check_id)
-    if result.get("result", {}).get("result", {}).get("value") is True:
+    result = client.evaluate("window.__watcherInjected === true", return_by_value=True)
+    if evaluate_value(result) is True:
         print("Watcher already running. No reinjection.")
         return
 
     # Inject watcher
-    send_ws_text(ws_socket, json.dumps({
-        "id": inject_id,
-        "method": "Runtime.evaluate",
-        "params": {
-            "expression": watch_code,
-        }
-    }))
-    recv_ws_message_for_id(ws_socket, inject_id)
+    client.evaluate(watch_code)
     print("Watcher injected and running.")
-inject_watcher_once(ws_socket, watch_code)
+
+def inject_watcher():
+    client = get_devtools_client(TARGET_TITLE)
+    inject_watcher_once(client, watch_code)
 ###end of watch
 
 
@@ -2360,25 +3684,11 @@ inject_watcher_once(ws_socket, watch_code)
 
 
 ###PLAYTIME ONLY
-# Ensure eval_id_counter exists
-eval_id_counter = iter(range(1, 1000000))
-
-def inject_playtime_code(ws_socket):
+def inject_playtime_code(client):
     try:
-        inject_id = next(eval_id_counter)
-
         wrapped_code = f"(async () => {{ {PLAYTIME_CODE}; return 'Playtime injection done'; }})()"
 
-        send_ws_text(ws_socket, json.dumps({
-            "id": inject_id,
-            "method": "Runtime.evaluate",
-            "params": {
-                "expression": wrapped_code,
-                "awaitPromise": True
-            }
-        }))
-
-        response = recv_ws_message_for_id(ws_socket, inject_id)
+        response = client.evaluate(wrapped_code, await_promise=True)
         print("Playtime injection response:", response)
         return response
     except Exception as e:
@@ -2386,16 +3696,12 @@ def inject_playtime_code(ws_socket):
         return None
 
 # Usage
-try:
-    ws_url = get_ws_url_by_title(WS_HOST, WS_PORT, TARGET_TITLE)
-    ws_socket = create_websocket_connection(ws_url)
-
-    send_ws_text(ws_socket, json.dumps({"id": 1, "method": "Runtime.enable"}))
-    recv_ws_message_for_id(ws_socket, 1)
-
-    inject_playtime_code(ws_socket)
-except Exception as e:
-    print("Failed to connect or inject Playtime code:", e)
+def inject_playtime():
+    try:
+        client = get_devtools_client(TARGET_TITLE)
+        inject_playtime_code(client)
+    except Exception as e:
+        print("Failed to connect or inject Playtime code:", e)
 
 #END OF PLAYTIME
 
@@ -2404,25 +3710,11 @@ except Exception as e:
 
 
 ###THEMEMUSIC ONLY
-# Usage
-eval_id_counter = iter(range(1, 1000000))  # Ensure counter exists
-
-def inject_thememusic_code(ws_socket):
+def inject_thememusic_code(client):
     try:
-        inject_id = next(eval_id_counter)
-
         wrapped_code = f"(async () => {{ {THEMEMUSIC_CODE}; return 'ThemeMusic injection done'; }})()"
 
-        send_ws_text(ws_socket, json.dumps({
-            "id": inject_id,
-            "method": "Runtime.evaluate",
-            "params": {
-                "expression": wrapped_code,
-                "awaitPromise": True
-            }
-        }))
-
-        response = recv_ws_message_for_id(ws_socket, inject_id)
+        response = client.evaluate(wrapped_code, await_promise=True)
         print("ThemeMusic injection response:", response)
         return response
     except Exception as e:
@@ -2430,16 +3722,12 @@ def inject_thememusic_code(ws_socket):
         return None
 
 # Usage
-try:
-    ws_url = get_ws_url_by_title(WS_HOST, WS_PORT, TARGET_TITLE)
-    ws_socket = create_websocket_connection(ws_url)
-
-    send_ws_text(ws_socket, json.dumps({"id": 1, "method": "Runtime.enable"}))
-    recv_ws_message_for_id(ws_socket, 1)
-
-    inject_thememusic_code(ws_socket)
-except Exception as e:
-    print("Failed to connect or inject ThemeMusic code:", e)
+def inject_thememusic():
+    try:
+        client = get_devtools_client(TARGET_TITLE)
+        inject_thememusic_code(client)
+    except Exception as e:
+        print("Failed to connect or inject ThemeMusic code:", e)
 
 #END OF THEMEMUSIC
 
@@ -3561,42 +4849,24 @@ METADATA_CODE = r"""
 })();
 """
 
-def inject_metadata_code(ws_socket):
-    inject_id = next(eval_id_counter)
-
+def inject_metadata_code(client):
     wrapped_code = f"""
     (function () {{
         {METADATA_CODE}
     }})();
     """
 
-    send_ws_text(ws_socket, json.dumps({
-        "id": inject_id,
-        "method": "Runtime.evaluate",
-        "params": {
-            "expression": wrapped_code,
-            "awaitPromise": True
-        }
-    }))
-
-    recv_ws_message(ws_socket)
-
+    client.evaluate(wrapped_code, await_promise=True)
 
-for target in (TARGET_TITLE2, TARGET_TITLE3):
-    try:
-        ws_url = get_ws_url_by_title(WS_HOST, WS_PORT, target)
-        ws_socket = create_websocket_connection(ws_url)
-
-        send_ws_text(ws_socket, json.dumps({
-            "id": 1,
-            "method": "Runtime.enable"
-        }))
-        recv_ws_message(ws_socket)
 
-        inject_metadata_code(ws_socket)
+def inject_metadata():
+    for target in (TARGET_TITLE2, TARGET_TITLE3):
+        try:
+            client = get_devtools_client(target)
+            inject_metadata_code(client)
 
-    except Exception as e:
-        print(f"Metadata injection failed for {target}: {e}")
+        except Exception as e:
+            print(f"Metadata injection failed for {target}: {e}")
 
 
 
@@ -3821,111 +5091,96 @@ def read_scan_state_from_file() -> str | None:
         return None
     return None
 
-eval_id_counter = itertools.count(1000)
-
-def inject_scanner_code(sock, state):
+def inject_scanner_code(client, state):
     state_js = state if state in ("ON","OFF","MANUAL") else "OFF"
-    send_ws_text(sock, json.dumps({
-        "id": next(eval_id_counter),
-        "method": "Runtime.evaluate",
-        "params": {
-            "expression": f"""
+    client.evaluate(f"""
                 window.__scan_state = '{state_js}';
                 (function(){{ {SCANNER_CODE} }})();
-            """,
-            "awaitPromise": True
-        }
-    }))
-    recv_ws_message(sock)
+            """, await_promise=True)
 
-def set_initial_state(sock):
+def set_initial_state(client):
     state_from_envars = read_scan_state_from_file()
-    send_ws_text(sock, json.dumps({
-        "id": next(eval_id_counter),
-        "method": "Runtime.evaluate",
-        "params": {"expression": f"window.__scan_state = '{state_from_envars}'"}
-    }))
+    client.evaluate(f"window.__scan_state = '{state_from_envars}'")
     #write_scan_state_to_file(state_from_envars)
     return state_from_envars
 
-def sync_frontend_state_to_envars(sock):
+def sync_frontend_state_to_envars(client):
+    event = evaluate_value(client.evaluate("window.__scan_event", return_by_value=True, timeout=10))
+    if event == "MANUAL":
+        client.evaluate_async("window.__scan_event = null")
+        write_scan_state_to_file("MANUAL")
+        return "MANUAL"
 
-    request_id = next(eval_id_counter)
-    send_ws_text(sock, json.dumps({
-        "id": request_id,
-        "method": "Runtime.evaluate",
-        "params": {"expression": "window.__scan_event", "returnByValue": True}
-    }))
+    state = evaluate_value(client.evaluate("window.__scan_state", return_by_value=True, timeout=10))
+    if state is None:
+        return None
+    write_scan_state_to_file(state)
+    return state
 
-    while True:
-        msg = recv_ws_message(sock)
-        if not msg:
-            time.sleep(0.01)
-            continue
-        data = json.loads(msg)
-        if data.get("id") != request_id:
-            continue
 
-        event = data.get("result", {}).get("result", {}).get("value")
-        if event == "MANUAL":
+scanner_clients = []
 
-            send_ws_text(sock, json.dumps({
-                "id": next(eval_id_counter),
-                "method": "Runtime.evaluate",
-                "params": {"expression": "window.__scan_event = null"}
-            }))
-            write_scan_state_to_file("MANUAL")
-            return "MANUAL"
+def connect_scanner_controls():
+    global scanner_clients
 
-        break
+    scanner_clients = []
+    for title in TARGET_TITLES:
+        try:
+            client = get_devtools_client(title)
 
-    request_id = next(eval_id_counter)
-    send_ws_text(sock, json.dumps({
-        "id": request_id,
-        "method": "Runtime.evaluate",
-        "params": {"expression": "window.__scan_state", "returnByValue": True}
-    }))
+            state = sync_frontend_state_to_envars(client)
 
-    while True:
-        msg = recv_ws_message(sock)
-        if not msg:
-            time.sleep(0.01)
-            continue
-        data = json.loads(msg)
-        if data.get("id") != request_id:
-            continue
-        state = data.get("result", {}).get("result", {}).get("value")
-        if state is None:
-            return None
-        write_scan_state_to_file(state)
-        return state
+            if state is None:
+                state = read_scan_state_from_file() or "OFF"
+            inject_scanner_code(client, state)
 
+            print(f"RESUMED WITH STATE for '{title}': {state}")
+            scanner_clients.append(client)
 
-sockets = []
+        except Exception as e:
+            print(f"[ERROR] Failed for '{title}': {e}")
 
-for title in TARGET_TITLES:
-    try:
-        ws_url = get_ws_url_by_title(WS_HOST, WS_PORT, title)
-        sock = create_websocket_connection(ws_url)
+# Called on every daemon heartbeat over the shared DevTools connections. Returns True when a manual scan was requested in Steam
+def sync_scanner_controls():
+    global scanner_clients
 
-        send_ws_text(sock, json.dumps({
-            "id": next(eval_id_counter),
-            "method": "Runtime.enable"
-        }))
-        recv_ws_message(sock)
+    manual_scan = False
+    alive = []
+    for client in scanner_clients:
+        try:
+            state = sync_frontend_state_to_envars(client)
+            print(f"Frontend scan state: {state}")
+            if state == "MANUAL":
+                manual_scan = True
+            alive.append(client)
+        except Exception as e:
+            print(f"[ERROR] Scanner control sync failed: {e}")
+            client.close()
+    scanner_clients = alive
+    return manual_scan
+# End of Scanner button and control for Frontend
 
-        state = sync_frontend_state_to_envars(sock)
 
-        if state is None:
-            state = read_scan_state_from_file() or "OFF"
-        inject_scanner_code(sock, state)
 
-        print(f"RESUMED WITH STATE for '{title}': {state}")
-        sockets.append(sock)
+# Injection of all frontend code, repeated by the daemon whenever Steam recreates its pages
+frontend_targets = None
 
-    except Exception as e:
-        print(f"[ERROR] Failed for '{title}': {e}")
-# End of Scanner button and control for Frontend
+def get_frontend_targets():
+    targets = fetch_targets(WS_HOST, WS_PORT, max_retries=1)
+    titles = (TARGET_TITLE, TARGET_TITLE2, TARGET_TITLE3)
+    return sorted(
+        (target.get("title"), target.get("webSocketDebuggerUrl"))
+        for target in targets
+        if target.get("title") in titles
+    )
+
+def inject_frontend_scripts():
+    # The injections share the DevTools connections, so they are all in flight at once
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="inject") as pool:
+        futures = [pool.submit(inject) for inject in (inject_watcher, inject_playtime, inject_thememusic, inject_metadata)]
+    for future in futures:
+        future.result()
+    connect_scanner_controls()
 
 
 
@@ -3942,13 +5197,6 @@ for title in TARGET_TITLES:
 app_ids = {}
 
 # Get the next available key for the shortcuts
-def get_next_available_key(shortcuts):
-    key = 0
-    while str(key) in shortcuts['shortcuts']:
-        key += 1
-    return str(key)
-
-
 def get_compat_tool_if_needed(launchoptions):
     steam_compat_marker = 'STEAM_COMPAT_DATA_PATH'
     # Check for UMU-related Proton (UMU-Proton) and return None immediately if found
@@ -3978,7 +5226,17 @@ def get_compat_tool_if_needed(launchoptions):
 
 
 
-def create_new_entry(shortcutdirectory, appname, launchoptions, startingdir, launcher_name=None):
+# Shortcuts are created in three stages: prepare_shortcut() does the cheap local work and dedupes, fetch_shortcut_artwork()
+# does the SGDB/Steam requests and commit_shortcuts() hands the new shortcuts to Steam. During a scan cycle create_new_entry()
+# only stages them, and commit_shortcut_batch() runs the artwork stage for all of them at once
+ARTWORK_WORKERS = 6
+shortcut_batch = None
+
+def begin_shortcut_batch():
+    global shortcut_batch
+    shortcut_batch = {"gate": read_shortcut_gate(), "candidates": [], "ids": set()}
+
+def read_shortcut_gate():
     gate_file = f"{logged_in_home}/.config/systemd/user/env_vars"
     scan_state = None
     try:
@@ -3989,30 +5247,35 @@ def create_new_entry(shortcutdirectory, appname, launchoptions, startingdir, lau
                     break
     except FileNotFoundError:
         print(f"[NSL] Gate file not found: {gate_file}. Allowing by default.")
+    return scan_state
 
+
+def create_new_entry(shortcutdirectory, appname, launchoptions, startingdir, launcher_name=None):
+    scan_state = shortcut_batch["gate"] if shortcut_batch is not None else read_shortcut_gate()
     if scan_state == "OFF":
         print(f"[NSL] Scan state is OFF. Skipping shortcut creation for {appname}.")
         return
 
-    global new_shortcuts_added
-    global shortcuts_updated
-    global created_shortcuts
+    candidate = prepare_shortcut(shortcutdirectory, appname, launchoptions, startingdir, launcher_name)
+    if candidate is None:
+        return
 
-    global grid64
-    global gridp64
-    global logo64
-    global hero64
-    global counter
+    if shortcut_batch is not None:
+        shortcut_batch["candidates"].append(candidate)
+        return
+
+    fetch_shortcut_artwork(candidate)
+    new_entries = commit_shortcuts([candidate])
+    return new_entries[0] if new_entries else None
 
-    grid64 = ""
-    gridp64 = ""
-    logo64 = ""
-    hero64 = ""
+
+def prepare_shortcut(shortcutdirectory, appname, launchoptions, startingdir, launcher_name=None):
+    global shortcuts_updated
 
     # Check if the launcher is installed
     if not shortcutdirectory or not appname or not launchoptions or not startingdir:
         print(f"{appname} is not installed. Skipping.")
-        return
+        return None
 
     exe_path = f"{shortcutdirectory}"
 
@@ -4028,127 +5291,215 @@ def create_new_entry(shortcutdirectory, appname, launchoptions, startingdir, lau
     if appname in ['Epic Games', 'Gog Galaxy', 'Ubisoft Connect', 'Battle.net', 'EA App', 'Amazon Games', 'itch.io', 'Legacy Games', 'Humble Bundle', 'IndieGala Client', 'Rockstar Games Launcher', 'Glyph', 'Minecraft Launcher', 'Playstation Plus', 'VK Play', 'HoYoPlay', 'Nexon Launcher', 'Game Jolt Client', 'Artix Game Launcher', 'ARC Launcher', 'PURPLE Launcher', 'Plarium Play', 'VFUN Launcher', 'Tempo Launcher', 'Pokémon Trading Card Game Live', 'Antstream Arcade', 'STOVE Client', 'Big Fish Games Manager', 'Gryphlink']:
         app_ids[appname] = unsigned_shortcut_id
 
+    # Game tracking remembers which shortcut is NSL's
+    shortcut_targets[appname] = [exe_path, startingdir, launchoptions]
+
     # Check if shortcut already exists with final values
     if check_if_shortcut_exists(appname, exe_path, startingdir, launchoptions):
         shortcuts_updated = True
-        return
-
-    # Skip artwork download for specific shortcuts
-    if appname not in ['Repair EA App']:
-        #delete_old_artwork_by_tag(appname, unsigned_shortcut_id, steamid3, logged_in_home)
-        game_id = get_game_id(appname)
-        if game_id is not None:
-            get_sgdb_art(game_id, unsigned_shortcut_id)
-
-    # Try Steam fallback artwork
-    steam_store_appid = get_steam_store_appid(appname)
-    if steam_store_appid:
-        print(f"Found Steam App ID for {appname}: {steam_store_appid}")
-        #create_steam_store_app_manifest_file(steam_store_appid, appname)
-
-        for art_type in ["icons", "logos", "heroes", "grids_600x900", "grids_920x430"]:
-            url = get_steam_fallback_url(steam_store_appid, art_type)
-            if not url:
-                print(f"Fallback URL invalid for {art_type} - No valid URL found")
-                continue
-
-            try:
-                # Use urllib to perform a HEAD request (check URL status)
-                req = urllib.request.Request(url, method='HEAD')
-                with urllib.request.urlopen(req) as response:
-                    if response.status == 200:
-                        ext = url.split('.')[-1]
-
-                        if art_type == "icons":
-                            filename = get_file_name("icons", unsigned_shortcut_id)
-                        elif art_type == "logos":
-                            filename = f"{unsigned_shortcut_id}_logo.{ext}"
-                        elif art_type == "heroes":
-                            filename = f"{unsigned_shortcut_id}_hero.{ext}"
-                        elif art_type == "grids_600x900":
-                            filename = f"{unsigned_shortcut_id}p.{ext}"
-                        elif art_type == "grids_920x430":
-                            filename = f"{unsigned_shortcut_id}.{ext}"
-                        else:
-                            continue
-
-                        file_path = f"{logged_in_home}/.steam/root/userdata/{steamid3}/config/grid/{filename}"
-
-                        # Download and use artwork directly — no file existence checks
-                        with urllib.request.urlopen(url) as img_response:
-                            img_data = img_response.read()
-
-                            if art_type == "icons":
-                                with open(file_path, 'wb') as f:
-                                    f.write(img_data)
-                                print(f"Downloaded and saved fallback icon: {filename}")
-                            else:
-                                encoded = b64encode(img_data).decode('utf-8')
-                                print(f"Downloaded fallback {art_type} as base64")
-
-                                if art_type == "logos" and not logo64:
-                                    logo64 = encoded
-                                elif art_type == "heroes" and not hero64:
-                                    hero64 = encoded
-                                elif art_type == "grids_600x900" and not gridp64:
-                                    gridp64 = encoded
-                                elif art_type == "grids_920x430" and not grid64:
-                                    grid64 = encoded
-                    else:
-                        print(f"Fallback URL invalid for {art_type} - {url}")
-            except Exception as e:
-                print(f"Error downloading fallback artwork for {art_type}: {e}")
-
-
-
-    tag_artwork_files(unsigned_shortcut_id, appname, steamid3, logged_in_home)
-
+        return None
 
+    # Two scanners found the same game in this batch
+    if shortcut_batch is not None:
+        if unsigned_shortcut_id in shortcut_batch["ids"]:
+            print(f"{appname} is already queued for creation. Skipping.")
+            return None
+        shortcut_batch["ids"].add(unsigned_shortcut_id)
 
-    new_entry = {
+    candidate = {
         'appname': appname,
         'exe': exe_path,
         'StartDir': startingdir,
-        'icon': f"{logged_in_home}/.steam/root/userdata/{steamid3}/config/grid/{get_file_name('icons', unsigned_shortcut_id)}",
         'LaunchOptions': launchoptions,
-        'WideGrid': grid64,
-        'Grid': gridp64,
-        'Hero': hero64,
-        'Logo': logo64,
+        'Launcher': launcher_name,
+        'shortcut_id': unsigned_shortcut_id,
     }
 
-    if launcher_name:
-        new_entry['Launcher'] = launcher_name
-
+    compat_tool = get_compat_tool_if_needed(launchoptions)
 
+    # Skip setting compat tool if UMU already processed it
+    if not (umu_id and umu_processed_shortcuts.get(umu_id)) and compat_tool:
+        candidate['CompatTool'] = compat_tool
 
+    return candidate
 
 
+def fetch_shortcut_artwork(candidate):
+    appname = candidate['appname']
+    unsigned_shortcut_id = candidate['shortcut_id']
+    artwork = {'WideGrid': "", 'Grid': "", 'Hero': "", 'Logo': ""}
+    candidate['artwork'] = artwork
 
-    compat_tool = get_compat_tool_if_needed(launchoptions)
+    try:
+        # Skip artwork download for specific shortcuts
+        if appname not in ['Repair EA App']:
+            #delete_old_artwork_by_tag(appname, unsigned_shortcut_id, steamid3, logged_in_home)
+            game_id = get_game_id(appname)
+            if game_id is not None:
+                for key, value in get_sgdb_art(game_id, unsigned_shortcut_id).items():
+                    artwork[key] = value or ""
+
+        # Try Steam fallback artwork
+        steam_store_appid = get_steam_store_appid(appname)
+        if steam_store_appid:
+            print(f"Found Steam App ID for {appname}: {steam_store_appid}")
+            #create_steam_store_app_manifest_file(steam_store_appid, appname)
+
+            slots = {"logos": 'Logo', "heroes": 'Hero', "grids_600x900": 'Grid', "grids_920x430": 'WideGrid'}
+            # The icon is always replaced, the rest only fills in what SteamGridDB did not have
+            art_types = ["icons"] + [art_type for art_type, slot in slots.items() if not artwork[slot]]
+
+            def fetch_fallback(art_type):
+                try:
+                    file_path = download_steam_fallback_art(steam_store_appid, art_type, unsigned_shortcut_id)
+                except Exception as e:
+                    print(f"Error downloading fallback artwork for {art_type}: {e}")
+                    return
+                if not file_path:
+                    print(f"Fallback URL invalid for {art_type} - No valid URL found")
+                    return
+                if art_type != "icons":
+                    artwork[slots[art_type]] = file_path
+                print(f"Downloaded and saved fallback {art_type}: {os.path.basename(file_path)}")
+
+            with ThreadPoolExecutor(max_workers=len(art_types)) as pool:
+                list(pool.map(fetch_fallback, art_types))
+
+        tag_artwork_files(unsigned_shortcut_id, appname, steamid3, logged_in_home)
+    except Exception as e:
+        print(f"Artwork lookup failed for {appname}: {e}")
 
-    # Skip setting compat tool if UMU already processed it
-    if not (umu_id and umu_processed_shortcuts.get(umu_id)) and compat_tool:
-        new_entry['CompatTool'] = compat_tool
+    return candidate
 
 
+#Artwork server
+# Artwork stays in the grid folder and Steam fetches it from a loopback HTTP server, instead of every image
+# being base64 encoded into the createShortcut websocket message. NSL_ARTWORK_TRANSFER=base64 restores the old way.
+# A server lives for one commit_shortcuts() call and serves only the files of that batch, under a random path
+ARTWORK_KEYS = ('WideGrid', 'Grid', 'Hero', 'Logo')
+STEAM_FRONTEND_ORIGIN = "https://steamloopback.host"
 
+class ArtworkRequestHandler(http.server.BaseHTTPRequestHandler):
+    def __init__(self, *args, batch=None, **kwargs):
+        self.batch = batch
+        super().__init__(*args, **kwargs)
 
+    def do_GET(self):
+        path = self.batch.files.get(self.path)
+        data = None
+        if path is not None:
+            try:
+                with open(path, 'rb') as image_file:
+                    data = image_file.read()
+            except OSError:
+                pass
+        if data is None:
+            self.send_error(404)
+            return
 
+        self.send_response(200)
+        self.send_header("Content-Type", mimetypes.guess_type(path)[0] or "application/octet-stream")
+        self.send_header("Content-Length", str(len(data)))
+        # The request comes from Steam's own pages, which are on another origin. No other page may read the response
+        if self.headers.get("Origin") == STEAM_FRONTEND_ORIGIN:
+            self.send_header("Access-Control-Allow-Origin", STEAM_FRONTEND_ORIGIN)
+        self.end_headers()
+        self.wfile.write(data)
 
+    def log_message(self, format, *args):
+        pass
 
+class ArtworkBatch:
+    def __init__(self):
+        self.token = secrets.token_urlsafe(24)
+        # URL path -> file
+        self.files = {}
+        self.server = None
+        self.failed = False
+
+    def start(self):
+        handler = functools.partial(ArtworkRequestHandler, batch=self)
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name="artwork-server", daemon=True).start()
+
+    # Returns the URL Steam fetches the file from, None if it has to be sent inline
+    def publish(self, path):
+        if self.failed or os.environ.get('NSL_ARTWORK_TRANSFER', 'url').lower() == 'base64':
+            return None
+        if self.server is None:
+            try:
+                self.start()
+            except Exception as e:
+                print(f"Could not start the artwork server, sending artwork inline: {e}")
+                self.failed = True
+                return None
+        url_path = f"/{self.token}/{len(self.files)}{os.path.splitext(path)[1]}"
+        self.files[url_path] = path
+        return f"http://127.0.0.1:{self.server.server_address[1]}{url_path}"
+
+    def close(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        self.files = {}
+
+def add_artwork_to_entry(new_entry, artwork, artwork_batch):
+    for key in ARTWORK_KEYS:
+        new_entry[key] = ""
+        path = artwork.get(key)
+        if not path or not os.path.isfile(path):
+            continue
+        url = artwork_batch.publish(path)
+        if url:
+            new_entry[key + 'Url'] = url
+        else:
+            with open(path, 'rb') as image_file:
+                new_entry[key] = b64encode(image_file.read()).decode('utf-8')
+#End of Artwork server
 
 
+def commit_shortcuts(candidates):
+    artwork_batch = ArtworkBatch()
+    try:
+        return commit_shortcut_entries(candidates, artwork_batch)
+    finally:
+        # Steam has fetched the artwork by the time createShortcuts() returned
+        artwork_batch.close()
 
-    # Add the new entry to the shortcuts dictionary and add proton
-    key = get_next_available_key(shortcuts)
-    shortcuts['shortcuts'][key] = new_entry
 
+def commit_shortcut_entries(candidates, artwork_batch):
+    global new_shortcuts_added
+    global created_shortcuts
 
+    new_entries = []
+    for candidate in candidates:
+        appname = candidate['appname']
+        artwork = candidate.get('artwork', {})
+
+        new_entry = {
+            'appname': appname,
+            'exe': candidate['exe'],
+            'StartDir': candidate['StartDir'],
+            'icon': f"{logged_in_home}/.steam/root/userdata/{steamid3}/config/grid/{get_file_name('icons', candidate['shortcut_id'])}",
+            'LaunchOptions': candidate['LaunchOptions'],
+        }
+        add_artwork_to_entry(new_entry, artwork, artwork_batch)
 
+        if candidate['Launcher']:
+            new_entry['Launcher'] = candidate['Launcher']
 
+        if candidate.get('CompatTool'):
+            new_entry['CompatTool'] = candidate['CompatTool']
 
+        print(f"Added new entry for {appname} to shortcuts.")
+        new_shortcuts_added = True
+        created_shortcuts.append(appname)
+        new_entries.append(new_entry)
 
+    if not new_entries:
+        return new_entries
 
     remove_lines = {
         'chromelaunchoptions',
@@ -4176,67 +5527,63 @@ def create_new_entry(shortcutdirectory, appname, launchoptions, startingdir, lau
     except FileNotFoundError:
         pass
 
-    print(f"Added new entry for {appname} to shortcuts.")
-    new_shortcuts_added = True
-    created_shortcuts.append(appname)
-
-
-
-
-    # Inject JS + Send data over WebSocket
-    shortcut_id = None
+    # Inject JS + Send data over the shared SharedJSContext connection
     try:
-        ws_url = get_ws_url_by_title(WS_HOST, WS_PORT, TARGET_TITLE)
-        print(f"Connecting to WebSocket URL: {ws_url}")
-
-        ws = create_websocket_connection(ws_url)
-        print("WebSocket connected")
-
-        result = inject_and_create_shortcut(ws, new_entry)
-        print("Shortcut creation result:", result)
-
-        shortcut_id = None
-        m_gameid = None
-        if result and 'result' in result:
-            value = result['result']['result'].get('value')
-            if isinstance(value, dict) and value.get('success'):
-                shortcut_id = value.get('shortcutId')
-                m_gameid = value.get('m_gameid')
-                print("App ID returned from JS:", shortcut_id)
-                print(f"Found m_gameid: {m_gameid}")
-
-
-
-
-                create_exec_line_from_entry(logged_in_home, new_entry, m_gameid)
+        client = get_devtools_client(TARGET_TITLE)
 
+        results = create_shortcuts(client, new_entries)
+        # Steam writes the artwork of the new shortcuts to the grid folder itself
+        grid_snapshot(f"{logged_in_home}/.steam/root/userdata/{steamid3}/config/grid").invalidate()
+        for new_entry, result in zip(new_entries, results):
+            try:
+                print(f"Shortcut creation result for {new_entry['appname']}:", result)
+                finish_created_shortcut(new_entry, result)
+            except Exception as e:
+                print(f"Failed to finish shortcut for {new_entry['appname']}: {e}")
+    except Exception as e:
+        print(f"WebSocket error: {e}")
 
+    return new_entries
 
 
-                if shortcut_id:
-                    print(f"Tagging artwork files for final Steam shortcut ID: {shortcut_id}")
-                    tag_artwork_files(shortcut_id, appname, steamid3, logged_in_home)
+def finish_created_shortcut(new_entry, value):
+    appname = new_entry['appname']
+    if value is not None:
+        if isinstance(value, dict) and value.get('success'):
+            # Only shortcuts Steam accepted count as existing, a failed one is tried again by the next scan
+            shortcut_index.insert(new_entry)
+            shortcut_id = value.get('shortcutId')
+            m_gameid = value.get('m_gameid')
+            print("App ID returned from JS:", shortcut_id)
+            print(f"Found m_gameid: {m_gameid}")
 
+            create_exec_line_from_entry(logged_in_home, new_entry, m_gameid)
 
-                    #Delete other artwork files tagged with the same appname
-                    delete_old_artwork_by_tag(appname, shortcut_id, steamid3, logged_in_home)
+            if shortcut_id:
+                print(f"Tagging artwork files for final Steam shortcut ID: {shortcut_id}")
+                tag_artwork_files(shortcut_id, appname, steamid3, logged_in_home)
 
-            else:
-                print("JS returned unexpected structure:", value)
+                #Delete other artwork files tagged with the same appname
+                delete_old_artwork_by_tag(appname, shortcut_id, steamid3, logged_in_home)
         else:
-            print("No result returned from JS")
-
-
-        ws.close()
-        print("WebSocket closed.")
-    except Exception as e:
-        print(f"WebSocket error: {e}")
-
+            print("JS returned unexpected structure:", value)
+    else:
+        print("No result returned from JS")
 
 
+def commit_shortcut_batch():
+    global shortcut_batch
+    if shortcut_batch is None:
+        return []
+    candidates = shortcut_batch["candidates"]
+    shortcut_batch = None
+    if not candidates:
+        return []
 
-    #Final return
-    return new_entry
+    print(f"Fetching artwork for {len(candidates)} new shortcuts...")
+    with ThreadPoolExecutor(max_workers=ARTWORK_WORKERS, thread_name_prefix="artwork") as pool:
+        list(pool.map(fetch_shortcut_artwork, candidates))
+    return commit_shortcuts(candidates)
 
 
 
@@ -4245,62 +5592,207 @@ def create_new_entry(shortcutdirectory, appname, launchoptions, startingdir, lau
 umu_processed_shortcuts = {}
 CSV_URL = "https://raw.githubusercontent.com/Open-Wine-Components/umu-database/main/umu-database.csv"
 
-# Global variable to store CSV data
-csv_data = []
+#Compat Tools
+# compatibilitytools.d is listed once per scan cycle, and again only if the directory itself changed
+COMPAT_TOOLS_DIR = f"{logged_in_home}/.steam/root/compatibilitytools.d"
+COMPAT_TOOL_PATTERN = re.compile(r"(UMU|GE)-Proton-?(\d+(?:\.\d+)*)(?:-(\d+(?:\.\d+)*))?")
+
+class CompatToolRegistry:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.mtime = None
+        # (version, kind, folder name), oldest first
+        self.tools = []
+
+    def refresh(self):
+        with self.lock:
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+            except OSError:
+                self.mtime, self.tools = None, []
+                return
+            if mtime == self.mtime:
+                return
+            tools = []
+            try:
+                for name in os.listdir(self.path):
+                    m = COMPAT_TOOL_PATTERN.match(name)
+                    if m and os.path.isdir(os.path.join(self.path, name)):
+                        kind, main, sub = m.groups()
+                        version = tuple(map(int, (main + '.' + (sub or '0')).split('.')))
+                        tools.append((version, kind, name))
+            except OSError as e:
+                print(f"Error reading {self.path}: {e}")
+                return
+            self.tools = sorted(tools)
+            self.mtime = mtime
+
+    def latest(self, *kinds):
+        if self.mtime is None:
+            self.refresh()
+        for version, kind, name in reversed(self.tools):
+            if kind in kinds:
+                return name
+        return None
+
+    def latest_umu_proton(self):
+        return self.latest("UMU")
 
-def fetch_and_parse_csv():
-    global csv_data
+    def latest_ge_proton(self):
+        return self.latest("GE")
 
-    # Try local UMU database first
-    try:
-        dir_path = f"{logged_in_home}/.steam/root/compatibilitytools.d"
-        pattern = re.compile(r"(UMU|GE)-Proton-?(\d+(?:\.\d+)*)(?:-(\d+(?:\.\d+)*))?")
+    # umu-database.csv shipped with the newest UMU or GE Proton
+    def protonfixes_csv(self):
+        name = self.latest("UMU", "GE")
+        if not name:
+            return None
+        path = os.path.join(self.path, name, "protonfixes", "umu-database.csv")
+        return path if os.path.isfile(path) else None
 
-        def parse_version(m):
-            main, sub = m.groups()[1:]
-            return tuple(map(int, (main + '.' + (sub or '0')).split('.')))
+compat_tools = CompatToolRegistry(COMPAT_TOOLS_DIR)
+#End of Compat Tools
 
-        compat_folders = [
-            (parse_version(m), name)
-            for name in os.listdir(dir_path)
-            if (m := pattern.match(name)) and os.path.isdir(os.path.join(dir_path, name))
-        ]
 
-        if not compat_folders:
-            print("No compatible UMU or GE-Proton folders found for local UMU database.")
-        else:
-            latest_folder = max(compat_folders)[1]
-            local_csv_path = os.path.join(
-                dir_path, latest_folder, "protonfixes", "umu-database.csv"
-            )
 
-            with open(local_csv_path, 'r', encoding='utf-8') as f:
-                csv_data = [row for row in csv.DictReader(f.readlines())]
-                print(f"Successfully loaded UMU data from local file: {local_csv_path}")
-                return csv_data
+#UMU Database
+# The CSV is compiled once into dict lookups and saved with the fingerprint of the CSV it came from, so later runs
+# only read the index. Nothing is loaded until a shortcut actually has a compat data path
+UMU_INDEX_PATH = f"{logged_in_home}/.config/systemd/user/umuindex.json"
+UMU_ONLINE_CSV_PATH = f"{logged_in_home}/.config/systemd/user/umu-database.csv"
+UMU_INDEX_VERSION = 1
+# How often the daemon looks for a newer local or online CSV
+UMU_RECHECK_INTERVAL = 3600
 
-    except Exception as local_e:
-        print(f"Failed to load local UMU database: {local_e}")
+def find_local_umu_csv():
+    local_csv_path = compat_tools.protonfixes_csv()
+    if not local_csv_path:
+        print("No compatible UMU or GE-Proton folders found for local UMU database.")
+    return local_csv_path
 
-    # Fallback to online if local fails
+# Keeps a copy of the online CSV and only downloads it again when GitHub says it changed
+def fetch_online_umu_csv():
+    meta_path = UMU_ONLINE_CSV_PATH + ".json"
+    headers = {}
     try:
-        with urllib.request.urlopen(CSV_URL, timeout=5) as response:
-            if response.status != 200:
-                raise Exception(f"HTTP {response.status}")
-            content = response.read().decode('utf-8')
-            csv_data = [row for row in csv.DictReader(content.splitlines())]
-            print("Fetched UMU database from online as fallback.")
+        meta = load_json_file(meta_path)
+        if os.path.isfile(UMU_ONLINE_CSV_PATH):
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+    except (OSError, ValueError):
+        pass
+
+    try:
+        response = http_request("GET", CSV_URL, headers=headers, timeout=5)
+        if response.status == 304:
+            return UMU_ONLINE_CSV_PATH
+        if response.status != 200:
+            raise Exception(f"HTTP {response.status}")
+        with open(UMU_ONLINE_CSV_PATH + ".tmp", 'wb') as f:
+            f.write(response.data)
+        os.replace(UMU_ONLINE_CSV_PATH + ".tmp", UMU_ONLINE_CSV_PATH)
+        with open(meta_path, 'w') as f:
+            json.dump({"etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")}, f)
+        print("Fetched UMU database from online as fallback.")
+        return UMU_ONLINE_CSV_PATH
     except (urllib.error.URLError, Exception) as e:
         print(f"Failed to fetch UMU data from the internet: {e}")
-        csv_data = []
-
-    return csv_data
+        return UMU_ONLINE_CSV_PATH if os.path.isfile(UMU_ONLINE_CSV_PATH) else None
+
+def build_umu_index(csv_path):
+    by_codename = {}
+    by_title = {}
+    by_store = {}
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            codename = norm(row.get('CODENAME') or "")
+            if not codename:
+                continue
+            # The first row wins, like the linear scans did
+            by_codename.setdefault(codename, row)
+            by_store.setdefault(norm(row.get('STORE') or ""), {}).setdefault(codename, row)
+            if row.get('TITLE'):
+                by_title.setdefault(row['TITLE'].lower(), row['CODENAME'])
+    return {"by_codename": by_codename, "by_title": by_title, "by_store": by_store}
+
+class UmuDatabase:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.index = None
+        self.checked_at = 0
+
+    def load(self):
+        with self.lock:
+            if self.index is not None and time.time() - self.checked_at < UMU_RECHECK_INTERVAL:
+                return self.index
+            self.checked_at = time.time()
+
+            csv_path = find_local_umu_csv() or fetch_online_umu_csv()
+            if not csv_path:
+                return self.index
 
-def list_all_entries():
-    global csv_data
-    if not csv_data:
-        csv_data = fetch_and_parse_csv()
-    return csv_data
+            try:
+                saved = load_json_file(UMU_INDEX_PATH)
+                if (saved.get("version") == UMU_INDEX_VERSION and saved.get("source") == csv_path
+                        and fingerprint_unchanged(csv_path, saved.get("fingerprint"))):
+                    if self.index is None:
+                        self.index = saved["index"]
+                        print(f"Loaded UMU database index for {csv_path}")
+                    return self.index
+            except (OSError, ValueError, KeyError, AttributeError):
+                pass
+
+            try:
+                fingerprint = take_fingerprint(csv_path)
+                self.index = build_umu_index(csv_path)
+                print(f"Successfully loaded UMU data from {csv_path}")
+            except Exception as e:
+                print(f"Failed to load UMU database {csv_path}: {e}")
+                return self.index
+
+            try:
+                with open(UMU_INDEX_PATH + ".tmp", 'w', encoding='utf-8') as f:
+                    json.dump({"version": UMU_INDEX_VERSION, "source": csv_path,
+                               "fingerprint": fingerprint, "index": self.index}, f)
+                os.replace(UMU_INDEX_PATH + ".tmp", UMU_INDEX_PATH)
+            except OSError as e:
+                print(f"Could not save the UMU database index: {e}")
+            return self.index
+
+    def codename_for_title(self, title):
+        index = self.load()
+        return index["by_title"].get(title.lower()) if index else None
+
+    # Prefers the row from the store the launch options point at, codenames are not unique across stores
+    def find(self, codename, store=None):
+        index = self.load()
+        if not index:
+            return None
+        key = norm(codename)
+        if store:
+            entry = index["by_store"].get(store, {}).get(key)
+            if entry:
+                return entry
+        return index["by_codename"].get(key)
+
+umu_database = UmuDatabase()
+
+# The umu-database STORE value for the launcher the launch options start
+def umu_store_from_launch_options(launchoptions):
+    if "offerIds=" in launchoptions:
+        return "ea"
+    if "amzn1.adg.product." in launchoptions:
+        return "amazon"
+    if "com.epicgames.launcher://apps/" in launchoptions:
+        return "egs"
+    if "uplay://launch/" in launchoptions:
+        return "ubisoft"
+    if "/gameId=" in launchoptions:
+        return "gog"
+    return None
+#End of UMU Database
 
 def extract_umu_id_from_launch_options(launchoptions):
     if 'STEAM_COMPAT_DATA_PATH=' not in launchoptions:
@@ -4359,25 +5851,16 @@ def modify_shortcut_for_umu(appname, exe, launchoptions, startingdir):
     if not codename:
         print(f"No codename found in launch options for {appname}. Trying to match appname.")
 
-    entries = list_all_entries()
-    if not entries:
+    if not umu_database.load():
         print(f"No entries found in UMU database. Skipping modification for {appname}.")
         return exe, startingdir, launchoptions
 
     # Fallback: match by appname if codename not found
     if not codename:
-        for entry in entries:
-            if entry.get('TITLE') and entry['TITLE'].lower() == appname.lower():
-                codename = entry['CODENAME']
-                break
+        codename = umu_database.codename_for_title(appname)
 
     if codename:
-        selected_entry = None
-
-        for entry in entries:
-            if norm(entry['CODENAME']) == norm(codename):
-                selected_entry = entry
-                break
+        selected_entry = umu_database.find(codename, umu_store_from_launch_options(launchoptions))
 
         if not selected_entry:
             print(f"No UMU entry match for codename: {codename}")
@@ -4424,20 +5907,7 @@ def modify_shortcut_for_umu(appname, exe, launchoptions, startingdir):
             )
 
         # Set compat tool name to latest UMU-Proton
-        dir_path = f"{logged_in_home}/.steam/root/compatibilitytools.d"
-        pattern = re.compile(r"UMU-Proton-(\d+(?:\.\d+)*)(?:-(\d+(?:\.\d+)*))?")
-
-        def parse_version(m):
-            main, sub = m.groups()
-            return tuple(map(int, (main + '.' + (sub or '0')).split('.')))
-
-        umu_folders = [
-            (parse_version(m), name)
-            for name in os.listdir(dir_path)
-            if (m := pattern.match(name)) and os.path.isdir(os.path.join(dir_path, name))
-        ]
-
-        compat_tool_name = max(umu_folders)[1] if umu_folders else "UMU-Proton-Latest"
+        compat_tool_name = compat_tools.latest_umu_proton() or "UMU-Proton-Latest"
 
         new_launch_options = (
             f'STEAM_COMPAT_DATA_PATH="{base_path}" '
@@ -4471,38 +5941,39 @@ def track_create_entry(directory, name, launch_options, starting_dir, launcher_n
 
 
 
-track_create_entry(os.environ.get('epicshortcutdirectory'), 'Epic Games', os.environ.get('epiclaunchoptions'), os.environ.get('epicstartingdir'))
-track_create_entry(os.environ.get('gogshortcutdirectory'), 'GOG Galaxy', os.environ.get('goglaunchoptions'), os.environ.get('gogstartingdir'))
-track_create_entry(os.environ.get('uplayshortcutdirectory'), 'Ubisoft Connect', os.environ.get('uplaylaunchoptions'), os.environ.get('uplaystartingdir'))
-track_create_entry(os.environ.get('battlenetshortcutdirectory'), 'Battle.net', os.environ.get('battlenetlaunchoptions'), os.environ.get('battlenetstartingdir'))
-track_create_entry(os.environ.get('eaappshortcutdirectory'), 'EA App', os.environ.get('eaapplaunchoptions'), os.environ.get('eaappstartingdir'))
-track_create_entry(os.environ.get('amazonshortcutdirectory'), 'Amazon Games', os.environ.get('amazonlaunchoptions'), os.environ.get('amazonstartingdir'))
-track_create_entry(os.environ.get('itchioshortcutdirectory'), 'itch.io', os.environ.get('itchiolaunchoptions'), os.environ.get('itchiostartingdir'))
-track_create_entry(os.environ.get('legacyshortcutdirectory'), 'Legacy Games', os.environ.get('legacylaunchoptions'), os.environ.get('legacystartingdir'))
-track_create_entry(os.environ.get('humbleshortcutdirectory'), 'Humble Bundle', os.environ.get('humblelaunchoptions'), os.environ.get('humblestartingdir'))
-track_create_entry(os.environ.get('indieshortcutdirectory'), 'IndieGala Client', os.environ.get('indielaunchoptions'), os.environ.get('indiestartingdir'))
-track_create_entry(os.environ.get('rockstarshortcutdirectory'), 'Rockstar Games Launcher', os.environ.get('rockstarlaunchoptions'), os.environ.get('rockstarstartingdir'))
-track_create_entry(os.environ.get('glyphshortcutdirectory'), 'Glyph', os.environ.get('glyphlaunchoptions'), os.environ.get('glyphstartingdir'))
-track_create_entry(os.environ.get('minecraftshortcutdirectory'), 'Minecraft Launcher', os.environ.get('minecraftlaunchoptions'), os.environ.get('minecraftstartingdir'))
-track_create_entry(os.environ.get('psplusshortcutdirectory'), 'Playstation Plus', os.environ.get('pspluslaunchoptions'), os.environ.get('psplusstartingdir'))
-track_create_entry(os.environ.get('vkplayshortcutdirectory'), 'VK Play', os.environ.get('vkplaylaunchoptions'), os.environ.get('vkplaystartingdir'))
-track_create_entry(os.environ.get('hoyoplayshortcutdirectory'), 'HoYoPlay', os.environ.get('hoyoplaylaunchoptions'), os.environ.get('hoyoplaystartingdir'))
-track_create_entry(os.environ.get('nexonshortcutdirectory'), 'Nexon Launcher', os.environ.get('nexonlaunchoptions'), os.environ.get('nexonstartingdir'))
-track_create_entry(os.environ.get('gamejoltshortcutdirectory'), 'Game Jolt Client', os.environ.get('gamejoltlaunchoptions'), os.environ.get('gamejoltstartingdir'))
-track_create_entry(os.environ.get('artixgameshortcutdirectory'), 'Artix Game Launcher', os.environ.get('artixgamelaunchoptions'), os.environ.get('artixgamestartingdir'))
-track_create_entry(os.environ.get('purpleshortcutdirectory'), 'PURPLE Launcher', os.environ.get('purplelaunchoptions'), os.environ.get('purplestartingdir'))
-track_create_entry(os.environ.get('plariumshortcutdirectory'), 'Plarium Play', os.environ.get('plariumlaunchoptions'), os.environ.get('plariumstartingdir'))
-track_create_entry(os.environ.get('vfunshortcutdirectory'), 'VFUN Launcher', os.environ.get('vfunlaunchoptions'), os.environ.get('vfunstartingdir'))
-track_create_entry(os.environ.get('temposhortcutdirectory'), 'Tempo Launcher', os.environ.get('tempolaunchoptions'), os.environ.get('tempostartingdir'))
-track_create_entry(os.environ.get('arcshortcutdirectory'), 'ARC Launcher', os.environ.get('arclaunchoptions'), os.environ.get('arcstartingdir'))
-track_create_entry(os.environ.get('poketcgshortcutdirectory'), 'Pokémon Trading Card Game Live', os.environ.get('poketcglaunchoptions'), os.environ.get('poketcgstartingdir'))
-track_create_entry(os.environ.get('antstreamshortcutdirectory'), 'Antstream Arcade', os.environ.get('antstreamlaunchoptions'), os.environ.get('antstreamstartingdir'))
-track_create_entry(os.environ.get('stoveshortcutdirectory'), 'STOVE Client', os.environ.get('stovelaunchoptions'), os.environ.get('stovestartingdir'))
-track_create_entry(os.environ.get('bigfishshortcutdirectory'), 'Big Fish Games Manager', os.environ.get('bigfishlaunchoptions'), os.environ.get('bigfishstartingdir'))
-track_create_entry(os.environ.get('gryphlinkshortcutdirectory'), 'Gryphlink', os.environ.get('gryphlinklaunchoptions'), os.environ.get('gryphlinkstartingdir'))
+def add_launcher_shortcuts():
+    track_create_entry(os.environ.get('epicshortcutdirectory'), 'Epic Games', os.environ.get('epiclaunchoptions'), os.environ.get('epicstartingdir'))
+    track_create_entry(os.environ.get('gogshortcutdirectory'), 'GOG Galaxy', os.environ.get('goglaunchoptions'), os.environ.get('gogstartingdir'))
+    track_create_entry(os.environ.get('uplayshortcutdirectory'), 'Ubisoft Connect', os.environ.get('uplaylaunchoptions'), os.environ.get('uplaystartingdir'))
+    track_create_entry(os.environ.get('battlenetshortcutdirectory'), 'Battle.net', os.environ.get('battlenetlaunchoptions'), os.environ.get('battlenetstartingdir'))
+    track_create_entry(os.environ.get('eaappshortcutdirectory'), 'EA App', os.environ.get('eaapplaunchoptions'), os.environ.get('eaappstartingdir'))
+    track_create_entry(os.environ.get('amazonshortcutdirectory'), 'Amazon Games', os.environ.get('amazonlaunchoptions'), os.environ.get('amazonstartingdir'))
+    track_create_entry(os.environ.get('itchioshortcutdirectory'), 'itch.io', os.environ.get('itchiolaunchoptions'), os.environ.get('itchiostartingdir'))
+    track_create_entry(os.environ.get('legacyshortcutdirectory'), 'Legacy Games', os.environ.get('legacylaunchoptions'), os.environ.get('legacystartingdir'))
+    track_create_entry(os.environ.get('humbleshortcutdirectory'), 'Humble Bundle', os.environ.get('humblelaunchoptions'), os.environ.get('humblestartingdir'))
+    track_create_entry(os.environ.get('indieshortcutdirectory'), 'IndieGala Client', os.environ.get('indielaunchoptions'), os.environ.get('indiestartingdir'))
+    track_create_entry(os.environ.get('rockstarshortcutdirectory'), 'Rockstar Games Launcher', os.environ.get('rockstarlaunchoptions'), os.environ.get('rockstarstartingdir'))
+    track_create_entry(os.environ.get('glyphshortcutdirectory'), 'Glyph', os.environ.get('glyphlaunchoptions'), os.environ.get('glyphstartingdir'))
+    track_create_entry(os.environ.get('minecraftshortcutdirectory'), 'Minecraft Launcher', os.environ.get('minecraftlaunchoptions'), os.environ.get('minecraftstartingdir'))
+    track_create_entry(os.environ.get('psplusshortcutdirectory'), 'Playstation Plus', os.environ.get('pspluslaunchoptions'), os.environ.get('psplusstartingdir'))
+    track_create_entry(os.environ.get('vkplayshortcutdirectory'), 'VK Play', os.environ.get('vkplaylaunchoptions'), os.environ.get('vkplaystartingdir'))
+    track_create_entry(os.environ.get('hoyoplayshortcutdirectory'), 'HoYoPlay', os.environ.get('hoyoplaylaunchoptions'), os.environ.get('hoyoplaystartingdir'))
+    track_create_entry(os.environ.get('nexonshortcutdirectory'), 'Nexon Launcher', os.environ.get('nexonlaunchoptions'), os.environ.get('nexonstartingdir'))
+    track_create_entry(os.environ.get('gamejoltshortcutdirectory'), 'Game Jolt Client', os.environ.get('gamejoltlaunchoptions'), os.environ.get('gamejoltstartingdir'))
+    track_create_entry(os.environ.get('artixgameshortcutdirectory'), 'Artix Game Launcher', os.environ.get('artixgamelaunchoptions'), os.environ.get('artixgamestartingdir'))
+    track_create_entry(os.environ.get('purpleshortcutdirectory'), 'PURPLE Launcher', os.environ.get('purplelaunchoptions'), os.environ.get('purplestartingdir'))
+    track_create_entry(os.environ.get('plariumshortcutdirectory'), 'Plarium Play', os.environ.get('plariumlaunchoptions'), os.environ.get('plariumstartingdir'))
+    track_create_entry(os.environ.get('vfunshortcutdirectory'), 'VFUN Launcher', os.environ.get('vfunlaunchoptions'), os.environ.get('vfunstartingdir'))
+    track_create_entry(os.environ.get('temposhortcutdirectory'), 'Tempo Launcher', os.environ.get('tempolaunchoptions'), os.environ.get('tempostartingdir'))
+    track_create_entry(os.environ.get('arcshortcutdirectory'), 'ARC Launcher', os.environ.get('arclaunchoptions'), os.environ.get('arcstartingdir'))
+    track_create_entry(os.environ.get('poketcgshortcutdirectory'), 'Pokémon Trading Card Game Live', os.environ.get('poketcglaunchoptions'), os.environ.get('poketcgstartingdir'))
+    track_create_entry(os.environ.get('antstreamshortcutdirectory'), 'Antstream Arcade', os.environ.get('antstreamlaunchoptions'), os.environ.get('antstreamstartingdir'))
+    track_create_entry(os.environ.get('stoveshortcutdirectory'), 'STOVE Client', os.environ.get('stovelaunchoptions'), os.environ.get('stovestartingdir'))
+    track_create_entry(os.environ.get('bigfishshortcutdirectory'), 'Big Fish Games Manager', os.environ.get('bigfishlaunchoptions'), os.environ.get('bigfishstartingdir'))
+    track_create_entry(os.environ.get('gryphlinkshortcutdirectory'), 'Gryphlink', os.environ.get('gryphlinklaunchoptions'), os.environ.get('gryphlinkstartingdir'))
 
 
-track_create_entry(os.environ.get('repaireaappshortcutdirectory'), 'Repair EA App', os.environ.get('repaireaapplaunchoptions'), os.environ.get('repaireaappstartingdir'))
+    track_create_entry(os.environ.get('repaireaappshortcutdirectory'), 'Repair EA App', os.environ.get('repaireaapplaunchoptions'), os.environ.get('repaireaappstartingdir'))
 
 
 
@@ -4530,255 +6001,258 @@ def browser_for_env(envvar: str) -> str:
     return detect_browser_name(chromedirectory, opts)
 
 
-create_new_entry(chromedirectory, 'Xbox Game Pass', os.environ.get('xboxchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('xboxchromelaunchoptions'))
-create_new_entry(chromedirectory, 'Better xCloud', os.environ.get('xcloudchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('xcloudchromelaunchoptions'))
-create_new_entry(chromedirectory, 'GeForce Now', os.environ.get('geforcechromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('geforcechromelaunchoptions'))
-create_new_entry(chromedirectory, 'Boosteroid Cloud Gaming', os.environ.get('boosteroidchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('boosteroidchromelaunchoptions'))
-create_new_entry(chromedirectory, 'Stim.io', os.environ.get('stimiochromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('stimiochromelaunchoptions'))
-create_new_entry(chromedirectory, 'WatchParty', os.environ.get('watchpartychromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('watchpartychromelaunchoptions'))
-create_new_entry(chromedirectory, 'Netflix', os.environ.get('netflixchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('netflixchromelaunchoptions'))
-create_new_entry(chromedirectory, 'Hulu', os.environ.get('huluchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('huluchromelaunchoptions'))
-create_new_entry(chromedirectory, 'Tubi', os.environ.get('tubichromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('tubichromelaunchoptions'))
-create_new_entry(chromedirectory, 'Disney+', os.environ.get('disneychromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('disneychromelaunchoptions'))
-create_new_entry(chromedirectory, 'Amazon Prime Video', os.environ.get('amazonchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('amazonchromelaunchoptions'))
-create_new_entry(chromedirectory, 'Youtube', os.environ.get('youtubechromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('youtubechromelaunchoptions'))
-create_new_entry(chromedirectory, 'Youtube TV', os.environ.get('youtubetvchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('youtubetvchromelaunchoptions'))
-create_new_entry(chromedirectory, 'Amazon Luna', os.environ.get('lunachromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('lunachromelaunchoptions'))
-create_new_entry(chromedirectory, 'Twitch', os.environ.get('twitchchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('twitchchromelaunchoptions'))
-create_new_entry(chromedirectory, 'Venge', os.environ.get('vengechromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('vengechromelaunchoptions'))
-create_new_entry(chromedirectory, 'Super Monkey Ball Online', os.environ.get('monkeychromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('monkeychromelaunchoptions'))
-create_new_entry(chromedirectory, 'Rocketcrab', os.environ.get('rocketcrabchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('rocketcrabchromelaunchoptions'))
-create_new_entry(chromedirectory, 'Fortnite', os.environ.get('fortnitechromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('fortnitechromelaunchoptions'))
-create_new_entry(chromedirectory, 'Cloudy Pad', os.environ.get('cloudychromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('cloudychromelaunchoptions'))
-create_new_entry(chromedirectory, 'WebRcade', os.environ.get('webrcadechromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('webrcadechromelaunchoptions'))
-create_new_entry(chromedirectory, 'WebRcade Editor', os.environ.get('webrcadeeditchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('webrcadeeditchromelaunchoptions'))
-create_new_entry(chromedirectory, 'Afterplay.io', os.environ.get('afterplayiochromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('afterplayiochromelaunchoptions'))
-create_new_entry(chromedirectory, 'OnePlay', os.environ.get('oneplaychromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('oneplaychromelaunchoptions'))
-create_new_entry(chromedirectory, 'AirGPU', os.environ.get('airgpuchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('airgpuchromelaunchoptions'))
-create_new_entry(chromedirectory, 'CloudDeck', os.environ.get('clouddeckchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('clouddeckchromelaunchoptions'))
-create_new_entry(chromedirectory, 'JioGamesCloud', os.environ.get('jiochromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('jiochromelaunchoptions'))
-create_new_entry(chromedirectory, 'Plex', os.environ.get('plexchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('plexchromelaunchoptions'))
-create_new_entry(chromedirectory, 'Apple TV+', os.environ.get('applechromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('applechromelaunchoptions'))
-create_new_entry(chromedirectory, 'Crunchyroll', os.environ.get('crunchychromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('crunchychromelaunchoptions'))
-create_new_entry(chromedirectory, 'PokéRogue', os.environ.get('pokeroguechromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('pokeroguechromelaunchoptions'))
-
-
-
-# Iterate over each custom website
-for i, website in enumerate(custom_websites):
-    if not website.startswith(("http://", "https://")):
-        website = f"https://{website}"
-
-    parts = urlsplit(website)
-    encoded_path = quote(parts.path, safe="/")
-    url = urlunsplit((
-        parts.scheme,
-        parts.netloc,
-        encoded_path,
-        parts.query,
-        parts.fragment
-    ))
-
-    if i < len(custom_names) and custom_names[i]:
-        game_name = custom_names[i]
-    else:
-        clean = (
-            website.replace("http://", "")
-                   .replace("https://", "")
-                   .replace("www.", "")
-                   .rstrip("/")
-        )
-
-        match = re.search(r"/games/([^/]+)", website)
-        if match:
-            game_name = (
-                match.group(1)
-                .replace("-", " ")
-                .replace("%27", "'")
-                .title()
-            )
+def add_website_shortcuts():
+    create_new_entry(chromedirectory, 'Xbox Game Pass', os.environ.get('xboxchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('xboxchromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Better xCloud', os.environ.get('xcloudchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('xcloudchromelaunchoptions'))
+    create_new_entry(chromedirectory, 'GeForce Now', os.environ.get('geforcechromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('geforcechromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Boosteroid Cloud Gaming', os.environ.get('boosteroidchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('boosteroidchromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Stim.io', os.environ.get('stimiochromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('stimiochromelaunchoptions'))
+    create_new_entry(chromedirectory, 'WatchParty', os.environ.get('watchpartychromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('watchpartychromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Netflix', os.environ.get('netflixchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('netflixchromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Hulu', os.environ.get('huluchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('huluchromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Tubi', os.environ.get('tubichromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('tubichromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Disney+', os.environ.get('disneychromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('disneychromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Amazon Prime Video', os.environ.get('amazonchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('amazonchromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Youtube', os.environ.get('youtubechromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('youtubechromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Youtube TV', os.environ.get('youtubetvchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('youtubetvchromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Amazon Luna', os.environ.get('lunachromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('lunachromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Twitch', os.environ.get('twitchchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('twitchchromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Venge', os.environ.get('vengechromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('vengechromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Super Monkey Ball Online', os.environ.get('monkeychromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('monkeychromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Rocketcrab', os.environ.get('rocketcrabchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('rocketcrabchromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Fortnite', os.environ.get('fortnitechromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('fortnitechromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Cloudy Pad', os.environ.get('cloudychromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('cloudychromelaunchoptions'))
+    create_new_entry(chromedirectory, 'WebRcade', os.environ.get('webrcadechromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('webrcadechromelaunchoptions'))
+    create_new_entry(chromedirectory, 'WebRcade Editor', os.environ.get('webrcadeeditchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('webrcadeeditchromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Afterplay.io', os.environ.get('afterplayiochromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('afterplayiochromelaunchoptions'))
+    create_new_entry(chromedirectory, 'OnePlay', os.environ.get('oneplaychromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('oneplaychromelaunchoptions'))
+    create_new_entry(chromedirectory, 'AirGPU', os.environ.get('airgpuchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('airgpuchromelaunchoptions'))
+    create_new_entry(chromedirectory, 'CloudDeck', os.environ.get('clouddeckchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('clouddeckchromelaunchoptions'))
+    create_new_entry(chromedirectory, 'JioGamesCloud', os.environ.get('jiochromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('jiochromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Plex', os.environ.get('plexchromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('plexchromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Apple TV+', os.environ.get('applechromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('applechromelaunchoptions'))
+    create_new_entry(chromedirectory, 'Crunchyroll', os.environ.get('crunchychromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('crunchychromelaunchoptions'))
+    create_new_entry(chromedirectory, 'PokéRogue', os.environ.get('pokeroguechromelaunchoptions'), os.environ.get('chrome_startdir'), launcher_name=browser_for_env('pokeroguechromelaunchoptions'))
+
+
+
+    # Iterate over each custom website
+    for i, website in enumerate(custom_websites):
+        if not website.startswith(("http://", "https://")):
+            website = f"https://{website}"
+
+        parts = urlsplit(website)
+        encoded_path = quote(parts.path, safe="/")
+        url = urlunsplit((
+            parts.scheme,
+            parts.netloc,
+            encoded_path,
+            parts.query,
+            parts.fragment
+        ))
+
+        if i < len(custom_names) and custom_names[i]:
+            game_name = custom_names[i]
         else:
-            game_name = clean.split("/")[0].title()
+            clean = (
+                website.replace("http://", "")
+                       .replace("https://", "")
+                       .replace("www.", "")
+                       .rstrip("/")
+            )
+
+            match = re.search(r"/games/([^/]+)", website)
+            if match:
+                game_name = (
+                    match.group(1)
+                    .replace("-", " ")
+                    .replace("%27", "'")
+                    .title()
+                )
+            else:
+                game_name = clean.split("/")[0].title()
 
-    launch_options = f"{base_launch_options} {url}"
+        launch_options = f"{base_launch_options} {url}"
 
-    create_new_entry(
-        os.environ["chromedirectory"],
-        game_name,
-        launch_options,
-        os.environ["chrome_startdir"],
-        launcher_name=browser_for_env('customchromelaunchoptions')
-    )
+        create_new_entry(
+            os.environ["chromedirectory"],
+            game_name,
+            launch_options,
+            os.environ["chrome_startdir"],
+            launcher_name=browser_for_env('customchromelaunchoptions')
+        )
 #End of Creating Launcher Shortcuts
 
 
 
 #Custom Shortcut for NSL
 # Define the parameters for the new shortcut
-nslshortcutdirectory = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/NonSteamLaunchers/\""
-nslappname = "NonSteamLaunchers"
-nsllaunchoptions = f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/NonSteamLaunchers/\" %command%"
-nslstartingdir = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/NonSteamLaunchers/\""
-print(f"nslshortcutdirectory: {nslshortcutdirectory}")  # Debug print
-print(f"nslappname: {nslappname}")  # Debug print
-print(f"nsllaunchoptions: {nsllaunchoptions}")  # Debug print
-
-
-
-# Check if separate_appids is set to 'false'
-if separate_appids == 'false':
-    print("separate_appids is set to 'false'. Creating new shortcut...")  # Debug print
-    # Call the function to create the new shortcut and store the returned appid
-    appid = create_new_entry(nslshortcutdirectory, nslappname, nsllaunchoptions, nslstartingdir)
-    app_ids[nslappname] = appid
-    print(f"appid: {appid}")  # Debug print
-else:
-    print("separate_appids is not set to 'false'. Skipping shortcut creation.")  # Debug print
-
-
-
-
-# Iterate over each launcher in the app_ids dictionary
-for launcher_name, appid in app_ids.items():
-    print(f"The app ID for {launcher_name} is {appid}")
-
-# Get the app ID for the first launcher that the user chose to install
-if app_ids:
-    appid = app_ids.get(launcher_name)
-    print(f"App ID for the chosen launcher: {appid}")
-
-# Create User Friendly Symlinks for the launchers
-# Define the path to the compatdata directory
-compatdata_dir = f'{logged_in_home}/.local/share/Steam/steamapps/compatdata'
-print(f"Compatdata directory: {compatdata_dir}")
-
-# Define a dictionary of original folder names
-folder_names = {
-    'Epic Games': 'EpicGamesLauncher',
-    'Gog Galaxy': 'GogGalaxyLauncher',
-    'Ubisoft Connect': 'UplayLauncher',
-    'Battle.net': 'Battle.netLauncher',
-    'EA App': 'TheEAappLauncher',
-    'Amazon Games': 'AmazonGamesLauncher',
-    'itch.io': 'itchioLauncher',
-    'Legacy Games': 'LegacyGamesLauncher',
-    'Humble Bundle': 'HumbleGamesLauncher',
-    'IndieGala Client': 'IndieGalaLauncher',
-    'Rockstar Games Launcher': 'RockstarGamesLauncher',
-    'Glyph': 'GlyphLauncher',
-    'Playstation Plus': 'PlaystationPlusLauncher',
-    'VK Play': 'VKPlayLauncher',
-    'HoYoPlay': 'HoYoPlayLauncher',
-    'Nexon Launcher': 'NexonLauncher',
-    'Game Jolt Client': 'GameJoltLauncher',
-    'Artix Game Launcher': 'ArtixGameLauncher',
-    'ARC Launcher': 'ARCLauncher',
-    'PURPLE Launcher': 'PURPLELauncher',
-    'Plarium Play': 'PlariumLauncher',
-    'VFUN Launcher': 'VFUNLauncher',
-    'Tempo Launcher': 'TempoLauncher',
-    'Pokémon Trading Card Game Live': 'PokeTCGLauncher',
-    'Antstream Arcade': 'AntstreamLauncher',
-    'STOVE Client': 'STOVELauncher',
-    'Big Fish Games Manager': 'BigFishLauncher',
-    'Gryphlink': 'GryphlinkLauncher',
-}
+def add_nsl_shortcut():
+    nslshortcutdirectory = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/NonSteamLaunchers/\""
+    nslappname = "NonSteamLaunchers"
+    nsllaunchoptions = f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/NonSteamLaunchers/\" %command%"
+    nslstartingdir = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/NonSteamLaunchers/\""
+    print(f"nslshortcutdirectory: {nslshortcutdirectory}")  # Debug print
+    print(f"nslappname: {nslappname}")  # Debug print
+    print(f"nsllaunchoptions: {nsllaunchoptions}")  # Debug print
+
+
+
+    # Check if separate_appids is set to 'false'
+    if separate_appids == 'false':
+        print("separate_appids is set to 'false'. Creating new shortcut...")  # Debug print
+        # Call the function to create the new shortcut and store the returned appid
+        appid = create_new_entry(nslshortcutdirectory, nslappname, nsllaunchoptions, nslstartingdir)
+        app_ids[nslappname] = appid
+        print(f"appid: {appid}")  # Debug print
+    else:
+        print("separate_appids is not set to 'false'. Skipping shortcut creation.")  # Debug print
 
 
-# Iterate over each launcher in the folder_names dictionary
-for launcher_name, folder in folder_names.items():
-    # Define the current path of the folder
-    current_path = os.path.join(compatdata_dir, folder)
-    print(f"Current path for {launcher_name}: {current_path}")
 
-    # Check if the folder exists
-    if os.path.exists(current_path):
-        print(f'{launcher_name}: {folder} exists')
-        # Get the app ID for this launcher from the app_id_to_name dictionary
+
+def link_launcher_compatdata():
+    # Iterate over each launcher in the app_ids dictionary
+    for launcher_name, appid in app_ids.items():
+        print(f"The app ID for {launcher_name} is {appid}")
+
+    # Get the app ID for the first launcher that the user chose to install
+    if app_ids:
         appid = app_ids.get(launcher_name)
-        print(f"App ID for {launcher_name}: {appid}")
+        print(f"App ID for the chosen launcher: {appid}")
+
+    # Create User Friendly Symlinks for the launchers
+    # Define the path to the compatdata directory
+    compatdata_dir = f'{logged_in_home}/.local/share/Steam/steamapps/compatdata'
+    print(f"Compatdata directory: {compatdata_dir}")
+
+    # Define a dictionary of original folder names
+    folder_names = {
+        'Epic Games': 'EpicGamesLauncher',
+        'Gog Galaxy': 'GogGalaxyLauncher',
+        'Ubisoft Connect': 'UplayLauncher',
+        'Battle.net': 'Battle.netLauncher',
+        'EA App': 'TheEAappLauncher',
+        'Amazon Games': 'AmazonGamesLauncher',
+        'itch.io': 'itchioLauncher',
+        'Legacy Games': 'LegacyGamesLauncher',
+        'Humble Bundle': 'HumbleGamesLauncher',
+        'IndieGala Client': 'IndieGalaLauncher',
+        'Rockstar Games Launcher': 'RockstarGamesLauncher',
+        'Glyph': 'GlyphLauncher',
+        'Playstation Plus': 'PlaystationPlusLauncher',
+        'VK Play': 'VKPlayLauncher',
+        'HoYoPlay': 'HoYoPlayLauncher',
+        'Nexon Launcher': 'NexonLauncher',
+        'Game Jolt Client': 'GameJoltLauncher',
+        'Artix Game Launcher': 'ArtixGameLauncher',
+        'ARC Launcher': 'ARCLauncher',
+        'PURPLE Launcher': 'PURPLELauncher',
+        'Plarium Play': 'PlariumLauncher',
+        'VFUN Launcher': 'VFUNLauncher',
+        'Tempo Launcher': 'TempoLauncher',
+        'Pokémon Trading Card Game Live': 'PokeTCGLauncher',
+        'Antstream Arcade': 'AntstreamLauncher',
+        'STOVE Client': 'STOVELauncher',
+        'Big Fish Games Manager': 'BigFishLauncher',
+        'Gryphlink': 'GryphlinkLauncher',
+    }
 
-        # If appid is not None, proceed with renaming and symlink creation
-        if appid is not None:
-            # Define the new path of the folder
-            new_path = os.path.join(compatdata_dir, str(appid))
-            print(f"New path for {launcher_name}: {new_path}")
 
-            # Check if the new path already exists
-            if os.path.exists(new_path):
-                print(f'{new_path} already exists. Skipping renaming and symlinking.')
-            else:
-                # Rename the folder
-                os.rename(current_path, new_path)
-                print(f"Renamed {current_path} to {new_path}")
+    # Iterate over each launcher in the folder_names dictionary
+    for launcher_name, folder in folder_names.items():
+        # Define the current path of the folder
+        current_path = os.path.join(compatdata_dir, folder)
+        print(f"Current path for {launcher_name}: {current_path}")
+
+        # Check if the folder exists
+        if os.path.exists(current_path):
+            print(f'{launcher_name}: {folder} exists')
+            # Get the app ID for this launcher from the app_id_to_name dictionary
+            appid = app_ids.get(launcher_name)
+            print(f"App ID for {launcher_name}: {appid}")
+
+            # If appid is not None, proceed with renaming and symlink creation
+            if appid is not None:
+                # Define the new path of the folder
+                new_path = os.path.join(compatdata_dir, str(appid))
+                print(f"New path for {launcher_name}: {new_path}")
+
+                # Check if the new path already exists
+                if os.path.exists(new_path):
+                    print(f'{new_path} already exists. Skipping renaming and symlinking.')
+                else:
+                    # Rename the folder
+                    os.rename(current_path, new_path)
+                    print(f"Renamed {current_path} to {new_path}")
 
-                # Define the path of the symbolic link
-                symlink_path = os.path.join(compatdata_dir, folder)
-                print(f"Symlink path for {launcher_name}: {symlink_path}")
+                    # Define the path of the symbolic link
+                    symlink_path = os.path.join(compatdata_dir, folder)
+                    print(f"Symlink path for {launcher_name}: {symlink_path}")
 
-                # Create a symbolic link to the renamed folder
-                os.symlink(new_path, symlink_path)
-                print(f"Created symlink at {symlink_path} to {new_path}")
+                    # Create a symbolic link to the renamed folder
+                    os.symlink(new_path, symlink_path)
+                    print(f"Created symlink at {symlink_path} to {new_path}")
+            else:
+                print(f'App ID for {launcher_name} is not available yet.')
         else:
-            print(f'App ID for {launcher_name} is not available yet.')
-    else:
-        print(f'{launcher_name}: {folder} does not exist')
+            print(f'{launcher_name}: {folder} does not exist')
 
 
 
 
-# Define the appid for the custom shortcut
-custom_app_id = 4206469918
-print(f"App ID for the custom shortcut: {custom_app_id}")
+    # Define the appid for the custom shortcut
+    custom_app_id = 4206469918
+    print(f"App ID for the custom shortcut: {custom_app_id}")
 
-# Check if the NonSteamLaunchers folder exists
-non_steam_launchers_path = os.path.join(compatdata_dir, 'NonSteamLaunchers')
-if os.path.exists(non_steam_launchers_path):
-    print("NonSteamLaunchers already exists at the expected path.")
+    # Check if the NonSteamLaunchers folder exists
+    non_steam_launchers_path = os.path.join(compatdata_dir, 'NonSteamLaunchers')
+    if os.path.exists(non_steam_launchers_path):
+        print("NonSteamLaunchers already exists at the expected path.")
 
-    # Define the current path of the NonSteamLaunchers folder
-    current_path = os.path.join(compatdata_dir, 'NonSteamLaunchers')
-    print(f"Current path for NonSteamLaunchers: {current_path}")
+        # Define the current path of the NonSteamLaunchers folder
+        current_path = os.path.join(compatdata_dir, 'NonSteamLaunchers')
+        print(f"Current path for NonSteamLaunchers: {current_path}")
 
-    # Check if NonSteamLaunchers is already a symbolic link
-    if os.path.islink(current_path):
-        print('NonSteamLaunchers is already a symbolic link')
-        # Check if NonSteamLaunchers is a symlink to an appid folder
-        if os.readlink(current_path) != os.path.join(compatdata_dir, str(custom_app_id)):
-            print('NonSteamLaunchers is symlinked to a different folder')
-            # Remove the existing symbolic link
-            os.unlink(current_path)
-            print(f'Removed existing symlink at {current_path}')
-            # Create a symbolic link to the correct appid folder
-            os.symlink(os.path.join(compatdata_dir, str(custom_app_id)), current_path)
-            print(f'Created new symlink at {current_path} to {os.path.join(compatdata_dir, str(custom_app_id))}')
-        else:
-            print('NonSteamLaunchers is already correctly symlinked')
-    else:
-        print("NonSteamLaunchers is not a symbolic link.")
-        # Check if the current path exists
-        if os.path.exists(current_path):
-            print("NonSteamLaunchers exists at the current path.")
-            # Define the new path of the NonSteamLaunchers folder
-            new_path = os.path.join(compatdata_dir, str(custom_app_id))
-            print(f"New path for NonSteamLaunchers: {new_path}")
-
-            # Check if the new path already exists
-            if os.path.exists(new_path):
-                print(f'{new_path} already exists. Skipping renaming and symlinking.')
+        # Check if NonSteamLaunchers is already a symbolic link
+        if os.path.islink(current_path):
+            print('NonSteamLaunchers is already a symbolic link')
+            # Check if NonSteamLaunchers is a symlink to an appid folder
+            if os.readlink(current_path) != os.path.join(compatdata_dir, str(custom_app_id)):
+                print('NonSteamLaunchers is symlinked to a different folder')
+                # Remove the existing symbolic link
+                os.unlink(current_path)
+                print(f'Removed existing symlink at {current_path}')
+                # Create a symbolic link to the correct appid folder
+                os.symlink(os.path.join(compatdata_dir, str(custom_app_id)), current_path)
+                print(f'Created new symlink at {current_path} to {os.path.join(compatdata_dir, str(custom_app_id))}')
             else:
-                # Move the NonSteamLaunchers folder to the new path
-                shutil.move(current_path, new_path)
-                print(f"Moved NonSteamLaunchers folder to {new_path}")
+                print('NonSteamLaunchers is already correctly symlinked')
+        else:
+            print("NonSteamLaunchers is not a symbolic link.")
+            # Check if the current path exists
+            if os.path.exists(current_path):
+                print("NonSteamLaunchers exists at the current path.")
+                # Define the new path of the NonSteamLaunchers folder
+                new_path = os.path.join(compatdata_dir, str(custom_app_id))
+                print(f"New path for NonSteamLaunchers: {new_path}")
+
+                # Check if the new path already exists
+                if os.path.exists(new_path):
+                    print(f'{new_path} already exists. Skipping renaming and symlinking.')
+                else:
+                    # Move the NonSteamLaunchers folder to the new path
+                    shutil.move(current_path, new_path)
+                    print(f"Moved NonSteamLaunchers folder to {new_path}")
 
-                # Define the path of the symbolic link
-                symlink_path = os.path.join(compatdata_dir, 'NonSteamLaunchers')
+                    # Define the path of the symbolic link
+                    symlink_path = os.path.join(compatdata_dir, 'NonSteamLaunchers')
 
-                # Create a symbolic link to the renamed NonSteamLaunchers folder
-                os.symlink(new_path, symlink_path)
-                print(f"Created symlink at {symlink_path} to {new_path}")
-        else:
-            print(f"The directory {current_path} does not exist. Skipping.")
+                    # Create a symbolic link to the renamed NonSteamLaunchers folder
+                    os.symlink(new_path, symlink_path)
+                    print(f"Created symlink at {symlink_path} to {new_path}")
+            else:
+                print(f"The directory {current_path} does not exist. Skipping.")
 
 
 #End of old refactored Code
@@ -4820,37 +6294,280 @@ if os.path.exists(non_steam_launchers_path):
 
 
 
-#Scanners
-# Epic Games Scanner
-item_dir = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{epic_games_launcher}/pfx/drive_c/ProgramData/Epic/EpicGamesLauncher/Data/Manifests/"
-dat_file_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{epic_games_launcher}/pfx/drive_c/ProgramData/Epic/UnrealEngineLauncher/LauncherInstalled.dat"
+#Scan Index
+# Remembers what every launcher scanner read and found, so launchers whose files did not change are not parsed again
+scan_index_path = f"{logged_in_home}/.config/systemd/user/scanindex.json"
+SCAN_INDEX_VERSION = 1
+# Even when nothing changed, every scanner runs from scratch at least this often (seconds)
+FULL_RESCAN_INTERVAL = 600
 
-if os.path.exists(dat_file_path) and os.path.exists(item_dir):
-    with open(dat_file_path, 'r') as file:
-        dat_data = json.load(file)
+scan_index = {}
+scan_index_dirty = False
+scan_context = threading.local()
 
-    # Epic Game Scanner
-    for item_file in os.listdir(item_dir):
-        if item_file.endswith('.item'):
-            with open(os.path.join(item_dir, item_file), 'r') as file:
-                item_data = json.load(file)
+def game_entry(exe_path, appname, launch_options, start_dir, launcher_name=None, track_as=None):
+    # track_as is the launcher the game is tracked under, False for games that are not tracked
+    return {
+        "exe": exe_path,
+        "appname": appname,
+        "LaunchOptions": launch_options,
+        "StartDir": start_dir,
+        "Launcher": launcher_name,
+        "track_as": launcher_name if track_as is None else track_as,
+    }
 
-            # Initialize variables
-            display_name = item_data['DisplayName']
-            app_name = item_data['AppName']
-            exe_path = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{epic_games_launcher}/pfx/drive_c/Program Files/Epic Games/Launcher/Portal/Binaries/Win64/EpicGamesLauncher.exe\""
-            start_dir = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{epic_games_launcher}/pfx/drive_c/Program Files/Epic Games/Launcher/Portal/Binaries/Win64/\""
-            launch_options = f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{epic_games_launcher}/\" %command% -'com.epicgames.launcher://apps/{app_name}?action=launch&silent=true'"
-
-            # Check if the game is still installed and if the LaunchExecutable is valid, not content-related, and is a .exe file
-            if item_data['LaunchExecutable'].endswith('.exe') and "Content" not in item_data['DisplayName'] and "Content" not in item_data['InstallLocation']:
-                for game in dat_data['InstallationList']:
-                    if game['AppName'] == item_data['AppName']:
-                        create_new_entry(exe_path, display_name, launch_options, start_dir, launcher_name="Epic Games")
-                        track_game(display_name, "Epic Games")
-
-else:
-    print("Epic Games Launcher data not found. Skipping Epic Games Scanner.")
+def add_game(entry):
+    create_new_entry(entry["exe"], entry["appname"], entry["LaunchOptions"], entry["StartDir"], entry["Launcher"])
+    if entry["track_as"]:
+        track_game(entry["appname"], entry["track_as"])
+
+def compatdata_path(launcher_id, relative_path):
+    return f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{launcher_id}/{relative_path}"
+
+def load_json_file(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def content_hash(path):
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                digest.update(name.encode("utf-8", "surrogateescape") + b"\0")
+        else:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+# Inputs can also be glob patterns, for launchers that keep one file per game in a folder shared with other programs
+def input_pattern(path):
+    return "*" in os.path.basename(path)
+
+def pattern_matches(pattern):
+    matches = []
+    for path in sorted(glob.glob(pattern)):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        matches.append([path, st.st_size, st.st_mtime_ns])
+    return matches
+
+# [size, mtime_ns, content hash] of a file or directory, None if it does not exist
+def take_fingerprint(path):
+    if input_pattern(path):
+        # The names, sizes and mtimes of whatever the pattern matches
+        digest = hashlib.blake2b(json.dumps(pattern_matches(path)).encode("utf-8", "surrogateescape"), digest_size=16)
+        return [None, None, digest.hexdigest()]
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns, content_hash(path)]
+
+def fingerprint_unchanged(path, recorded):
+    if input_pattern(path):
+        return recorded == take_fingerprint(path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return recorded is None
+    if recorded is None:
+        return False
+    if recorded[0] == st.st_size and recorded[1] == st.st_mtime_ns:
+        return True
+    # Touched but not modified (launchers love rewriting identical files), keep the new stat so we don't hash it again
+    if recorded[2] is not None and recorded[2] == content_hash(path):
+        global scan_index_dirty
+        recorded[0], recorded[1] = st.st_size, st.st_mtime_ns
+        scan_index_dirty = True
+        return True
+    return False
+
+def script_fingerprint():
+    # A new version of the scanner may find different games, so it starts with a fresh index
+    try:
+        st = os.stat(os.path.abspath(__file__))
+        return [SCAN_INDEX_VERSION, st.st_size, st.st_mtime_ns]
+    except OSError:
+        return [SCAN_INDEX_VERSION]
+
+def load_scan_index():
+    global scan_index, scan_index_dirty
+    scan_index = {}
+    scan_index_dirty = False
+    try:
+        with open(scan_index_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("script") == script_fingerprint():
+            scan_index = data.get("scanners", {})
+        else:
+            print("Scanner was updated, starting with a fresh scan index.")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Could not read scan index, rescanning everything: {e}")
+
+def save_scan_index():
+    global scan_index_dirty
+    if not scan_index_dirty:
+        return
+    try:
+        os.makedirs(os.path.dirname(scan_index_path), exist_ok=True)
+        temp_path = scan_index_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"script": script_fingerprint(), "scanners": scan_index}, f)
+        os.replace(temp_path, scan_index_path)
+        scan_index_dirty = False
+    except Exception as e:
+        print(f"Could not save scan index: {e}")
+
+def cached_scan_entries(name, inputs):
+    record = scan_index.get(name)
+    if not record:
+        return None
+    if time.time() - record.get("scanned_at", 0) > FULL_RESCAN_INTERVAL:
+        return None
+    # Launcher ids or paths changed in env_vars
+    if record.get("declared") != sorted(inputs):
+        return None
+    for path, fingerprint in record["inputs"].items():
+        if not fingerprint_unchanged(path, fingerprint):
+            return None
+    for path, cached in record["files"].items():
+        if not fingerprint_unchanged(path, cached["fingerprint"]):
+            return None
+    return record["entries"]
+
+# Inputs a scanner only finds while it runs (game folders listed in a config file and such)
+def watch_input(path):
+    run = getattr(scan_context, "run", None)
+    if run is not None and path not in run["inputs"]:
+        run["inputs"][path] = take_fingerprint(path)
+
+# Parses a per-game manifest, reusing the result from the last scan when the file did not change
+def parse_cached(path, parser):
+    run = getattr(scan_context, "run", None)
+    if run is None:
+        return parser(path)
+    cached = run["previous_files"].get(path)
+    if cached is not None and fingerprint_unchanged(path, cached["fingerprint"]):
+        run["files"][path] = cached
+        return cached["result"]
+    fingerprint = take_fingerprint(path)
+    result = parser(path)
+    run["files"][path] = {"fingerprint": fingerprint, "result": result}
+    return result
+
+# changed=False is for scanners the change watcher has no news about, their cached entries are trusted without a stat
+def run_launcher_scanner(scanner, changed=True):
+    global scan_index_dirty
+    name = scanner.name
+    declared = sorted(scanner.inputs())
+    record = scan_index.get(name)
+    if not changed and record and record.get("declared") == declared and time.time() - record.get("scanned_at", 0) <= FULL_RESCAN_INTERVAL:
+        return record["entries"]
+
+    entries = cached_scan_entries(name, declared)
+    if entries is not None:
+        if entries:
+            print(f"{name}: nothing changed since the last scan, reusing {len(entries)} cached entries.")
+        return entries
+
+    # Fingerprint before parsing so a change made while we scan is picked up next time
+    previous = scan_index.get(name) or {}
+    scan_context.run = {
+        "inputs": {path: take_fingerprint(path) for path in declared},
+        "files": {},
+        "previous_files": previous.get("files", {}),
+    }
+    try:
+        entries = list(scanner.discover())
+        scan_index[name] = {
+            "declared": declared,
+            "inputs": scan_context.run["inputs"],
+            "files": scan_context.run["files"],
+            "entries": entries,
+            "scanned_at": time.time(),
+        }
+        scan_index_dirty = True
+    finally:
+        scan_context.run = None
+    return entries
+#End of Scan Index
+
+
+
+#Scanner Registry
+# Every launcher scanner registers itself together with the files it reads (used by the scan index and the change watcher).
+# discover() only yields game_entry() dicts, shortcuts are created afterwards from the merged results
+class LauncherScanner:
+    def __init__(self, name, discover, inputs):
+        self.name = name
+        self.discover = discover
+        self.inputs = inputs
+
+launcher_scanners = []
+
+def register_scanner(name, inputs=lambda: []):
+    def register(discover):
+        launcher_scanners.append(LauncherScanner(name, discover, inputs))
+        return discover
+    return register
+
+# Discovery only reads launcher files, so the scanners run side by side
+SCANNER_WORKERS = 8
+
+def discover_games(changed=None):
+    with ThreadPoolExecutor(max_workers=SCANNER_WORKERS, thread_name_prefix="scanner") as pool:
+        futures = [
+            pool.submit(run_launcher_scanner, scanner, changed is None or scanner.name in changed)
+            for scanner in launcher_scanners
+        ]
+        # Merge in registration order, no matter which scanner finished first
+        return [entry for future in futures for entry in future.result()]
+#End of Scanner Registry
+
+
+
+#Scanners
+# Epic Games Scanner
+@register_scanner("Epic Games", inputs=lambda: [
+    compatdata_path(epic_games_launcher, "pfx/drive_c/ProgramData/Epic/EpicGamesLauncher/Data/Manifests/"),
+    compatdata_path(epic_games_launcher, "pfx/drive_c/ProgramData/Epic/UnrealEngineLauncher/LauncherInstalled.dat"),
+])
+def scan_epic_games():
+    item_dir = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{epic_games_launcher}/pfx/drive_c/ProgramData/Epic/EpicGamesLauncher/Data/Manifests/"
+    dat_file_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{epic_games_launcher}/pfx/drive_c/ProgramData/Epic/UnrealEngineLauncher/LauncherInstalled.dat"
+
+    if os.path.exists(dat_file_path) and os.path.exists(item_dir):
+        with open(dat_file_path, 'r') as file:
+            dat_data = json.load(file)
+
+        # Epic Game Scanner
+        for item_file in os.listdir(item_dir):
+            if item_file.endswith('.item'):
+                # Manifests that did not change since the last scan are not parsed again
+                item_data = parse_cached(os.path.join(item_dir, item_file), load_json_file)
+
+                # Initialize variables
+                display_name = item_data['DisplayName']
+                app_name = item_data['AppName']
+                exe_path = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{epic_games_launcher}/pfx/drive_c/Program Files/Epic Games/Launcher/Portal/Binaries/Win64/EpicGamesLauncher.exe\""
+                start_dir = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{epic_games_launcher}/pfx/drive_c/Program Files/Epic Games/Launcher/Portal/Binaries/Win64/\""
+                launch_options = f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{epic_games_launcher}/\" %command% -'com.epicgames.launcher://apps/{app_name}?action=launch&silent=true'"
+
+                # Check if the game is still installed and if the LaunchExecutable is valid, not content-related, and is a .exe file
+                if item_data['LaunchExecutable'].endswith('.exe') and "Content" not in item_data['DisplayName'] and "Content" not in item_data['InstallLocation']:
+                    for game in dat_data['InstallationList']:
+                        if game['AppName'] == item_data['AppName']:
+                            yield game_entry(exe_path, display_name, launch_options, start_dir, launcher_name="Epic Games")
+
+    else:
+        print("Epic Games Launcher data not found. Skipping Epic Games Scanner.")
 # End of the Epic Games Scanner
 
 
@@ -4888,44 +6605,48 @@ def getUplayGameInfo(folderPath, filePath):
 
     return game_dict
 
-# Define your paths
-data_folder_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ubisoft_connect_launcher}/pfx/drive_c/Program Files (x86)/Ubisoft/Ubisoft Game Launcher/data/"
-registry_file_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ubisoft_connect_launcher}/pfx/system.reg"
-
-# Check if the paths exist
-if not os.path.exists(data_folder_path) or not os.path.exists(registry_file_path):
-    print("One or more paths do not exist.")
-    print("Ubisoft Connect game data not found. Skipping Ubisoft Games Scanner.")
-else:
-    game_dict = getUplayGameInfo(data_folder_path, registry_file_path)
-
-    # Optional mapping for known sub-launch games
-    sublaunch_map = {
-        "Assassin's Creed III Remastered": {
-            "Assassin's Creed Liberation Remastered": "/1"
-        },
-        # Add more bundles here if needed
-    }
+@register_scanner("Ubisoft Connect", inputs=lambda: [
+    compatdata_path(ubisoft_connect_launcher, "pfx/drive_c/Program Files (x86)/Ubisoft/Ubisoft Game Launcher/data/"),
+    compatdata_path(ubisoft_connect_launcher, "pfx/system.reg"),
+])
+def scan_ubisoft_connect():
+    # Define your paths
+    data_folder_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ubisoft_connect_launcher}/pfx/drive_c/Program Files (x86)/Ubisoft/Ubisoft Game Launcher/data/"
+    registry_file_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ubisoft_connect_launcher}/pfx/system.reg"
+
+    # Check if the paths exist
+    if not os.path.exists(data_folder_path) or not os.path.exists(registry_file_path):
+        print("One or more paths do not exist.")
+        print("Ubisoft Connect game data not found. Skipping Ubisoft Games Scanner.")
+    else:
+        game_dict = getUplayGameInfo(data_folder_path, registry_file_path)
+
+        # Optional mapping for known sub-launch games
+        sublaunch_map = {
+            "Assassin's Creed III Remastered": {
+                "Assassin's Creed Liberation Remastered": "/1"
+            },
+            # Add more bundles here if needed
+        }
 
-    # Inject bundled sub-games based on known mappings
-    for parent, subs in sublaunch_map.items():
-        if parent in game_dict:
-            for sub_name, suffix in subs.items():
-                if sub_name not in game_dict:
-                    game_dict[sub_name] = (game_dict[parent], suffix)
+        # Inject bundled sub-games based on known mappings
+        for parent, subs in sublaunch_map.items():
+            if parent in game_dict:
+                for sub_name, suffix in subs.items():
+                    if sub_name not in game_dict:
+                        game_dict[sub_name] = (game_dict[parent], suffix)
 
-    for game, data in game_dict.items():
-        if isinstance(data, tuple):
-            uplay_id, suffix = data
-        else:
-            uplay_id = data
-            suffix = "/0"
+        for game, data in game_dict.items():
+            if isinstance(data, tuple):
+                uplay_id, suffix = data
+            else:
+                uplay_id = data
+                suffix = "/0"
 
-        launch_options = f'STEAM_COMPAT_DATA_PATH="{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ubisoft_connect_launcher}/" %command% "uplay://launch/{uplay_id}{suffix}"'
-        exe_path = f'"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ubisoft_connect_launcher}/pfx/drive_c/Program Files (x86)/Ubisoft/Ubisoft Game Launcher/upc.exe"'
-        start_dir = f'"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ubisoft_connect_launcher}/pfx/drive_c/Program Files (x86)/Ubisoft/Ubisoft Game Launcher/"'
-        create_new_entry(exe_path, game, launch_options, start_dir, launcher_name="Ubisoft Connect")
-        track_game(game, "Ubisoft Connect")
+            launch_options = f'STEAM_COMPAT_DATA_PATH="{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ubisoft_connect_launcher}/" %command% "uplay://launch/{uplay_id}{suffix}"'
+            exe_path = f'"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ubisoft_connect_launcher}/pfx/drive_c/Program Files (x86)/Ubisoft/Ubisoft Game Launcher/upc.exe"'
+            start_dir = f'"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ubisoft_connect_launcher}/pfx/drive_c/Program Files (x86)/Ubisoft/Ubisoft Game Launcher/"'
+            yield game_entry(exe_path, game, launch_options, start_dir, launcher_name="Ubisoft Connect")
 
 # End of Ubisoft Game Scanner
 
@@ -5091,64 +6812,70 @@ def find_external_game_paths():
     return [p for p in possible_paths if os.path.isdir(p)]
 
 # --- Main EA App Scanner ---
-if not ea_app_launcher:
-    print("EA App launcher ID not set. Skipping EA App Scanner.")
-else:
-    game_directory_path = None
-
-    # 1. Default paths
-    default_paths = [
-        f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ea_app_launcher}/pfx/drive_c/Program Files/EA Games/",
-        f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ea_app_launcher}/pfx/drive_c/Program Files (x86)/EA Games/"
-    ]
-    for path in default_paths:
-        if os.path.isdir(path):
-            game_directory_path = path
-            print(f"Found EA App games in default path: {path}")
-            break
-
-    # 2. Registry fallback
-    if not game_directory_path:
-        detected_path = find_ea_games_path_from_registry()
-        if detected_path and os.path.isdir(detected_path):
-            game_directory_path = detected_path
-            print(f"Found EA App games via registry: {detected_path}")
-
-    # 3. External drives
-    if not game_directory_path:
-        external_paths = find_external_game_paths()
-        if external_paths:
-            game_directory_path = external_paths[0]
-            print(f"Using external EA App game path: {game_directory_path}")
-
-    # 4. Validate path
-    if not game_directory_path or not os.path.isdir(game_directory_path):
-        print("EA App game data not found. Skipping EA App Scanner.")
-        print("Paths tried:", default_paths)
-        print("Registry detected path:", detected_path if 'detected_path' in locals() else None)
-        print("External paths:", external_paths if 'external_paths' in locals() else None)
+@register_scanner("EA App", inputs=lambda: [
+    compatdata_path(ea_app_launcher, "pfx/drive_c/Program Files/EA Games/"),
+    compatdata_path(ea_app_launcher, "pfx/drive_c/Program Files (x86)/EA Games/"),
+    compatdata_path(ea_app_launcher, "pfx/system.reg"),
+    "/run/media/deck/",
+])
+def scan_ea_app():
+    if not ea_app_launcher:
+        print("EA App launcher ID not set. Skipping EA App Scanner.")
     else:
-        try:
-            installed_games = [g for g in os.listdir(game_directory_path)
-                               if os.path.isdir(os.path.join(game_directory_path, g))]
+        game_directory_path = None
 
-            sys_reg_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ea_app_launcher}/pfx/system.reg"
+        # 1. Default paths
+        default_paths = [
+            f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ea_app_launcher}/pfx/drive_c/Program Files/EA Games/",
+            f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ea_app_launcher}/pfx/drive_c/Program Files (x86)/EA Games/"
+        ]
+        for path in default_paths:
+            if os.path.isdir(path):
+                game_directory_path = path
+                print(f"Found EA App games in default path: {path}")
+                break
 
-            game_dict = get_ea_app_game_info(installed_games, game_directory_path, sys_reg_file=sys_reg_path)
+        # 2. Registry fallback
+        if not game_directory_path:
+            detected_path = find_ea_games_path_from_registry()
+            if detected_path and os.path.isdir(detected_path):
+                game_directory_path = detected_path
+                print(f"Found EA App games via registry: {detected_path}")
+
+        # 3. External drives
+        if not game_directory_path:
+            external_paths = find_external_game_paths()
+            if external_paths:
+                game_directory_path = external_paths[0]
+                print(f"Using external EA App game path: {game_directory_path}")
+
+        # 4. Validate path
+        if not game_directory_path or not os.path.isdir(game_directory_path):
+            print("EA App game data not found. Skipping EA App Scanner.")
+            print("Paths tried:", default_paths)
+            print("Registry detected path:", detected_path if 'detected_path' in locals() else None)
+            print("External paths:", external_paths if 'external_paths' in locals() else None)
+        else:
+            try:
+                installed_games = [g for g in os.listdir(game_directory_path)
+                                   if os.path.isdir(os.path.join(game_directory_path, g))]
 
-            if not game_dict:
-                print("No EA App games found in scanned directories.")
-            else:
-                for game, ea_ids in game_dict.items():
-                    launch_options = f'STEAM_COMPAT_DATA_PATH="{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ea_app_launcher}/" %command% "origin2://game/launch?offerIds={ea_ids}"'
-                    exe_path = f'"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ea_app_launcher}/pfx/drive_c/Program Files/Electronic Arts/EA Desktop/EA Desktop/EALaunchHelper.exe"'
-                    start_dir = f'"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ea_app_launcher}/pfx/drive_c/Program Files/Electronic Arts/EA Desktop/EA Desktop/"'
+                sys_reg_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ea_app_launcher}/pfx/system.reg"
 
-                    create_new_entry(exe_path, game, launch_options, start_dir, launcher_name="EA App")
-                    track_game(game, "EA App")
+                game_dict = get_ea_app_game_info(installed_games, game_directory_path, sys_reg_file=sys_reg_path)
 
-        except Exception as e:
-            print(f"Error scanning EA App games: {e}")
+                if not game_dict:
+                    print("No EA App games found in scanned directories.")
+                else:
+                    for game, ea_ids in game_dict.items():
+                        launch_options = f'STEAM_COMPAT_DATA_PATH="{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ea_app_launcher}/" %command% "origin2://game/launch?offerIds={ea_ids}"'
+                        exe_path = f'"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ea_app_launcher}/pfx/drive_c/Program Files/Electronic Arts/EA Desktop/EA Desktop/EALaunchHelper.exe"'
+                        start_dir = f'"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{ea_app_launcher}/pfx/drive_c/Program Files/Electronic Arts/EA Desktop/EA Desktop/"'
+
+                        yield game_entry(exe_path, game, launch_options, start_dir, launcher_name="EA App")
+
+            except Exception as e:
+                print(f"Error scanning EA App games: {e}")
 # End of EA App Scanner
 
 
@@ -5234,23 +6961,27 @@ def adjust_dosbox_launch_options(launch_command, game_id, logged_in_home, gog_ga
 
 
 
-db_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gog_galaxy_launcher}/pfx/drive_c/ProgramData/GOG.com/Galaxy/storage/galaxy-2.0.db"
+@register_scanner("GOG Galaxy", inputs=lambda: [
+    compatdata_path(gog_galaxy_launcher, "pfx/drive_c/ProgramData/GOG.com/Galaxy/storage/galaxy-2.0.db"),
+    compatdata_path(gog_galaxy_launcher, "pfx/drive_c/ProgramData/GOG.com/Galaxy/storage/galaxy-2.0.db-wal"),
+])
+def scan_gog_galaxy():
+    db_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gog_galaxy_launcher}/pfx/drive_c/ProgramData/GOG.com/Galaxy/storage/galaxy-2.0.db"
 
-if os.path.exists(db_path):
-    game_dict = getGogGameInfoDB(db_path, logged_in_home, gog_galaxy_launcher)
+    if os.path.exists(db_path):
+        game_dict = getGogGameInfoDB(db_path, logged_in_home, gog_galaxy_launcher)
 
-    for game, info in game_dict.items():
-        launch_options = adjust_dosbox_launch_options(
-            info['exe'], info['id'], logged_in_home, gog_galaxy_launcher, launch_args=info['launchParams']
-        )
+        for game, info in game_dict.items():
+            launch_options = adjust_dosbox_launch_options(
+                info['exe'], info['id'], logged_in_home, gog_galaxy_launcher, launch_args=info['launchParams']
+            )
 
-        exe_path = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gog_galaxy_launcher}/pfx/drive_c/Program Files (x86)/GOG Galaxy/GalaxyClient.exe\""
-        start_dir = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gog_galaxy_launcher}/pfx/drive_c/Program Files (x86)/GOG Galaxy/\""
+            exe_path = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gog_galaxy_launcher}/pfx/drive_c/Program Files (x86)/GOG Galaxy/GalaxyClient.exe\""
+            start_dir = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gog_galaxy_launcher}/pfx/drive_c/Program Files (x86)/GOG Galaxy/\""
 
-        create_new_entry(exe_path, game, launch_options, start_dir, launcher_name="GOG Galaxy")
-        track_game(game, "GOG Galaxy")
-else:
-    print(f"GOG Galaxy DB not found at {db_path}")
+            yield game_entry(exe_path, game, launch_options, start_dir, launcher_name="GOG Galaxy")
+    else:
+        print(f"GOG Galaxy DB not found at {db_path}")
 
 
 #End of GOG Galaxy Scanner
@@ -5339,86 +7070,89 @@ def parse_battlenet_config(config_file_path):
     return game_dict
 
 
-game_dict = {}
-
-print("Detected platform: Non-Windows")
-config_file_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{bnet_launcher}/pfx/drive_c/users/steamuser/AppData/Roaming/Battle.net/Battle.net.config"
-
-print(f"Config file path: {config_file_path}")
-
-if os.path.exists(config_file_path):
-    print("Battle.net config file found, parsing...")
-    game_dict = parse_battlenet_config(config_file_path)
-else:
-    print("Battle.net config file not found. Skipping Battle.net Games Scanner.")
-
-if game_dict:
-    for raw_key, game_info in game_dict.items():
-
-        print(f"Processing game: {raw_key}")
-
-        game_key = raw_key
-
-        if game_key == "prometheus":
-            game_key = "Pro"
-        elif game_key == "fenris":
-            game_key = "Fen"
-        elif game_key == "diablo3":
-            game_key = "D3"
-        elif game_key == "hs_beta":
-            game_key = "WTCG"
-        elif game_key == "wow_classic":
-            game_key = "WoWC"
-        elif game_key == "wow":
-            game_key = "WoW"
-        elif game_key == "aqua":
-            game_key = "Aqua"
-        elif game_key == "aris":
-            game_key = "Aris"
-        elif game_key == "heroes":
-            game_key = "Hero"
-        elif game_key == "gryphon":
-            game_key = "GRY"
-        elif game_key == "lbra":
-            game_key = "LBRA"
-        elif game_key == "wow_classic_era":
-            game_key = "WoWC"
-        elif game_key in ("seaofthieves", "sot", "scor"):
-            game_key = "SCOR"
-
-
-        game_name = flavor_mapping.get(game_key)
-
-        if not game_name:
-            game_name = flavor_mapping.get(game_key.upper())
+@register_scanner("Battle.net", inputs=lambda: [
+    compatdata_path(bnet_launcher, "pfx/drive_c/users/steamuser/AppData/Roaming/Battle.net/Battle.net.config"),
+])
+def scan_battlenet():
+    game_dict = {}
 
-        if not game_name:
-            game_name = flavor_mapping.get(game_key.lower())
+    print("Detected platform: Non-Windows")
+    config_file_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{bnet_launcher}/pfx/drive_c/users/steamuser/AppData/Roaming/Battle.net/Battle.net.config"
 
-        if not game_name:
-            game_name = flavor_mapping.get(game_key.title())
+    print(f"Config file path: {config_file_path}")
 
-        if not game_name:
-            print(f"Unknown game mapping: {game_key}, skipping")
-            continue
+    if os.path.exists(config_file_path):
+        print("Battle.net config file found, parsing...")
+        game_dict = parse_battlenet_config(config_file_path)
+    else:
+        print("Battle.net config file not found. Skipping Battle.net Games Scanner.")
+
+    if game_dict:
+        for raw_key, game_info in game_dict.items():
+
+            print(f"Processing game: {raw_key}")
+
+            game_key = raw_key
+
+            if game_key == "prometheus":
+                game_key = "Pro"
+            elif game_key == "fenris":
+                game_key = "Fen"
+            elif game_key == "diablo3":
+                game_key = "D3"
+            elif game_key == "hs_beta":
+                game_key = "WTCG"
+            elif game_key == "wow_classic":
+                game_key = "WoWC"
+            elif game_key == "wow":
+                game_key = "WoW"
+            elif game_key == "aqua":
+                game_key = "Aqua"
+            elif game_key == "aris":
+                game_key = "Aris"
+            elif game_key == "heroes":
+                game_key = "Hero"
+            elif game_key == "gryphon":
+                game_key = "GRY"
+            elif game_key == "lbra":
+                game_key = "LBRA"
+            elif game_key == "wow_classic_era":
+                game_key = "WoWC"
+            elif game_key in ("seaofthieves", "sot", "scor"):
+                game_key = "SCOR"
+
+
+            game_name = flavor_mapping.get(game_key)
+
+            if not game_name:
+                game_name = flavor_mapping.get(game_key.upper())
+
+            if not game_name:
+                game_name = flavor_mapping.get(game_key.lower())
+
+            if not game_name:
+                game_name = flavor_mapping.get(game_key.title())
+
+            if not game_name:
+                print(f"Unknown game mapping: {game_key}, skipping")
+                continue
 
-        print(f"Resolved {raw_key} -> {game_name}")
+            print(f"Resolved {raw_key} -> {game_name}")
 
 
-        exe_path = f'"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{bnet_launcher}/pfx/drive_c/Program Files (x86)/Battle.net/Battle.net.exe"'
-        start_dir = f'"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{bnet_launcher}/pfx/drive_c/Program Files (x86)/Battle.net/"'
+            exe_path = f'"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{bnet_launcher}/pfx/drive_c/Program Files (x86)/Battle.net/Battle.net.exe"'
+            start_dir = f'"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{bnet_launcher}/pfx/drive_c/Program Files (x86)/Battle.net/"'
 
-        launch_options = (
-            f'STEAM_COMPAT_DATA_PATH="{logged_in_home}/.local/share/Steam/steamapps/compatdata/{bnet_launcher}" '
-            f'%command% --exec="launch {game_key}" battlenet://{game_key}'
-        )
+            launch_options = (
+                f'STEAM_COMPAT_DATA_PATH="{logged_in_home}/.local/share/Steam/steamapps/compatdata/{bnet_launcher}" '
+                f'%command% --exec="launch {game_key}" battlenet://{game_key}'
+            )
 
-        print(f"Creating entry for {game_name}")
+            print(f"Creating entry for {game_name}")
 
-        create_new_entry(exe_path, game_name, launch_options, start_dir, launcher_name="Battle.net")
-        track_game(game_name, "Battle.net")
+            yield game_entry(exe_path, game_name, launch_options, start_dir, launcher_name="Battle.net")
 
-print("Battle.net Games Scanner completed.")
+    print("Battle.net Games Scanner completed.")
 
 # End of Battle.net Scanner
 
@@ -5462,17 +7196,22 @@ def get_amazon_games():
         result.append({"id": id, "title": title, "launcher_path": launcher_path})
     return result
 
-amazon_games = get_amazon_games()
-if amazon_games:
-    for game in amazon_games:
+@register_scanner("Amazon Games", inputs=lambda: [
+    compatdata_path(amazon_launcher, "pfx/drive_c/users/steamuser/AppData/Local/Amazon Games/Data/Games/Sql/GameInstallInfo.sqlite"),
+    compatdata_path(amazon_launcher, "pfx/drive_c/users/steamuser/AppData/Local/Amazon Games/Data/Games/Sql/GameInstallInfo.sqlite-wal"),
+    compatdata_path(amazon_launcher, "pfx/drive_c/users/steamuser/AppData/Local/Amazon Games/App/Amazon Games.exe"),
+])
+def scan_amazon_games():
+    amazon_games = get_amazon_games()
+    if amazon_games:
+        for game in amazon_games:
 
-        # Initialize variables
-        display_name = game['title']
-        exe_path = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{amazon_launcher}/pfx/drive_c/users/steamuser/AppData/Local/Amazon Games/App/Amazon Games.exe\""
-        start_dir = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{amazon_launcher}/pfx/drive_c/users/steamuser/AppData/Local/Amazon Games/App/\""
-        launch_options = f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{amazon_launcher}/\" %command% -'amazon-games://play/{game['id']}'"
-        create_new_entry(exe_path, display_name, launch_options, start_dir, launcher_name="Amazon Games")
-        track_game(display_name, "Amazon Games")
+            # Initialize variables
+            display_name = game['title']
+            exe_path = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{amazon_launcher}/pfx/drive_c/users/steamuser/AppData/Local/Amazon Games/App/Amazon Games.exe\""
+            start_dir = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{amazon_launcher}/pfx/drive_c/users/steamuser/AppData/Local/Amazon Games/App/\""
+            launch_options = f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{amazon_launcher}/\" %command% -'amazon-games://play/{game['id']}'"
+            yield game_entry(exe_path, display_name, launch_options, start_dir, launcher_name="Amazon Games")
 
 
 
@@ -5482,124 +7221,132 @@ if amazon_games:
 
 # Itchio Scanner
 
-# Set up the path to the Butler database
-itch_db_location = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{itchio_launcher}/pfx/drive_c/users/steamuser/AppData/Roaming/itch/db/butler.db"
-
-# Check if the database path exists
-if not os.path.exists(itch_db_location):
-    print(f"Path not found: {itch_db_location}. Aborting Itch.io scan...")
-else:
-    # Connect to the SQLite database
-    conn = sqlite3.connect(itch_db_location)
-    cursor = conn.cursor()
-
-    # Fetch data from the 'caves' table
-    cursor.execute("SELECT * FROM caves;")
-    caves = cursor.fetchall()
-
-    # Fetch data from the 'games' table
-    cursor.execute("SELECT * FROM games;")
-    games = cursor.fetchall()
-
-    # Create a dictionary to store game information by game_id
-    games_dict = {game[0]: game for game in games}
-
-    # List to store final Itch.io game details
-    itchgames = []
-
-    # Match game_id between 'caves' and 'games' tables and collect relevant game details
-    for cave in caves:
-        game_id = cave[1]
-        if game_id in games_dict:
-            game_info = games_dict[game_id]
-            cave_info = json.loads(cave[11])
-            base_path = cave_info['basePath']
-            candidates = cave_info.get('candidates', [])
-
-            # Check if candidates exist and are not empty
-            if candidates:
-                executable_path = candidates[0].get('path', None)
-
-                # If there's no valid executable path, skip this entry
-                if not executable_path:
-                    print(f"Skipping game (no executable found): {game_info[2]}")
-                    continue
+@register_scanner("itch.io", inputs=lambda: [
+    compatdata_path(itchio_launcher, "pfx/drive_c/users/steamuser/AppData/Roaming/itch/db/butler.db"),
+    compatdata_path(itchio_launcher, "pfx/drive_c/users/steamuser/AppData/Roaming/itch/db/butler.db-wal"),
+])
+def scan_itchio():
+    # Set up the path to the Butler database
+    itch_db_location = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{itchio_launcher}/pfx/drive_c/users/steamuser/AppData/Roaming/itch/db/butler.db"
+
+    # Check if the database path exists
+    if not os.path.exists(itch_db_location):
+        print(f"Path not found: {itch_db_location}. Aborting Itch.io scan...")
+    else:
+        # Connect to the SQLite database
+        conn = sqlite3.connect(itch_db_location)
+        cursor = conn.cursor()
+
+        # Fetch data from the 'caves' table
+        cursor.execute("SELECT * FROM caves;")
+        caves = cursor.fetchall()
+
+        # Fetch data from the 'games' table
+        cursor.execute("SELECT * FROM games;")
+        games = cursor.fetchall()
+
+        # Create a dictionary to store game information by game_id
+        games_dict = {game[0]: game for game in games}
+
+        # List to store final Itch.io game details
+        itchgames = []
+
+        # Match game_id between 'caves' and 'games' tables and collect relevant game details
+        for cave in caves:
+            game_id = cave[1]
+            if game_id in games_dict:
+                game_info = games_dict[game_id]
+                cave_info = json.loads(cave[11])
+                base_path = cave_info['basePath']
+                candidates = cave_info.get('candidates', [])
+
+                # Check if candidates exist and are not empty
+                if candidates:
+                    executable_path = candidates[0].get('path', None)
+
+                    # If there's no valid executable path, skip this entry
+                    if not executable_path:
+                        print(f"Skipping game (no executable found): {game_info[2]}")
+                        continue
 
-                # Skip games with an executable that ends with '.html' (browser games)
-                if executable_path.endswith('.html'):
-                    print(f"Skipping browser game: {game_info[2]}")
-                    continue
+                    # Skip games with an executable that ends with '.html' (browser games)
+                    if executable_path.endswith('.html'):
+                        print(f"Skipping browser game: {game_info[2]}")
+                        continue
 
-                # Extract the game title
-                game_title = game_info[2]
+                    # Extract the game title
+                    game_title = game_info[2]
 
-                # Append the game info (base path, executable path, game title) to the list
-                itchgames.append((base_path, executable_path, game_title))
-            else:
-                print(f"Skipping game (no candidates): {game_info[2]}")
+                    # Append the game info (base path, executable path, game title) to the list
+                    itchgames.append((base_path, executable_path, game_title))
+                else:
+                    print(f"Skipping game (no candidates): {game_info[2]}")
 
-    # Process each game for creating new entries
-    for base_path, executable, game_title in itchgames:
-        base_path_linux = base_path.replace("C:\\", f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{itchio_launcher}/pfx/drive_c/").replace("\\", "/")
-        exe_path = "\"" + os.path.join(base_path_linux, executable).replace("\\", "/") + "\""
-        start_dir = "\"" + base_path_linux + "\""
-        launchoptions = f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{itchio_launcher}/\" %command%"
+        # Process each game for creating new entries
+        for base_path, executable, game_title in itchgames:
+            base_path_linux = base_path.replace("C:\\", f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{itchio_launcher}/pfx/drive_c/").replace("\\", "/")
+            exe_path = "\"" + os.path.join(base_path_linux, executable).replace("\\", "/") + "\""
+            start_dir = "\"" + base_path_linux + "\""
+            launchoptions = f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{itchio_launcher}/\" %command%"
 
-        # Call the provided function to create a new entry for the game
-        create_new_entry(exe_path, game_title, launchoptions, start_dir, launcher_name="itch.io")
-        track_game(game_title, "itch.io")
+            # Call the provided function to create a new entry for the game
+            yield game_entry(exe_path, game_title, launchoptions, start_dir, launcher_name="itch.io")
 
-    # Close the database connection
-    conn.close()
+        # Close the database connection
+        conn.close()
 
 # End of Itch.io Scanner
 
 
 
 #Legacy Games Scanner
-legacy_dir = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{legacy_launcher}/pfx/drive_c/Program Files/Legacy Games/"
-
-if not os.path.exists(legacy_dir):
-    print("Legacy directory not found. Skipping creation.")
-else:
-    user_reg_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{legacy_launcher}/pfx/user.reg"
-    with open(user_reg_path, 'r') as file:
-        user_reg = file.read()
+@register_scanner("Legacy Games", inputs=lambda: [
+    compatdata_path(legacy_launcher, "pfx/drive_c/Program Files/Legacy Games/"),
+    compatdata_path(legacy_launcher, "pfx/user.reg"),
+])
+def scan_legacy_games():
+    legacy_dir = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{legacy_launcher}/pfx/drive_c/Program Files/Legacy Games/"
+
+    if not os.path.exists(legacy_dir):
+        print("Legacy directory not found. Skipping creation.")
+    else:
+        user_reg_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{legacy_launcher}/pfx/user.reg"
+        with open(user_reg_path, 'r') as file:
+            user_reg = file.read()
 
-    for game_dir in os.listdir(legacy_dir):
-        if game_dir == "Legacy Games Launcher":
-            continue
+        for game_dir in os.listdir(legacy_dir):
+            if game_dir == "Legacy Games Launcher":
+                continue
 
-        print(f"Processing game directory: {game_dir}")
+            print(f"Processing game directory: {game_dir}")
 
-        if game_dir == "100 Doors Escape from School":
-            app_info_path = f"{legacy_dir}/100 Doors Escape from School/100 Doors Escape From School_Data/app.info"
-            exe_path = f"{legacy_dir}/100 Doors Escape from School/100 Doors Escape From School.exe"
-        else:
-            app_info_path = os.path.join(legacy_dir, game_dir, game_dir.replace(" ", "") + "_Data", "app.info")
-            exe_path = os.path.join(legacy_dir, game_dir, game_dir.replace(" ", "") + ".exe")
-
-        if os.path.exists(app_info_path):
-            print("app.info file found.")
-            with open(app_info_path, 'r') as file:
-                lines = file.read().split('\n')
-                game_name = lines[1].strip()
-                print(f"Game Name: {game_name}")
-        else:
-            print("No app.info file found.")
-
-        if os.path.exists(exe_path):
-            game_exe_reg = re.search(r'\[Software\\\\Legacy Games\\\\' + re.escape(game_dir) + r'\].*?"GameExe"="([^"]*)"', user_reg, re.DOTALL | re.IGNORECASE)
-            if game_exe_reg and game_exe_reg.group(1).lower() == os.path.basename(exe_path).lower():
-                print(f"GameExe found in user.reg: {game_exe_reg.group(1)}")
-                start_dir = f"{legacy_dir}{game_dir}"
-                launch_options = f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{legacy_launcher}\" %command%"
-                create_new_entry(f'"{exe_path}"', game_name, launch_options, f'"{start_dir}"', launcher_name="Legacy Games")
-                track_game(game_name, "Legacy Games")
+            if game_dir == "100 Doors Escape from School":
+                app_info_path = f"{legacy_dir}/100 Doors Escape from School/100 Doors Escape From School_Data/app.info"
+                exe_path = f"{legacy_dir}/100 Doors Escape from School/100 Doors Escape From School.exe"
             else:
-                print(f"No matching .exe file found for game: {game_dir}")
-        else:
-            print(f"No .exe file found for game: {game_dir}")
+                app_info_path = os.path.join(legacy_dir, game_dir, game_dir.replace(" ", "") + "_Data", "app.info")
+                exe_path = os.path.join(legacy_dir, game_dir, game_dir.replace(" ", "") + ".exe")
+
+            if os.path.exists(app_info_path):
+                print("app.info file found.")
+                with open(app_info_path, 'r') as file:
+                    lines = file.read().split('\n')
+                    game_name = lines[1].strip()
+                    print(f"Game Name: {game_name}")
+            else:
+                print("No app.info file found.")
+
+            if os.path.exists(exe_path):
+                game_exe_reg = re.search(r'\[Software\\\\Legacy Games\\\\' + re.escape(game_dir) + r'\].*?"GameExe"="([^"]*)"', user_reg, re.DOTALL | re.IGNORECASE)
+                if game_exe_reg and game_exe_reg.group(1).lower() == os.path.basename(exe_path).lower():
+                    print(f"GameExe found in user.reg: {game_exe_reg.group(1)}")
+                    start_dir = f"{legacy_dir}{game_dir}"
+                    launch_options = f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{legacy_launcher}\" %command%"
+                    yield game_entry(f'"{exe_path}"', game_name, launch_options, f'"{start_dir}"', launcher_name="Legacy Games")
+                else:
+                    print(f"No matching .exe file found for game: {game_dir}")
+            else:
+                print(f"No .exe file found for game: {game_dir}")
 
 #End of the Legacy Games Scanner
 
@@ -5609,126 +7356,103 @@ else:
 
 # Define paths
 
-gamecenter_ini_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{vkplay_launcher}/pfx/drive_c/users/steamuser/AppData/Local/GameCenter/GameCenter.ini"
-cache_folder_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{vkplay_launcher}/pfx/drive_c/users/steamuser/AppData/Local/GameCenter/Cache/GameDescription/"
-
-# Check if the GameCenter.ini file exists
-if not os.path.exists(gamecenter_ini_path):
-    print(f"VK Play scanner skipped: {gamecenter_ini_path} does not exist.")
-else:
-    print(f"Found file: {gamecenter_ini_path}")
-    config = configparser.ConfigParser()
-
-    # Read the GameCenter.ini file
-    try:
-        with open(gamecenter_ini_path, 'r', encoding='utf-16') as file:
-            config.read_file(file)
-        print("File read successfully.")
-    except Exception as e:
-        print(f"Error reading the file: {e}")
-        exit(1)
-
-    # Collect game IDs from different sections
-    game_ids = set()
-
-    # Parse game IDs from the 'StartDownloadingGames' section
-    if 'StartDownloadingGames' in config:
-        downloaded_games = dict(config.items('StartDownloadingGames'))
-        game_ids.update(downloaded_games.keys())
-
-    # Parse game IDs from the 'FirstOpeningGameIds' section
-    if 'FirstOpeningGameIds' in config:
-        first_opening_game_ids = config['FirstOpeningGameIds'].get('FirstOpeningGameIds', '').split(';')
-        game_ids.update(first_opening_game_ids)
-
-    # Parse game IDs from the 'GamePersIds' section
-    if 'GamePersIds' in config:
-        for key in config['GamePersIds']:
-            game_id = key.split('_')[0]
-            game_ids.add(game_id)
-
-    # Parse game IDs from the 'RunningGameClients' section
-    if 'RunningGameClients' in config:
-        running_game_clients = config['RunningGameClients'].get('RunningGameClients', '').split(';')
-        game_ids.update(running_game_clients)
-
-    # Parse game IDs from the 'LastAccessGames' section
-    if 'LastAccessGames' in config:
-        last_access_games = dict(config.items('LastAccessGames'))
-        game_ids.update(last_access_games.keys())
-
-    # Parse game IDs from the 'UndoList' section
-    if 'UndoList' in config:
-        for key in config['UndoList']:
-            if 'vkplay://show' in config['UndoList'][key]:
-                game_id = config['UndoList'][key].split('/')[1]
-                game_ids.add(game_id)
-
-    # Parse game IDs from the 'LeftBar' section
-    if 'LeftBar' in config:
-        left_bar_ids = config['LeftBar'].get('Ids', '').split(';')
-        game_ids.update(left_bar_ids)
+@register_scanner("VK Play", inputs=lambda: [
+    compatdata_path(vkplay_launcher, "pfx/drive_c/users/steamuser/AppData/Local/GameCenter/GameCenter.ini"),
+    compatdata_path(vkplay_launcher, "pfx/drive_c/users/steamuser/AppData/Local/GameCenter/Cache/GameDescription/"),
+])
+def scan_vkplay():
+    gamecenter_ini_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{vkplay_launcher}/pfx/drive_c/users/steamuser/AppData/Local/GameCenter/GameCenter.ini"
+    cache_folder_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{vkplay_launcher}/pfx/drive_c/users/steamuser/AppData/Local/GameCenter/Cache/GameDescription/"
+
+    # Check if the GameCenter.ini file exists
+    if not os.path.exists(gamecenter_ini_path):
+        print(f"VK Play scanner skipped: {gamecenter_ini_path} does not exist.")
+    else:
+        print(f"Found file: {gamecenter_ini_path}")
+        config = configparser.ConfigParser()
 
-    # Parse game IDs from the 'Ad' section
-    if 'Ad' in config:
-        for key in config['Ad']:
-            if 'IdMTLink' in key:
-                game_id = key.split('0.')[1]
+        # Read the GameCenter.ini file
+        try:
+            with open(gamecenter_ini_path, 'r', encoding='utf-16') as file:
+                config.read_file(file)
+            print("File read successfully.")
+        except Exception as e:
+            print(f"Error reading the file: {e}")
+            raise
+
+        # Collect game IDs from different sections
+        game_ids = set()
+
+        # Parse game IDs from the 'StartDownloadingGames' section
+        if 'StartDownloadingGames' in config:
+            downloaded_games = dict(config.items('StartDownloadingGames'))
+            game_ids.update(downloaded_games.keys())
+
+        # Parse game IDs from the 'FirstOpeningGameIds' section
+        if 'FirstOpeningGameIds' in config:
+            first_opening_game_ids = config['FirstOpeningGameIds'].get('FirstOpeningGameIds', '').split(';')
+            game_ids.update(first_opening_game_ids)
+
+        # Parse game IDs from the 'GamePersIds' section
+        if 'GamePersIds' in config:
+            for key in config['GamePersIds']:
+                game_id = key.split('_')[0]
                 game_ids.add(game_id)
 
-    print("\nGame IDs found in GameCenter.ini file:")
-    for game_id in game_ids:
-        print(f"ID: {game_id}")
-
-    # Handle the Cache folder
-    if not os.path.exists(cache_folder_path):
-        print(f"VK Play scanner skipped: Cache folder {cache_folder_path} does not exist.")
-    else:
-        print(f"Found Cache folder: {cache_folder_path}")
-        all_files = os.listdir(cache_folder_path)
-        valid_xml_files = []
-
-        for file_name in all_files:
-            if file_name.endswith(".json"):
-                continue  # Skip JSON files
-            file_path = os.path.join(cache_folder_path, file_name)
-            try:
-                tree = ET.parse(file_path)
-                valid_xml_files.append(file_path)
-            except ET.ParseError:
-                continue  # Skip invalid XML files
-
-        processed_game_ids = set()
-        found_games = []
+        # Parse game IDs from the 'RunningGameClients' section
+        if 'RunningGameClients' in config:
+            running_game_clients = config['RunningGameClients'].get('RunningGameClients', '').split(';')
+            game_ids.update(running_game_clients)
+
+        # Parse game IDs from the 'LastAccessGames' section
+        if 'LastAccessGames' in config:
+            last_access_games = dict(config.items('LastAccessGames'))
+            game_ids.update(last_access_games.keys())
+
+        # Parse game IDs from the 'UndoList' section
+        if 'UndoList' in config:
+            for key in config['UndoList']:
+                if 'vkplay://show' in config['UndoList'][key]:
+                    game_id = config['UndoList'][key].split('/')[1]
+                    game_ids.add(game_id)
+
+        # Parse game IDs from the 'LeftBar' section
+        if 'LeftBar' in config:
+            left_bar_ids = config['LeftBar'].get('Ids', '').split(';')
+            game_ids.update(left_bar_ids)
+
+        # Parse game IDs from the 'Ad' section
+        if 'Ad' in config:
+            for key in config['Ad']:
+                if 'IdMTLink' in key:
+                    game_id = key.split('0.')[1]
+                    game_ids.add(game_id)
+
+        print("\nGame IDs found in GameCenter.ini file:")
+        for game_id in game_ids:
+            print(f"ID: {game_id}")
 
-        for xml_file in valid_xml_files:
-            try:
-                tree = ET.parse(xml_file)
-                root = tree.getroot()
-                game_item = root.find('GameItem')
-
-                if game_item is not None:
-                    game_id_xml = game_item.get('Name') or game_item.get('PackageName')
-
-                    if game_id_xml:
-                        game_id_in_ini = game_id_xml.replace('_', '.')
-
-                        if game_id_in_ini in game_ids and game_id_in_ini not in processed_game_ids:
-                            game_name = game_item.get('TitleEn', 'Unnamed Game')
-                            found_games.append(f"{game_name} (ID: {game_id_in_ini})")
-                            processed_game_ids.add(game_id_in_ini)
-            except ET.ParseError:
-                continue  # Skip invalid XML files
-
-        if found_games:
-            print("\nFound the following games:")
-            for game in found_games:
-                print(game)
+        # Handle the Cache folder
+        if not os.path.exists(cache_folder_path):
+            print(f"VK Play scanner skipped: Cache folder {cache_folder_path} does not exist.")
         else:
-            print("No games found.")
+            print(f"Found Cache folder: {cache_folder_path}")
+            all_files = os.listdir(cache_folder_path)
+            valid_xml_files = []
+
+            for file_name in all_files:
+                if file_name.endswith(".json"):
+                    continue  # Skip JSON files
+                file_path = os.path.join(cache_folder_path, file_name)
+                try:
+                    tree = ET.parse(file_path)
+                    valid_xml_files.append(file_path)
+                except ET.ParseError:
+                    continue  # Skip invalid XML files
+
+            processed_game_ids = set()
+            found_games = []
 
-        for game_id in game_ids:
-            game_name = 'Unknown Game'
             for xml_file in valid_xml_files:
                 try:
                     tree = ET.parse(xml_file)
@@ -5738,89 +7462,119 @@ else:
                     if game_item is not None:
                         game_id_xml = game_item.get('Name') or game_item.get('PackageName')
 
-                        if game_id_xml and game_id_xml.replace('_', '.') == game_id:
-                            game_name = game_item.get('TitleEn', 'Unnamed Game')
-                            break
+                        if game_id_xml:
+                            game_id_in_ini = game_id_xml.replace('_', '.')
+
+                            if game_id_in_ini in game_ids and game_id_in_ini not in processed_game_ids:
+                                game_name = game_item.get('TitleEn', 'Unnamed Game')
+                                found_games.append(f"{game_name} (ID: {game_id_in_ini})")
+                                processed_game_ids.add(game_id_in_ini)
                 except ET.ParseError:
-                    continue
+                    continue  # Skip invalid XML files
 
-            if game_name != 'Unknown Game':
-                display_name = game_name
-                launch_options = f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{vkplay_launcher}/\" %command% 'vkplay://play/{game_id}'"
-                exe_path = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{vkplay_launcher}/pfx/drive_c/users/steamuser/AppData/Local/GameCenter/GameCenter.exe\""
-                start_dir = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{vkplay_launcher}/pfx/drive_c/users/steamuser/AppData/Local/GameCenter/\""
+            if found_games:
+                print("\nFound the following games:")
+                for game in found_games:
+                    print(game)
+            else:
+                print("No games found.")
 
-                create_new_entry(exe_path, display_name, launch_options, start_dir, launcher_name="VK Play")
-                track_game(display_name, "VK Play")
+            for game_id in game_ids:
+                game_name = 'Unknown Game'
+                for xml_file in valid_xml_files:
+                    try:
+                        tree = ET.parse(xml_file)
+                        root = tree.getroot()
+                        game_item = root.find('GameItem')
 
-# End of VK Play Scanner
+                        if game_item is not None:
+                            game_id_xml = game_item.get('Name') or game_item.get('PackageName')
 
+                            if game_id_xml and game_id_xml.replace('_', '.') == game_id:
+                                game_name = game_item.get('TitleEn', 'Unnamed Game')
+                                break
+                    except ET.ParseError:
+                        continue
 
-# HoYo Play Scanner
+                if game_name != 'Unknown Game':
+                    display_name = game_name
+                    launch_options = f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{vkplay_launcher}/\" %command% 'vkplay://play/{game_id}'"
+                    exe_path = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{vkplay_launcher}/pfx/drive_c/users/steamuser/AppData/Local/GameCenter/GameCenter.exe\""
+                    start_dir = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{vkplay_launcher}/pfx/drive_c/users/steamuser/AppData/Local/GameCenter/\""
 
-file_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{hoyoplay_launcher}/pfx/drive_c/users/steamuser/AppData/Roaming/Cognosphere/HYP/1_0/data/gamedata.dat"
+                    yield game_entry(exe_path, display_name, launch_options, start_dir, launcher_name="VK Play")
 
-# Check if the file exists
-if not os.path.exists(file_path):
-    print("Skipping HoYo Play scanner: File does not exist.")
-else:
-    def extract_json_objects(data):
-        decoder = json.JSONDecoder()
-        json_objects = []
+# End of VK Play Scanner
 
-        decoded = data.decode("utf-8", errors="ignore")
-        idx = 0
-        length = len(decoded)
 
-        while idx < length:
-            try:
-                json_obj, end = decoder.raw_decode(decoded[idx:])
-                if isinstance(json_obj, dict):
-                    json_objects.append(json_obj)
-                idx += end
-            except json.JSONDecodeError:
-                idx += 1
+# HoYo Play Scanner
 
-        return json_objects
+@register_scanner("HoYoPlay", inputs=lambda: [
+    compatdata_path(hoyoplay_launcher, "pfx/drive_c/users/steamuser/AppData/Roaming/Cognosphere/HYP/1_0/data/gamedata.dat"),
+])
+def scan_hoyoplay():
+    file_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{hoyoplay_launcher}/pfx/drive_c/users/steamuser/AppData/Roaming/Cognosphere/HYP/1_0/data/gamedata.dat"
 
-    with open(file_path, "rb") as f:
-        f.read(8)
-        raw_data = f.read()
+    # Check if the file exists
+    if not os.path.exists(file_path):
+        print("Skipping HoYo Play scanner: File does not exist.")
+    else:
+        def extract_json_objects(data):
+            decoder = json.JSONDecoder()
+            json_objects = []
 
-    json_objects = extract_json_objects(raw_data)
+            decoded = data.decode("utf-8", errors="ignore")
+            idx = 0
+            length = len(decoded)
 
-    games = {}
-    for entry in json_objects:
-        exe = entry.get("gameInstallStatus", {}).get("gameExeName", "").strip()
-        path = entry.get("installPath", "").strip()
-        persist = entry.get("persistentInstallPath", "").strip()
-        name = entry.get("gameShortcutName", "").strip()
-        biz = entry.get("gameBiz", "").strip()
-
-        if exe and path:
-            key = name or exe
-            if key not in games:
-                games[key] = {
-                    "exe_name": exe,
-                    "install_path": path,
-                    "persistent_path": persist,
-                    "shortcut_name": name,
-                    "gamebiz": biz,
-                }
+            while idx < length:
+                try:
+                    json_obj, end = decoder.raw_decode(decoded[idx:])
+                    if isinstance(json_obj, dict):
+                        json_objects.append(json_obj)
+                    idx += end
+                except json.JSONDecodeError:
+                    idx += 1
+
+            return json_objects
+
+        with open(file_path, "rb") as f:
+            f.read(8)
+            raw_data = f.read()
+
+        json_objects = extract_json_objects(raw_data)
+
+        games = {}
+        for entry in json_objects:
+            exe = entry.get("gameInstallStatus", {}).get("gameExeName", "").strip()
+            path = entry.get("installPath", "").strip()
+            persist = entry.get("persistentInstallPath", "").strip()
+            name = entry.get("gameShortcutName", "").strip()
+            biz = entry.get("gameBiz", "").strip()
+
+            if exe and path:
+                key = name or exe
+                if key not in games:
+                    games[key] = {
+                        "exe_name": exe,
+                        "install_path": path,
+                        "persistent_path": persist,
+                        "shortcut_name": name,
+                        "gamebiz": biz,
+                    }
 
-    if games:
-        for game, details in sorted(games.items()):
-            display_name = details["shortcut_name"] or game
-            game_biz = details["gamebiz"]
-            launch_options = f'STEAM_COMPAT_DATA_PATH="{logged_in_home}/.local/share/Steam/steamapps/compatdata/{hoyoplay_launcher}/" %command% "--game={game_biz}"'
-            exe_path = f'"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{hoyoplay_launcher}/pfx/drive_c/Program Files/HoYoPlay/launcher.exe"'
-            start_dir = f'"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{hoyoplay_launcher}/pfx/drive_c/Program Files/HoYoPlay"'
+        if games:
+            for game, details in sorted(games.items()):
+                display_name = details["shortcut_name"] or game
+                game_biz = details["gamebiz"]
+                launch_options = f'STEAM_COMPAT_DATA_PATH="{logged_in_home}/.local/share/Steam/steamapps/compatdata/{hoyoplay_launcher}/" %command% "--game={game_biz}"'
+                exe_path = f'"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{hoyoplay_launcher}/pfx/drive_c/Program Files/HoYoPlay/launcher.exe"'
+                start_dir = f'"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{hoyoplay_launcher}/pfx/drive_c/Program Files/HoYoPlay"'
 
-            if not details["install_path"] and not details["persistent_path"]:
-                continue
+                if not details["install_path"] and not details["persistent_path"]:
+                    continue
 
-            create_new_entry(exe_path, display_name, launch_options, start_dir, launcher_name="HoYoPlay")
-            track_game(display_name, "HoYoPlay")
+                yield game_entry(exe_path, display_name, launch_options, start_dir, launcher_name="HoYoPlay")
 
 # End of HoYo Play Scanner
 
@@ -5828,76 +7582,80 @@ else:
 
 # Game Jolt Scanner
 
-# File paths for both the game list and package details
-games_file_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gamejolt_launcher}/pfx/drive_c/users/steamuser/AppData/Local/game-jolt-client/User Data/Default/games.wttf"
-packages_file_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gamejolt_launcher}/pfx/drive_c/users/steamuser/AppData/Local/game-jolt-client/User Data/Default/packages.wttf"
-
-# Check if both files exist before proceeding
-if not os.path.exists(games_file_path) or not os.path.exists(packages_file_path):
-    print("One or both of the files do not exist. Skipping Game Jolt Scanner.")
-else:
-    try:
-        # Load the games file
-        with open(games_file_path, 'r') as f:
-            games_data = json.load(f)
-
-        # Load the packages file
-        with open(packages_file_path, 'r') as f:
-            packages_data = json.load(f)
-
-        # Check if 'objects' exists in the games data
-        if 'objects' in games_data:
-            # Iterate through each game object in the games file
-            for game_id, game_info in games_data['objects'].items():
-                # Default values if information is missing
-                description = 'No Description'
-                install_dir = 'No Install Directory'
-                version = 'No Version Info'
-                executable_path = 'No Executable Path'
-
-                # Iterate over the 'objects' in the packages file to find a match
-                for package_id, package_info in packages_data.get('objects', {}).items():
-                    # Check if the game_id in the package matches the current game_id
-                    if package_info.get('game_id') == int(game_id):  # Match on game_id
-                        # Extract information from the matched package
-                        description = package_info.get('description', description)
-                        install_dir = package_info.get('install_dir', install_dir)
-
-                        # Safe extraction of version_number from 'release'
-                        release_info = package_info.get('release', {})
-                        version = release_info.get('version_number', version)
-
-                        # Handle missing or empty launch options
-                        if package_info.get('launch_options'):
-                            executable_path = package_info['launch_options'][0].get('executable_path', executable_path)
+@register_scanner("Game Jolt Client", inputs=lambda: [
+    compatdata_path(gamejolt_launcher, "pfx/drive_c/users/steamuser/AppData/Local/game-jolt-client/User Data/Default/games.wttf"),
+    compatdata_path(gamejolt_launcher, "pfx/drive_c/users/steamuser/AppData/Local/game-jolt-client/User Data/Default/packages.wttf"),
+])
+def scan_gamejolt():
+    # File paths for both the game list and package details
+    games_file_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gamejolt_launcher}/pfx/drive_c/users/steamuser/AppData/Local/game-jolt-client/User Data/Default/games.wttf"
+    packages_file_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gamejolt_launcher}/pfx/drive_c/users/steamuser/AppData/Local/game-jolt-client/User Data/Default/packages.wttf"
+
+    # Check if both files exist before proceeding
+    if not os.path.exists(games_file_path) or not os.path.exists(packages_file_path):
+        print("One or both of the files do not exist. Skipping Game Jolt Scanner.")
+    else:
+        try:
+            # Load the games file
+            with open(games_file_path, 'r') as f:
+                games_data = json.load(f)
+
+            # Load the packages file
+            with open(packages_file_path, 'r') as f:
+                packages_data = json.load(f)
+
+            # Check if 'objects' exists in the games data
+            if 'objects' in games_data:
+                # Iterate through each game object in the games file
+                for game_id, game_info in games_data['objects'].items():
+                    # Default values if information is missing
+                    description = 'No Description'
+                    install_dir = 'No Install Directory'
+                    version = 'No Version Info'
+                    executable_path = 'No Executable Path'
+
+                    # Iterate over the 'objects' in the packages file to find a match
+                    for package_id, package_info in packages_data.get('objects', {}).items():
+                        # Check if the game_id in the package matches the current game_id
+                        if package_info.get('game_id') == int(game_id):  # Match on game_id
+                            # Extract information from the matched package
+                            description = package_info.get('description', description)
+                            install_dir = package_info.get('install_dir', install_dir)
+
+                            # Safe extraction of version_number from 'release'
+                            release_info = package_info.get('release', {})
+                            version = release_info.get('version_number', version)
+
+                            # Handle missing or empty launch options
+                            if package_info.get('launch_options'):
+                                executable_path = package_info['launch_options'][0].get('executable_path', executable_path)
 
-                        break
+                            break
 
-                # Print the combined game info
-                #print(f"\nGame ID: {game_id}")
-                #print(f"Title: {game_info.get('title', 'No Title')}")
-                #print(f"Install Directory: {install_dir}")
-                #print("-" * 40)  # Separator line for clarity
+                    # Print the combined game info
+                    #print(f"\nGame ID: {game_id}")
+                    #print(f"Title: {game_info.get('title', 'No Title')}")
+                    #print(f"Install Directory: {install_dir}")
+                    #print("-" * 40)  # Separator line for clarity
 
-                # Set the display name to the game shortcut name from the JSON
-                display_name = game_info.get('title', 'No Title')
-                launch_options = f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gamejolt_launcher}/\" %command% --dir \"{install_dir}\" run"
-                exe_path = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gamejolt_launcher}/pfx/drive_c/users/steamuser/AppData/Local/GameJoltClient/GameJoltClient.exe\""
-                start_dir = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gamejolt_launcher}/pfx/drive_c/users/steamuser/AppData/Local/GameJoltClient\""
+                    # Set the display name to the game shortcut name from the JSON
+                    display_name = game_info.get('title', 'No Title')
+                    launch_options = f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gamejolt_launcher}/\" %command% --dir \"{install_dir}\" run"
+                    exe_path = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gamejolt_launcher}/pfx/drive_c/users/steamuser/AppData/Local/GameJoltClient/GameJoltClient.exe\""
+                    start_dir = f"\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gamejolt_launcher}/pfx/drive_c/users/steamuser/AppData/Local/GameJoltClient\""
 
-                # Create the new entry (this is where you can use your custom function for Steam shortcuts)
-                create_new_entry(exe_path, display_name, launch_options, start_dir, launcher_name="Game Jolt Client")
-                track_game(display_name, "Game Jolt Client")
+                    # Create the new entry (this is where you can use your custom function for Steam shortcuts)
+                    yield game_entry(exe_path, display_name, launch_options, start_dir, launcher_name="Game Jolt Client")
 
-        else:
-            print("'objects' key not found in the games data.")
+            else:
+                print("'objects' key not found in the games data.")
 
-    except json.JSONDecodeError as e:
-        print(f"Error decoding JSON: {e}")
-    except FileNotFoundError as e:
-        print(f"Error: File not found - {e}")
-    except Exception as e:
-        print(f"An error occurred: {e}")
+        except json.JSONDecodeError as e:
+            print(f"Error decoding JSON: {e}")
+        except FileNotFoundError as e:
+            print(f"Error: File not found - {e}")
+        except Exception as e:
+            print(f"An error occurred: {e}")
 
 # End of Game Jolt Scanner
 
@@ -5905,59 +7663,62 @@ else:
 
 #Minecraft Legacy Launcher Scanner
 
-# Path to the JSON file
-file_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{minecraft_launcher}/pfx/drive_c/users/deck/AppData/Roaming/.minecraft/launcher_settings.json"
+@register_scanner("Minecraft Launcher", inputs=lambda: [
+    compatdata_path(minecraft_launcher, "pfx/drive_c/users/deck/AppData/Roaming/.minecraft/launcher_settings.json"),
+])
+def scan_minecraft():
+    # Path to the JSON file
+    file_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{minecraft_launcher}/pfx/drive_c/users/deck/AppData/Roaming/.minecraft/launcher_settings.json"
 
-# Function to convert Windows path to Unix path dynamically
-def convert_to_unix_path(windows_path, home_dir):
-    unix_path = windows_path.replace('\\', '/')
+    # Function to convert Windows path to Unix path dynamically
+    def convert_to_unix_path(windows_path, home_dir):
+        unix_path = windows_path.replace('\\', '/')
 
-    if len(windows_path) > 2 and windows_path[1] == ":":
-        unix_path = unix_path[2:]
-        unix_path = os.path.join(home_dir, unix_path.lstrip('/'))
+        if len(windows_path) > 2 and windows_path[1] == ":":
+            unix_path = unix_path[2:]
+            unix_path = os.path.join(home_dir, unix_path.lstrip('/'))
 
-    return unix_path
+        return unix_path
 
-# Check if the JSON file exists
-if os.path.exists(file_path):
-    try:
-        with open(file_path, 'r') as file:
-            # Parse the JSON data
-            data = json.load(file)
+    # Check if the JSON file exists
+    if os.path.exists(file_path):
+        try:
+            with open(file_path, 'r') as file:
+                # Parse the JSON data
+                data = json.load(file)
 
-            # Extract the productLibraryDir
-            product_library_dir = data.get('productLibraryDir')
+                # Extract the productLibraryDir
+                product_library_dir = data.get('productLibraryDir')
 
-            if product_library_dir:
-                home_dir = os.path.expanduser("~")
-                unix_product_library_dir = convert_to_unix_path(product_library_dir, home_dir)
+                if product_library_dir:
+                    home_dir = os.path.expanduser("~")
+                    unix_product_library_dir = convert_to_unix_path(product_library_dir, home_dir)
 
-                # Define the target file path
-                target_file = os.path.join(unix_product_library_dir, 'dungeons', 'dungeons', 'Dungeons.exe')
+                    # Define the target file path
+                    target_file = os.path.join(unix_product_library_dir, 'dungeons', 'dungeons', 'Dungeons.exe')
 
-                # Check if the file exists
-                if os.path.exists(target_file):
-                    print(f"File exists: {target_file}")
-                else:
-                    print(f"File does not exist: {target_file}")
+                    # Check if the file exists
+                    if os.path.exists(target_file):
+                        print(f"File exists: {target_file}")
+                    else:
+                        print(f"File does not exist: {target_file}")
 
-                # Set the display name to the game shortcut name from the JSON
-                display_name = "Minecraft Dungeons"
-                launch_options = f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{minecraft_launcher}/\" %command%"
-                exe_path = f"\"{target_file}\""
-                start_dir = f"\"{os.path.dirname(target_file)}\""
+                    # Set the display name to the game shortcut name from the JSON
+                    display_name = "Minecraft Dungeons"
+                    launch_options = f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{minecraft_launcher}/\" %command%"
+                    exe_path = f"\"{target_file}\""
+                    start_dir = f"\"{os.path.dirname(target_file)}\""
 
 
-                # Create the new entry (this is where you can use your custom function for Steam shortcuts)
-                create_new_entry(exe_path, display_name, launch_options, start_dir, launcher_name="Minecraft Launcher")
-                track_game(display_name, "Minecraft Launcher")
+                    # Create the new entry (this is where you can use your custom function for Steam shortcuts)
+                    yield game_entry(exe_path, display_name, launch_options, start_dir, launcher_name="Minecraft Launcher")
 
-            else:
-                print("Key 'productLibraryDir' not found in the JSON.")
-    except json.JSONDecodeError:
-        print("Error decoding the JSON file.")
-else:
-    print("Skipping Minecraft Legacy Launcher Scanner")
+                else:
+                    print("Key 'productLibraryDir' not found in the JSON.")
+        except json.JSONDecodeError:
+            print("Error decoding the JSON file.")
+    else:
+        print("Skipping Minecraft Legacy Launcher Scanner")
 
 # End of the Minecraft Legacy Launcher
 
@@ -5965,235 +7726,243 @@ else:
 
 
 #IndieGala Scanner
-real_indie_launcher_path = os.path.realpath(
-    f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{indie_launcher}"
-)
-print(f"Resolved indie_launcher path: {real_indie_launcher_path}")
+@register_scanner("IndieGala Client", inputs=lambda: [
+    os.path.join(os.path.realpath(compatdata_path(indie_launcher, "")), "pfx/drive_c/users/steamuser/AppData/Roaming/IGClient/storage/installed.json"),
+    os.path.join(os.path.realpath(compatdata_path(indie_launcher, "")), "pfx/drive_c/users/steamuser/AppData/Roaming/IGClient/storage/default-install-path.json"),
+])
+def scan_indiegala():
+    real_indie_launcher_path = os.path.realpath(
+        f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{indie_launcher}"
+    )
+    print(f"Resolved indie_launcher path: {real_indie_launcher_path}")
 
-installed_json_path = os.path.join(
-    real_indie_launcher_path,
-    "pfx/drive_c/users/steamuser/AppData/Roaming/IGClient/storage/installed.json"
-)
-default_install_path_file = os.path.join(
-    real_indie_launcher_path,
-    "pfx/drive_c/users/steamuser/AppData/Roaming/IGClient/storage/default-install-path.json"
-)
+    installed_json_path = os.path.join(
+        real_indie_launcher_path,
+        "pfx/drive_c/users/steamuser/AppData/Roaming/IGClient/storage/installed.json"
+    )
+    default_install_path_file = os.path.join(
+        real_indie_launcher_path,
+        "pfx/drive_c/users/steamuser/AppData/Roaming/IGClient/storage/default-install-path.json"
+    )
 
-def file_is_valid(file_path):
-    return os.path.exists(file_path) and os.path.getsize(file_path) > 0
+    def file_is_valid(file_path):
+        return os.path.exists(file_path) and os.path.getsize(file_path) > 0
 
-def windows_to_linux_path(windows_path):
-    linux_base = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{indie_launcher}/pfx/drive_c/"
-    if windows_path.startswith("C:/"):
-        return linux_base + windows_path[3:].replace("\\", "/")
-    return windows_path.replace("\\", "/")
+    def windows_to_linux_path(windows_path):
+        linux_base = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{indie_launcher}/pfx/drive_c/"
+        if windows_path.startswith("C:/"):
+            return linux_base + windows_path[3:].replace("\\", "/")
+        return windows_path.replace("\\", "/")
 
-def find_exe_file(base_path, slugged_name, game_name):
-    search_dir = os.path.join(base_path, slugged_name)
-    if not os.path.exists(search_dir):
-        print(f"Game folder not found: {search_dir}")
-        return None
+    def find_exe_file(base_path, slugged_name, game_name):
+        search_dir = os.path.join(base_path, slugged_name)
+        if not os.path.exists(search_dir):
+            print(f"Game folder not found: {search_dir}")
+            return None
 
-    possible_names = [
-        f"{game_name}.exe",
-        f"{game_name.title().replace(' ', '')}.exe",
-        f"{game_name.replace(' ', '')}.exe",
-        f"{game_name.lower().replace(' ', '').replace('-', '')}.exe",
-        f"{slugged_name}.exe",
-        f"{slugged_name.replace('-', '')}.exe",
-    ]
+        possible_names = [
+            f"{game_name}.exe",
+            f"{game_name.title().replace(' ', '')}.exe",
+            f"{game_name.replace(' ', '')}.exe",
+            f"{game_name.lower().replace(' ', '').replace('-', '')}.exe",
+            f"{slugged_name}.exe",
+            f"{slugged_name.replace('-', '')}.exe",
+        ]
 
-    for name in possible_names:
-        full_path = windows_to_linux_path(os.path.join(search_dir, name))
-        if os.path.exists(full_path):
-            return full_path
-    return None
+        for name in possible_names:
+            full_path = windows_to_linux_path(os.path.join(search_dir, name))
+            if os.path.exists(full_path):
+                return full_path
+        return None
 
-if not file_is_valid(installed_json_path) or not file_is_valid(default_install_path_file):
-    print("Required JSON files missing or empty. Skipping scan.")
-else:
-    with open(default_install_path_file, "r") as f:
-        default_data = json.load(f)
-        default_install_path = default_data if isinstance(default_data, str) else default_data.get("default-install-path", "C:/IGClientGames")
-    default_install_path = windows_to_linux_path(default_install_path)
+    if not file_is_valid(installed_json_path) or not file_is_valid(default_install_path_file):
+        print("Required JSON files missing or empty. Skipping scan.")
+    else:
+        with open(default_install_path_file, "r") as f:
+            default_data = json.load(f)
+            default_install_path = default_data if isinstance(default_data, str) else default_data.get("default-install-path", "C:/IGClientGames")
+        default_install_path = windows_to_linux_path(default_install_path)
 
-    with open(installed_json_path, "r") as f:
-        data = json.load(f)
+        with open(installed_json_path, "r") as f:
+            data = json.load(f)
 
-    for game_entry in data:
-        game_data = game_entry["target"]["game_data"]
-        game_info = game_entry["target"]["item_data"]
+        for game_entry in data:
+            game_data = game_entry["target"]["game_data"]
+            game_info = game_entry["target"]["item_data"]
 
-        game_name = game_info.get("name", "Unnamed Game")
-        slugged_name = game_info.get("slugged_name", "missing-slug")
-        location = windows_to_linux_path(game_entry.get("path", default_install_path))
-        exe_path = game_data.get("exe_path")
+            game_name = game_info.get("name", "Unnamed Game")
+            slugged_name = game_info.get("slugged_name", "missing-slug")
+            location = windows_to_linux_path(game_entry.get("path", default_install_path))
+            exe_path = game_data.get("exe_path")
 
-        game_path = None
+            game_path = None
 
-        if exe_path:
-            guessed_path = windows_to_linux_path(os.path.join(location, exe_path))
-            if os.path.exists(guessed_path):
-                game_path = guessed_path
-            else:
-                parts = exe_path.replace("\\", "/").split("/")
-                if len(parts) > 1:
-                    parts[0] = slugged_name
-                    alt_path = windows_to_linux_path(os.path.join(location, *parts))
-                    if os.path.exists(alt_path):
-                        game_path = alt_path
+            if exe_path:
+                guessed_path = windows_to_linux_path(os.path.join(location, exe_path))
+                if os.path.exists(guessed_path):
+                    game_path = guessed_path
+                else:
+                    parts = exe_path.replace("\\", "/").split("/")
+                    if len(parts) > 1:
+                        parts[0] = slugged_name
+                        alt_path = windows_to_linux_path(os.path.join(location, *parts))
+                        if os.path.exists(alt_path):
+                            game_path = alt_path
+                        else:
+                            print(f"Exe path invalid for {game_name}, trying fallback.")
+                            game_path = find_exe_file(location, slugged_name, game_name)
                     else:
-                        print(f"Exe path invalid for {game_name}, trying fallback.")
                         game_path = find_exe_file(location, slugged_name, game_name)
-                else:
-                    game_path = find_exe_file(location, slugged_name, game_name)
-        else:
-            print(f"No exe_path for {game_name}, using fallback.")
-            game_path = find_exe_file(location, slugged_name, game_name)
+            else:
+                print(f"No exe_path for {game_name}, using fallback.")
+                game_path = find_exe_file(location, slugged_name, game_name)
 
-        if not game_path or not os.path.exists(game_path):
-            print(f"Skipping {game_name}: Executable not found.")
-            continue
+            if not game_path or not os.path.exists(game_path):
+                print(f"Skipping {game_name}: Executable not found.")
+                continue
 
-        start_dir = os.path.dirname(game_path)
-        launchoptions = f'STEAM_COMPAT_DATA_PATH="{logged_in_home}/.local/share/Steam/steamapps/compatdata/{indie_launcher}/" %command%'
-        create_new_entry(f"\"{game_path}\"", game_name, launchoptions, f"\"{start_dir}\"", launcher_name="IndieGala Client")
-        track_game(game_name, "IndieGala Client")
+            start_dir = os.path.dirname(game_path)
+            launchoptions = f'STEAM_COMPAT_DATA_PATH="{logged_in_home}/.local/share/Steam/steamapps/compatdata/{indie_launcher}/" %command%'
+            yield game_entry(f"\"{game_path}\"", game_name, launchoptions, f"\"{start_dir}\"", launcher_name="IndieGala Client")
 #End of IndieGala Scanner
 
 
 
 
 #chrome scanner for xbox, geforce now, and amazon luna bookmarks
-bookmarks_file_path = f"{logged_in_home}/.var/app/com.google.Chrome/config/google-chrome/Default/Bookmarks"
-
-# Lists to store results
-geforce_now_urls = []
-xbox_urls = []
-luna_urls = []
-boosteroid_urls = []
-webrcade_urls = []
-seen_urls = set()
-
-def process_bookmark_item(item):
-    if item['type'] == "url":
-        name = item['name'].strip()
-        url = item['url']
-
-        if not name or url in seen_urls:
-            return
+@register_scanner("Google Chrome", inputs=lambda: [
+    f"{logged_in_home}/.var/app/com.google.Chrome/config/google-chrome/Default/Bookmarks",
+])
+def scan_chrome_bookmarks():
+    bookmarks_file_path = f"{logged_in_home}/.var/app/com.google.Chrome/config/google-chrome/Default/Bookmarks"
+
+    # Lists to store results
+    geforce_now_urls = []
+    xbox_urls = []
+    luna_urls = []
+    boosteroid_urls = []
+    webrcade_urls = []
+    seen_urls = set()
+
+    def process_bookmark_item(item):
+        if item['type'] == "url":
+            name = item['name'].strip()
+            url = item['url']
 
-        # GeForce NOW
-        if "play.geforcenow.com/games" in url:
-            if name == "GeForce NOW":
-                return
-            game_name = name.replace(" on GeForce NOW", "").strip()
-            url = url.split("&")[0] if "&" in url else url
-            if url in seen_urls:
+            if not name or url in seen_urls:
                 return
-            geforce_now_urls.append(("GeForce NOW", game_name, url))
-            seen_urls.add(url)
-
-        # Xbox Cloud Gaming
-        elif "xbox.com/" in url and ("/play/launch/" in url or "/play/games/" in url):
-            if name.startswith("Play "):
-                game_name = name.replace("Play ", "").split(" |")[0].strip()
-            else:
-                game_name = name.split(" |")[0].strip()
 
-            if game_name:
-                xbox_urls.append(("Xbox", game_name, url))
+            # GeForce NOW
+            if "play.geforcenow.com/games" in url:
+                if name == "GeForce NOW":
+                    return
+                game_name = name.replace(" on GeForce NOW", "").strip()
+                url = url.split("&")[0] if "&" in url else url
+                if url in seen_urls:
+                    return
+                geforce_now_urls.append(("GeForce NOW", game_name, url))
                 seen_urls.add(url)
 
-        # Amazon Luna
-        elif "luna.amazon." in url and "/game/" in url:
-            if name.startswith("Play "):
-                game_name = name.replace("Play ", "").split(" |")[0].strip()
-            else:
-                game_name = name.split(" |")[0].strip()
+            # Xbox Cloud Gaming
+            elif "xbox.com/" in url and ("/play/launch/" in url or "/play/games/" in url):
+                if name.startswith("Play "):
+                    game_name = name.replace("Play ", "").split(" |")[0].strip()
+                else:
+                    game_name = name.split(" |")[0].strip()
 
-            if game_name:
-                luna_urls.append(("Amazon Luna", game_name, url))
-                seen_urls.add(url)
+                if game_name:
+                    xbox_urls.append(("Xbox", game_name, url))
+                    seen_urls.add(url)
 
+            # Amazon Luna
+            elif "luna.amazon." in url and "/game/" in url:
+                if name.startswith("Play "):
+                    game_name = name.replace("Play ", "").split(" |")[0].strip()
+                else:
+                    game_name = name.split(" |")[0].strip()
 
+                if game_name:
+                    luna_urls.append(("Amazon Luna", game_name, url))
+                    seen_urls.add(url)
 
 
-        # Boosteroid
-        elif "cloud.boosteroid.com/application/" in url:
-            if not name or url in seen_urls:
-                return
 
-            game_name = name.strip()
-            boosteroid_urls.append(("Boosteroid", game_name, url))
-            seen_urls.add(url)
 
-        # Boosteroid (Session format)
-        elif "cloud.boosteroid.com/static/streaming/streaming.html" in url and "sessionId=" in url:
-            if not name or url in seen_urls:
-                return
+            # Boosteroid
+            elif "cloud.boosteroid.com/application/" in url:
+                if not name or url in seen_urls:
+                    return
 
-            game_name = name.strip()
-            boosteroid_urls.append(("Boosteroid", game_name, url))
-            seen_urls.add(url)
+                game_name = name.strip()
+                boosteroid_urls.append(("Boosteroid", game_name, url))
+                seen_urls.add(url)
 
+            # Boosteroid (Session format)
+            elif "cloud.boosteroid.com/static/streaming/streaming.html" in url and "sessionId=" in url:
+                if not name or url in seen_urls:
+                    return
 
-        # WebRcade
-        elif "play.webrcade.com/app/" in url:
-            if not name or url in seen_urls:
-                return
+                game_name = name.strip()
+                boosteroid_urls.append(("Boosteroid", game_name, url))
+                seen_urls.add(url)
 
-            game_name = name.strip()
 
-            webrcade_urls.append(("WebRcade", game_name, url))
-            seen_urls.add(url)
+            # WebRcade
+            elif "play.webrcade.com/app/" in url:
+                if not name or url in seen_urls:
+                    return
 
+                game_name = name.strip()
 
+                webrcade_urls.append(("WebRcade", game_name, url))
+                seen_urls.add(url)
 
-def scan_children(children):
-    for item in children:
-        if item['type'] == "folder":
-            scan_children(item.get('children', []))
-        else:
-            process_bookmark_item(item)
 
-if not os.path.exists(bookmarks_file_path):
-    print("Chrome Bookmarks not found. Skipping scanning for Bookmarks.")
-else:
-    with open(bookmarks_file_path, 'r') as f:
-        data = json.load(f)
 
-    # Scan bookmarks in bookmark_bar, other, and synced folders recursively
-    scan_children(data['roots']['bookmark_bar'].get('children', []))
-    scan_children(data['roots']['other'].get('children', []))
-    scan_children(data['roots']['synced'].get('children', []))
+    def scan_children(children):
+        for item in children:
+            if item['type'] == "folder":
+                scan_children(item.get('children', []))
+            else:
+                process_bookmark_item(item)
 
-    # Merge all platforms' URLs into a single list for processing
-    all_urls = geforce_now_urls + xbox_urls + luna_urls + boosteroid_urls + webrcade_urls
+    if not os.path.exists(bookmarks_file_path):
+        print("Chrome Bookmarks not found. Skipping scanning for Bookmarks.")
+    else:
+        with open(bookmarks_file_path, 'r') as f:
+            data = json.load(f)
 
-    for platform_name, game_name, url in all_urls:
-        print(f"{platform_name}: {game_name} - {url}")
+        # Scan bookmarks in bookmark_bar, other, and synced folders recursively
+        scan_children(data['roots']['bookmark_bar'].get('children', []))
+        scan_children(data['roots']['other'].get('children', []))
+        scan_children(data['roots']['synced'].get('children', []))
 
-        encoded_url = url
+        # Merge all platforms' URLs into a single list for processing
+        all_urls = geforce_now_urls + xbox_urls + luna_urls + boosteroid_urls + webrcade_urls
 
-        chromelaunch_options = (
-            f'run --branch=stable --arch=x86_64 --command=/app/bin/chrome --file-forwarding com.google.Chrome @@u @@ '
-            f'--window-size=1280,800 --force-device-scale-factor=1.00 --device-scale-factor=1.00 '
-            f'--start-fullscreen "{encoded_url}" --no-first-run --enable-features=OverlayScrollbar'
-        )
+        for platform_name, game_name, url in all_urls:
+            print(f"{platform_name}: {game_name} - {url}")
 
-        chromedirectory = os.environ.get("chromedirectory", "/usr/bin/flatpak")
-        chrome_startdir = os.environ.get("chrome_startdir", "/usr/bin")
+            encoded_url = url
 
-        # Replace this with your existing method to handle the entries
-        create_new_entry(
-            chromedirectory,
-            game_name,
-            chromelaunch_options,
-            chrome_startdir,
-            launcher_name=platform_name
-        )
-        track_game(game_name, "Google Chrome")
+            chromelaunch_options = (
+                f'run --branch=stable --arch=x86_64 --command=/app/bin/chrome --file-forwarding com.google.Chrome @@u @@ '
+                f'--window-size=1280,800 --force-device-scale-factor=1.00 --device-scale-factor=1.00 '
+                f'--start-fullscreen "{encoded_url}" --no-first-run --enable-features=OverlayScrollbar'
+            )
+
+            chromedirectory = os.environ.get("chromedirectory", "/usr/bin/flatpak")
+            chrome_startdir = os.environ.get("chrome_startdir", "/usr/bin")
+
+            # Replace this with your existing method to handle the entries
+            yield game_entry(
+                chromedirectory,
+                game_name,
+                chromelaunch_options,
+                chrome_startdir,
+                launcher_name=platform_name,
+                track_as="Google Chrome"
+            )
 
 # end of chrome scanner for xbox, geforce now, and amazon luna, boosteroid bookmarks
 
@@ -6206,107 +7975,115 @@ else:
 
 # Waydroid scanner
 # Check for Waydroid
-if shutil.which("waydroid") is None:
-    print("Waydroid not found. Skipping Waydroid scanner.")
-else:
-    applications_dir = f"{logged_in_home}/.local/share/applications/"
-    ignored_files = {
-        "waydroid.com.android.inputmethod.latin.desktop",
-        "waydroid.com.android.gallery3d.desktop",
-        "waydroid.com.android.documentsui.desktop",
-        "waydroid.com.android.settings.desktop",
-        "waydroid.org.lineageos.eleven.desktop",
-        "waydroid.com.android.calculator2.desktop",
-        "waydroid.com.android.contacts.desktop",
-        "waydroid.org.lineageos.etar.desktop",
-        "waydroid.org.lineageos.jelly.desktop",
-        "waydroid.com.android.camera2.desktop",
-        "waydroid.com.android.deskclock.desktop",
-        "waydroid.org.lineageos.recorder.desktop",
-        "waydroid.com.google.android.apps.messaging.desktop",
-        "waydroid.com.google.android.contacts.desktop",
-        "waydroid.org.lineageos.aperture.desktop",
-    }
+@register_scanner("Waydroid", inputs=lambda: [
+    # Only Waydroid's own entries, the folder also gets the .desktop files of our shortcuts and Steam's
+    f"{logged_in_home}/.local/share/applications/waydroid.*.desktop",
+    f"{logged_in_home}/Android_Waydroid/Android_Waydroid_Cage.sh",
+    f"{logged_in_home}/bin/waydroid-cage.sh",
+    f"{logged_in_home}/.local/bin/waydroid-cage.sh",
+    shutil.which("waydroid") or "/usr/bin/waydroid",
+])
+def scan_waydroid():
+    if shutil.which("waydroid") is None:
+        print("Waydroid not found. Skipping Waydroid scanner.")
+    else:
+        applications_dir = f"{logged_in_home}/.local/share/applications/"
+        ignored_files = {
+            "waydroid.com.android.inputmethod.latin.desktop",
+            "waydroid.com.android.gallery3d.desktop",
+            "waydroid.com.android.documentsui.desktop",
+            "waydroid.com.android.settings.desktop",
+            "waydroid.org.lineageos.eleven.desktop",
+            "waydroid.com.android.calculator2.desktop",
+            "waydroid.com.android.contacts.desktop",
+            "waydroid.org.lineageos.etar.desktop",
+            "waydroid.org.lineageos.jelly.desktop",
+            "waydroid.com.android.camera2.desktop",
+            "waydroid.com.android.deskclock.desktop",
+            "waydroid.org.lineageos.recorder.desktop",
+            "waydroid.com.google.android.apps.messaging.desktop",
+            "waydroid.com.google.android.contacts.desktop",
+            "waydroid.org.lineageos.aperture.desktop",
+        }
 
-    # Possible cage launchers
-    possible_launchers = [
-        f"{logged_in_home}/Android_Waydroid/Android_Waydroid_Cage.sh",
-        f"{logged_in_home}/bin/waydroid-cage.sh",
-        f"{logged_in_home}/.local/bin/waydroid-cage.sh",
-    ]
+        # Possible cage launchers
+        possible_launchers = [
+            f"{logged_in_home}/Android_Waydroid/Android_Waydroid_Cage.sh",
+            f"{logged_in_home}/bin/waydroid-cage.sh",
+            f"{logged_in_home}/.local/bin/waydroid-cage.sh",
+        ]
 
-    launcher_path = next((p for p in possible_launchers if os.path.isfile(p)), None)
+        launcher_path = next((p for p in possible_launchers if os.path.isfile(p)), None)
 
-    if launcher_path is None:
-        search_dirs = [logged_in_home, "/run/media", "/mnt", "/media"]
-        for base in search_dirs:
-            if not os.path.isdir(base):
-                continue
-            for root, dirs, files in os.walk(base):
-                # Limit recursion to 2 levels deep
-                if root[len(base):].count(os.sep) > 2:
-                    dirs[:] = []
+        if launcher_path is None:
+            search_dirs = [logged_in_home, "/run/media", "/mnt", "/media"]
+            for base in search_dirs:
+                if not os.path.isdir(base):
                     continue
-                if "waydroid-cage.sh" in files:
-                    launcher_path = os.path.join(root, "waydroid-cage.sh")
-                    print(f"Found Waydroid launcher: {launcher_path}")
+                for root, dirs, files in os.walk(base):
+                    # Limit recursion to 2 levels deep
+                    if root[len(base):].count(os.sep) > 2:
+                        dirs[:] = []
+                        continue
+                    if "waydroid-cage.sh" in files:
+                        launcher_path = os.path.join(root, "waydroid-cage.sh")
+                        print(f"Found Waydroid launcher: {launcher_path}")
+                        break
+                if launcher_path:
                     break
-            if launcher_path:
-                break
 
-    use_cage = bool(launcher_path)
-    exe_path = launcher_path if use_cage else "waydroid"
-    start_dir = os.path.dirname(launcher_path) if use_cage else "./"
+        use_cage = bool(launcher_path)
+        exe_path = launcher_path if use_cage else "waydroid"
+        start_dir = os.path.dirname(launcher_path) if use_cage else "./"
 
-    print(f"Waydroid Cage Detected: {use_cage}")
-    print(f"Launcher Path: {exe_path}")
+        print(f"Waydroid Cage Detected: {use_cage}")
+        print(f"Launcher Path: {exe_path}")
 
-    if os.path.isdir(applications_dir):
-        for file_name in os.listdir(applications_dir):
-            if not file_name.endswith(".desktop") or file_name in ignored_files:
-                continue
-
-            file_path = os.path.join(applications_dir, file_name)
-            try:
-                parser = configparser.RawConfigParser(strict=False)
-                parser.read(file_path)
-
-                if "Desktop Entry" not in parser:
+        if os.path.isdir(applications_dir):
+            for file_name in os.listdir(applications_dir):
+                if not file_name.endswith(".desktop") or file_name in ignored_files:
                     continue
 
-                display_name = parser.get("Desktop Entry", "Name", fallback=None)
-                exec_cmd = parser.get("Desktop Entry", "Exec", fallback="").lower()
+                file_path = os.path.join(applications_dir, file_name)
+                try:
+                    parser = configparser.RawConfigParser(strict=False)
+                    parser.read(file_path)
 
-                if not display_name or "waydroid app launch" not in exec_cmd:
-                    continue
+                    if "Desktop Entry" not in parser:
+                        continue
 
-                parts = exec_cmd.strip().split()
-                app_name = parts[-1] if len(parts) >= 3 else None
-                if not app_name:
-                    continue
+                    display_name = parser.get("Desktop Entry", "Name", fallback=None)
+                    exec_cmd = parser.get("Desktop Entry", "Exec", fallback="").lower()
 
-                if use_cage:
-                    target = f'"{exe_path}"'
-                    launch_opts = f'"{app_name}"'
-                    start_in = start_dir
-                else:
-                    target = '"waydroid"'
-                    launch_opts = f'"app" "launch" "{app_name}"'
-                    start_in = start_dir
-
-                create_new_entry(
-                    shortcutdirectory=target,
-                    appname=display_name,
-                    launchoptions=launch_opts,
-                    startingdir=start_in,
-                    launcher_name="Waydroid"
-                )
-                track_game(display_name, "Waydroid")
+                    if not display_name or "waydroid app launch" not in exec_cmd:
+                        continue
 
-            except Exception as e:
-                print(f"Failed to process {file_name}: {e}")
-    else:
-        print(f"Applications directory not found: {applications_dir}")
+                    parts = exec_cmd.strip().split()
+                    app_name = parts[-1] if len(parts) >= 3 else None
+                    if not app_name:
+                        continue
+
+                    if use_cage:
+                        target = f'"{exe_path}"'
+                        launch_opts = f'"{app_name}"'
+                        start_in = start_dir
+                    else:
+                        target = '"waydroid"'
+                        launch_opts = f'"app" "launch" "{app_name}"'
+                        start_in = start_dir
+
+                    yield game_entry(
+                        exe_path=target,
+                        appname=display_name,
+                        launch_options=launch_opts,
+                        start_dir=start_in,
+                        launcher_name="Waydroid"
+                    )
+
+                except Exception as e:
+                    print(f"Failed to process {file_name}: {e}")
+        else:
+            print(f"Applications directory not found: {applications_dir}")
 # End of Waydroid scanner
 
 
@@ -6315,60 +8092,65 @@ else:
 
 
 #Flatpak Scanner
-flatpak_apps = [
-    {
-        "id": "com.nvidia.geforcenow",
-        "display_name": "NVIDIA GeForce NOW"
-    },
-    {
-        "id": "com.moonlight_stream.Moonlight",
-        "display_name": "Moonlight Game Streaming"
-    },
-    {
-        "id": "com.hypixel.HytaleLauncher",
-        "display_name": "Hytale"
-    }
-]
+@register_scanner("Flatpak", inputs=lambda: [
+    f"{logged_in_home}/.local/share/flatpak/app/",
+    "/var/lib/flatpak/app/",
+])
+def scan_flatpak_apps():
+    flatpak_apps = [
+        {
+            "id": "com.nvidia.geforcenow",
+            "display_name": "NVIDIA GeForce NOW"
+        },
+        {
+            "id": "com.moonlight_stream.Moonlight",
+            "display_name": "Moonlight Game Streaming"
+        },
+        {
+            "id": "com.hypixel.HytaleLauncher",
+            "display_name": "Hytale"
+        }
+    ]
 
-exe_path = "/usr/bin/flatpak"
-start_dir = "/usr/bin"
+    exe_path = "/usr/bin/flatpak"
+    start_dir = "/usr/bin"
 
-def is_flatpak_installed(app_id):
-    try:
-        subprocess.run(["flatpak", "info", "--user", app_id],
-                       check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    def is_flatpak_installed(app_id):
         try:
-            subprocess.run(["flatpak", "info", "--system", app_id],
+            subprocess.run(["flatpak", "info", "--user", app_id],
                            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return True
         except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+            try:
+                subprocess.run(["flatpak", "info", "--system", app_id],
+                               check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                return True
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                return False
+
+    for app in flatpak_apps:
+        app_id = app["id"]
+        display_name = app["display_name"]
+        if not is_flatpak_installed(app_id):
+            print(f"Skipping {display_name} scanner — Flatpak not found or app not installed.")
+            continue
 
-for app in flatpak_apps:
-    app_id = app["id"]
-    display_name = app["display_name"]
-    if not is_flatpak_installed(app_id):
-        print(f"Skipping {display_name} scanner — Flatpak not found or app not installed.")
-        continue
-
-    # Custom launch options for specific apps
-    if app_id == "com.moonlight_stream.Moonlight":
-        app_launch_options = '"run" "--branch=stable" "--arch=x86_64" "--command=moonlight" "com.moonlight_stream.Moonlight"'
-    elif app_id == "com.hypixel.HytaleLauncher":
-        app_launch_options = '"run" "--branch=master" "--arch=x86_64" "--command=hytale-launcher-wrapper" "com.hypixel.HytaleLauncher"'
-    else:
-        app_launch_options = f"run {app_id}"
-
-    create_new_entry(
-        shortcutdirectory=f'"{exe_path}"',
-        appname=display_name,
-        launchoptions=app_launch_options,
-        startingdir=f'"{start_dir}"',
-        launcher_name="NonSteamLaunchers"
-    )
-    track_game(display_name, "Launcher")
+        # Custom launch options for specific apps
+        if app_id == "com.moonlight_stream.Moonlight":
+            app_launch_options = '"run" "--branch=stable" "--arch=x86_64" "--command=moonlight" "com.moonlight_stream.Moonlight"'
+        elif app_id == "com.hypixel.HytaleLauncher":
+            app_launch_options = '"run" "--branch=master" "--arch=x86_64" "--command=hytale-launcher-wrapper" "com.hypixel.HytaleLauncher"'
+        else:
+            app_launch_options = f"run {app_id}"
+
+        yield game_entry(
+            exe_path=f'"{exe_path}"',
+            appname=display_name,
+            launch_options=app_launch_options,
+            start_dir=f'"{start_dir}"',
+            launcher_name="NonSteamLaunchers",
+            track_as="Launcher"
+        )
 # End of Flatpak Scanner
 
 
@@ -6376,61 +8158,66 @@ for app in flatpak_apps:
 
 
 #STOVE Client Scanner
-steam_compat_base = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{stove_launcher}"
-stove_launcher_path = os.path.join(steam_compat_base, "pfx/drive_c/ProgramData/Smilegate/STOVE/STOVE.exe")
-client_config_path = os.path.join(steam_compat_base, "pfx/drive_c/users/steamuser/AppData/Local/STOVE/Config/ClientConfig.json")
-
-if not os.path.isfile(client_config_path):
-    print("Skipping STOVE Scanner ClientConfig.json not found at", client_config_path)
-else:
-    with open(client_config_path, "r", encoding="utf-8") as f:
-        client_config = json.load(f)
-
-    win_games_dir = client_config.get("defaultPath", "")
-    if not win_games_dir:
-        print("No defaultPath found in ClientConfig.json")
+@register_scanner("STOVE Client", inputs=lambda: [
+    compatdata_path(stove_launcher, "pfx/drive_c/users/steamuser/AppData/Local/STOVE/Config/ClientConfig.json"),
+])
+def scan_stove():
+    steam_compat_base = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{stove_launcher}"
+    stove_launcher_path = os.path.join(steam_compat_base, "pfx/drive_c/ProgramData/Smilegate/STOVE/STOVE.exe")
+    client_config_path = os.path.join(steam_compat_base, "pfx/drive_c/users/steamuser/AppData/Local/STOVE/Config/ClientConfig.json")
+
+    if not os.path.isfile(client_config_path):
+        print("Skipping STOVE Scanner ClientConfig.json not found at", client_config_path)
     else:
-        linux_games_dir = win_games_dir.replace("C:\\", f"{steam_compat_base}/pfx/drive_c/").replace("\\", "/")
-        if not os.path.isdir(linux_games_dir):
-            print("Games directory not found at", linux_games_dir)
+        with open(client_config_path, "r", encoding="utf-8") as f:
+            client_config = json.load(f)
+
+        win_games_dir = client_config.get("defaultPath", "")
+        if not win_games_dir:
+            print("No defaultPath found in ClientConfig.json")
         else:
-            manifest_files = []
-            for subdir_name in os.listdir(linux_games_dir):
-                subdir_path = os.path.join(linux_games_dir, subdir_name)
-                combinedata_path = os.path.join(subdir_path, "combinedata_manifest")
-                if os.path.isdir(combinedata_path):
-                    for filename in os.listdir(combinedata_path):
-                        if filename.startswith("GameManifest_") and filename.endswith(".upf"):
-                            manifest_files.append(os.path.join(combinedata_path, filename))
-
-            if not manifest_files:
-                print("No game manifest files found")
+            linux_games_dir = win_games_dir.replace("C:\\", f"{steam_compat_base}/pfx/drive_c/").replace("\\", "/")
+            if not os.path.isdir(linux_games_dir):
+                print("Games directory not found at", linux_games_dir)
             else:
-                for manifest_path in manifest_files:
-                    try:
-                        with open(manifest_path, "r", encoding="utf-8") as mf:
-                            game_data = json.load(mf)
+                # Installing or removing a game changes these listings, so the scan index has to watch them too
+                watch_input(linux_games_dir)
+                manifest_files = []
+                for subdir_name in os.listdir(linux_games_dir):
+                    subdir_path = os.path.join(linux_games_dir, subdir_name)
+                    combinedata_path = os.path.join(subdir_path, "combinedata_manifest")
+                    if os.path.isdir(combinedata_path):
+                        watch_input(combinedata_path)
+                        for filename in os.listdir(combinedata_path):
+                            if filename.startswith("GameManifest_") and filename.endswith(".upf"):
+                                manifest_files.append(os.path.join(combinedata_path, filename))
+
+                if not manifest_files:
+                    print("No game manifest files found")
+                else:
+                    for manifest_path in manifest_files:
+                        try:
+                            game_data = parse_cached(manifest_path, load_json_file)
 
-                        game_id = game_data.get("game_id")
-                        game_title = game_data.get("game_title", game_id)
+                            game_id = game_data.get("game_id")
+                            game_title = game_data.get("game_title", game_id)
 
-                        if not game_id:
-                            print("Missing game_id in manifest:", manifest_path)
-                            continue
+                            if not game_id:
+                                print("Missing game_id in manifest:", manifest_path)
+                                continue
 
-                        launch_options = f'STEAM_COMPAT_DATA_PATH="{steam_compat_base}/" %command% "sgup://run/{game_id}"'
+                            launch_options = f'STEAM_COMPAT_DATA_PATH="{steam_compat_base}/" %command% "sgup://run/{game_id}"'
 
-                        create_new_entry(
-                            shortcutdirectory=f'"{stove_launcher_path}"',
-                            appname=game_title,
-                            launchoptions=launch_options,
-                            startingdir=f'"{os.path.dirname(stove_launcher_path)}"',
-                            launcher_name="STOVE Client"
-                        )
-                        track_game(game_title, "STOVE Client")
+                            yield game_entry(
+                                exe_path=f'"{stove_launcher_path}"',
+                                appname=game_title,
+                                launch_options=launch_options,
+                                start_dir=f'"{os.path.dirname(stove_launcher_path)}"',
+                                launcher_name="STOVE Client"
+                            )
 
-                    except Exception as e:
-                        print("Error reading manifest", manifest_path, ":", e)
+                        except Exception as e:
+                            print("Error reading manifest", manifest_path, ":", e)
 
 #End of STOVE Client Scanner
 
@@ -6438,62 +8225,65 @@ else:
 
 
 # Humble Games Collection Scanner (Humble Bundle, Humble Games, Humble Games Collection)
-proton_prefix = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{humble_launcher}/pfx"
-
-# JSON config file path inside Proton prefix
-config_path = os.path.join(
-    proton_prefix,
-    "drive_c/users/steamuser/AppData/Roaming/Humble App/config.json"
-)
+@register_scanner("Humble Bundle", inputs=lambda: [
+    compatdata_path(humble_launcher, "pfx/drive_c/users/steamuser/AppData/Roaming/Humble App/config.json"),
+])
+def scan_humble():
+    proton_prefix = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{humble_launcher}/pfx"
+
+    # JSON config file path inside Proton prefix
+    config_path = os.path.join(
+        proton_prefix,
+        "drive_c/users/steamuser/AppData/Roaming/Humble App/config.json"
+    )
 
-# Convert Windows-style path to Linux path inside Proton prefix drive_c
-def windows_to_linux_path(win_path):
-    if not win_path:
-        return ""
-    if win_path.startswith("C:\\"):
-        rel_path = win_path.replace("C:\\", "").replace("\\", "/")
-        return os.path.join(proton_prefix, "drive_c", rel_path)
-    return win_path
-
-# Skip scanner if config doesn't exist
-if not os.path.isfile(config_path):
-    print("Skipping Humble Games Scanner (config not found)")
-else:
-    try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except json.JSONDecodeError:
-        print("Skipping Humble Games Scanner (invalid config)")
+    # Convert Windows-style path to Linux path inside Proton prefix drive_c
+    def windows_to_linux_path(win_path):
+        if not win_path:
+            return ""
+        if win_path.startswith("C:\\"):
+            rel_path = win_path.replace("C:\\", "").replace("\\", "/")
+            return os.path.join(proton_prefix, "drive_c", rel_path)
+        return win_path
+
+    # Skip scanner if config doesn't exist
+    if not os.path.isfile(config_path):
+        print("Skipping Humble Games Scanner (config not found)")
     else:
-        games = data.get("game-collection-4", [])
+        try:
+            with open(config_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except json.JSONDecodeError:
+            print("Skipping Humble Games Scanner (invalid config)")
+        else:
+            games = data.get("game-collection-4", [])
 
-        for idx, game in enumerate(games, 1):
-            status = game.get("status")
-            if status not in ("downloaded", "installed"):
-                continue
+            for idx, game in enumerate(games, 1):
+                status = game.get("status")
+                if status not in ("downloaded", "installed"):
+                    continue
 
-            game_name = game.get("gameName", "Unknown")
-            win_install_path = game.get("filePath", "")
-            exe_rel_path = game.get("executablePath", "")
+                game_name = game.get("gameName", "Unknown")
+                win_install_path = game.get("filePath", "")
+                exe_rel_path = game.get("executablePath", "")
 
 
-            if not exe_rel_path or not win_install_path:
-                print("  Missing executable or install path, skipping")
-                continue
+                if not exe_rel_path or not win_install_path:
+                    print("  Missing executable or install path, skipping")
+                    continue
 
-            linux_install_path = windows_to_linux_path(win_install_path)
-            linux_exe_path = os.path.join(linux_install_path, exe_rel_path.replace("\\", "/"))
+                linux_install_path = windows_to_linux_path(win_install_path)
+                linux_exe_path = os.path.join(linux_install_path, exe_rel_path.replace("\\", "/"))
 
-            if not os.path.isfile(linux_exe_path):
-                print("  Executable not found, skipping game")
-                continue
+                if not os.path.isfile(linux_exe_path):
+                    print("  Executable not found, skipping game")
+                    continue
 
-            start_dir = os.path.dirname(linux_exe_path)
-            launch_options = f'STEAM_COMPAT_DATA_PATH="{proton_prefix}" %command%'
+                start_dir = os.path.dirname(linux_exe_path)
+                launch_options = f'STEAM_COMPAT_DATA_PATH="{proton_prefix}" %command%'
 
-            # Your shortcut creation function (should be defined elsewhere)
-            create_new_entry(f'"{linux_exe_path}"', game_name, launch_options, f'"{start_dir}"', launcher_name="Humble Bundle")
-            track_game(game_name, "Humble Bundle")
+                # Your shortcut creation function (should be defined elsewhere)
+                yield game_entry(f'"{linux_exe_path}"', game_name, launch_options, f'"{start_dir}"', launcher_name="Humble Bundle")
 
 # End of Humble Scanner
 
@@ -6527,193 +8317,199 @@ def extract_block_info(block):
 
     return full_game_name, short_name, parent_game_id
 
-log_path = os.path.join(
-    logged_in_home,
-    ".var/app/com.nvidia.geforcenow/.local/state/NVIDIA/GeForceNOW/console.log"
-)
+@register_scanner("NVIDIA GeForce NOW", inputs=lambda: [
+    os.path.join(logged_in_home, ".var/app/com.nvidia.geforcenow/.local/state/NVIDIA/GeForceNOW/console.log"),
+])
+def scan_geforce_now():
+    log_path = os.path.join(
+        logged_in_home,
+        ".var/app/com.nvidia.geforcenow/.local/state/NVIDIA/GeForceNOW/console.log"
+    )
 
-if not os.path.exists(log_path):
-    print(f"GeForce NOW log not found at: {log_path}. Skipping scan.")
-else:
-    try:
-        with open(log_path) as f:
-            lines = f.readlines()
-    except Exception as e:
-        print(f"Failed to read GeForce NOW log: {e}")
+    if not os.path.exists(log_path):
+        print(f"GeForce NOW log not found at: {log_path}. Skipping scan.")
     else:
-        viewgame_events = []
-        for i, line in enumerate(lines):
-            if "JsEventsService" in line and "events request" in line:
-                try:
-                    json_part = line.split("events request", 1)[1].strip()
-                    data = json.loads(json_part)
-                    for event in data.get("events", []):
-                        if event.get("name") == "Click":
-                            params = event.get("parameters", {})
-                            if params.get("itemType") == "ViewGameDetails":
-                                item_label = params.get("itemLabel")
-                                if item_label and re.match(r"^\d+$", item_label):
-                                    viewgame_events.append({
-                                        "line_index": i,
-                                        "cmsId": item_label
-                                    })
-                except Exception:
-                    continue
-
-        favorites = []
-        for i, line in enumerate(lines):
-            if "UserGesture clicked on add to favorites" in line:
-                block = lines[i:i+30]
-                full_game_name, short_name, parent_game_id = extract_block_info(block)
-
-                if not short_name or not parent_game_id:
-                    continue
+        try:
+            with open(log_path) as f:
+                lines = f.readlines()
+        except Exception as e:
+            print(f"Failed to read GeForce NOW log: {e}")
+        else:
+            viewgame_events = []
+            for i, line in enumerate(lines):
+                if "JsEventsService" in line and "events request" in line:
+                    try:
+                        json_part = line.split("events request", 1)[1].strip()
+                        data = json.loads(json_part)
+                        for event in data.get("events", []):
+                            if event.get("name") == "Click":
+                                params = event.get("parameters", {})
+                                if params.get("itemType") == "ViewGameDetails":
+                                    item_label = params.get("itemLabel")
+                                    if item_label and re.match(r"^\d+$", item_label):
+                                        viewgame_events.append({
+                                            "line_index": i,
+                                            "cmsId": item_label
+                                        })
+                    except Exception:
+                        continue
 
-                closest_view = None
-                closest_distance = None
-                for view in viewgame_events:
-                    distance = abs(view["line_index"] - i)
-                    if closest_distance is None or distance < closest_distance:
-                        closest_distance = distance
-                        closest_view = view
-
-                cms_id = closest_view["cmsId"] if closest_view else None
-
-                favorites.append({
-                    "shortName": short_name,
-                    "parentGameId": parent_game_id,
-                    "cmsId": cms_id,
-                    "fullGameName": full_game_name
-                })
+            favorites = []
+            for i, line in enumerate(lines):
+                if "UserGesture clicked on add to favorites" in line:
+                    block = lines[i:i+30]
+                    full_game_name, short_name, parent_game_id = extract_block_info(block)
 
-        for fav in favorites:
-            display_name = fav['fullGameName'] or fav['shortName']
-            exe_path = '"/usr/bin/flatpak"'
-            start_dir = '"/usr/bin/"'
+                    if not short_name or not parent_game_id:
+                        continue
 
-            if fav["cmsId"]:
-                url_route = (
-                    f"#?cmsId={fav['cmsId']}"
-                    f"&launchSource=External&shortName={fav['shortName']}"
-                    f"&parentGameId={fav['parentGameId']}"
-                )
-            else:
-                print(f"Missing cmsId for favorite game: {display_name}")
-                url_route = (
-                    f"#?launchSource=External&shortName={fav['shortName']}"
-                    f"&parentGameId={fav['parentGameId']}"
+                    closest_view = None
+                    closest_distance = None
+                    for view in viewgame_events:
+                        distance = abs(view["line_index"] - i)
+                        if closest_distance is None or distance < closest_distance:
+                            closest_distance = distance
+                            closest_view = view
+
+                    cms_id = closest_view["cmsId"] if closest_view else None
+
+                    favorites.append({
+                        "shortName": short_name,
+                        "parentGameId": parent_game_id,
+                        "cmsId": cms_id,
+                        "fullGameName": full_game_name
+                    })
+
+            for fav in favorites:
+                display_name = fav['fullGameName'] or fav['shortName']
+                exe_path = '"/usr/bin/flatpak"'
+                start_dir = '"/usr/bin/"'
+
+                if fav["cmsId"]:
+                    url_route = (
+                        f"#?cmsId={fav['cmsId']}"
+                        f"&launchSource=External&shortName={fav['shortName']}"
+                        f"&parentGameId={fav['parentGameId']}"
+                    )
+                else:
+                    print(f"Missing cmsId for favorite game: {display_name}")
+                    url_route = (
+                        f"#?launchSource=External&shortName={fav['shortName']}"
+                        f"&parentGameId={fav['parentGameId']}"
+                    )
+
+                launch_options = (
+                    f"run --command=sh com.nvidia.geforcenow -c "
+                    f"\"/app/cef/GeForceNOW --url-route='{url_route}'\""
                 )
 
-            launch_options = (
-                f"run --command=sh com.nvidia.geforcenow -c "
-                f"\"/app/cef/GeForceNOW --url-route='{url_route}'\""
-            )
-
-            print(f"Creating shortcut for: {display_name}")
-            create_new_entry(exe_path, display_name, launch_options, start_dir, "NVIDIA GeForce NOW")
-            #track_game(display_name, "NVIDIA GeForce NOW")
+                print(f"Creating shortcut for: {display_name}")
+                yield game_entry(exe_path, display_name, launch_options, start_dir, "NVIDIA GeForce NOW", track_as=False)
 #End NVIDIA GeForce NOW Game Scanner
 
 
 
 # Gryphlink Scanner (Endfield)
 
-endfield_exe = (
-    f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gryphlink_launcher}/"
-    "pfx/drive_c/Program Files/GRYPHLINK/games/EndField Game/Endfield.exe"
-)
-
-# Check if Endfield exists
-if os.path.exists(endfield_exe):
-    print(f"File exists: {endfield_exe}")
-
-    display_name = "Arknights: Endfield"
-    launch_options = (
-        f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/"
-        f"steamapps/compatdata/{gryphlink_launcher}/\" %command%"
+@register_scanner("GRYPHLINK", inputs=lambda: [
+    compatdata_path(gryphlink_launcher, "pfx/drive_c/Program Files/GRYPHLINK/games/EndField Game/Endfield.exe"),
+])
+def scan_gryphlink():
+    endfield_exe = (
+        f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{gryphlink_launcher}/"
+        "pfx/drive_c/Program Files/GRYPHLINK/games/EndField Game/Endfield.exe"
     )
 
-    exe_path = f"\"{endfield_exe}\""
-    start_dir = f"\"{os.path.dirname(endfield_exe)}\""
+    # Check if Endfield exists
+    if os.path.exists(endfield_exe):
+        print(f"File exists: {endfield_exe}")
 
-    create_new_entry(
-        exe_path,
-        display_name,
-        launch_options,
-        start_dir,
-        launcher_name="Gryphlink"
-    )
+        display_name = "Arknights: Endfield"
+        launch_options = (
+            f"STEAM_COMPAT_DATA_PATH=\"{logged_in_home}/.local/share/Steam/"
+            f"steamapps/compatdata/{gryphlink_launcher}/\" %command%"
+        )
 
-    track_game(display_name, "Gryphlink")
+        exe_path = f"\"{endfield_exe}\""
+        start_dir = f"\"{os.path.dirname(endfield_exe)}\""
 
-else:
-    print("Skipping Gryphlink Scanner — Endfield.exe not found")
+        yield game_entry(
+            exe_path,
+            display_name,
+            launch_options,
+            start_dir,
+            launcher_name="Gryphlink"
+        )
+
+    else:
+        print("Skipping Gryphlink Scanner — Endfield.exe not found")
 
 # End of Gryphlink Game Scanner
 
 
 # Rockstar Games Launcher Scanner
-rockstar_launcher_id = os.environ.get('rockstar_launcher', '')
-rockstar_sys_reg = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{rockstar_launcher_id}/pfx/system.reg"
-
-if not rockstar_launcher_id or not os.path.exists(rockstar_sys_reg):
-    print("Rockstar Games Launcher data not found. Skipping Rockstar Games Scanner.")
-else:
-    rockstar_games = {}
-    current_game = None
-
-    with open(rockstar_sys_reg, 'r') as f:
-        for line in f:
-            section_match = re.search(r'\[Software\\\\Wow6432Node\\\\Rockstar Games\\\\([^\\]+)\]', line)
-            if section_match:
-                game_title = section_match.group(1)
-                if game_title in ("Launcher", "Rockstar Games Social Club"):
-                    current_game = None
-                else:
-                    current_game = game_title
-                continue
+@register_scanner("Rockstar Games Launcher", inputs=lambda: [
+    compatdata_path(os.environ.get('rockstar_launcher', ''), "pfx/system.reg"),
+])
+def scan_rockstar():
+    rockstar_launcher_id = os.environ.get('rockstar_launcher', '')
+    rockstar_sys_reg = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{rockstar_launcher_id}/pfx/system.reg"
+
+    if not rockstar_launcher_id or not os.path.exists(rockstar_sys_reg):
+        print("Rockstar Games Launcher data not found. Skipping Rockstar Games Scanner.")
+    else:
+        rockstar_games = {}
+        current_game = None
 
-            if current_game and '"InstallFolder"' in line:
-                folder_match = re.search(r'"InstallFolder"="(.+)"', line)
-                if folder_match:
-                    install_folder = folder_match.group(1)
-                    linux_path = install_folder.replace(
-                        "C:\\\\",
-                        f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{rockstar_launcher_id}/pfx/drive_c/"
-                    ).replace("\\\\", "/")
-                    if os.path.exists(linux_path):
-                        if current_game not in rockstar_games:
-                            rockstar_games[current_game] = linux_path
+        with open(rockstar_sys_reg, 'r') as f:
+            for line in f:
+                section_match = re.search(r'\[Software\\\\Wow6432Node\\\\Rockstar Games\\\\([^\\]+)\]', line)
+                if section_match:
+                    game_title = section_match.group(1)
+                    if game_title in ("Launcher", "Rockstar Games Social Club"):
+                        current_game = None
                     else:
-                        print(f"Rockstar game '{current_game}' found in registry but install path not in launcher prefix: {linux_path}")
+                        current_game = game_title
+                    continue
 
-    if not rockstar_games:
-        print("No Rockstar games found in registry. Skipping Rockstar Games Scanner.")
-    else:
-        compat_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{rockstar_launcher_id}/"
-
-        for game_name, install_path in rockstar_games.items():
-            game_exe = None
-            if os.path.isdir(install_path):
-                exe_candidates = [f for f in os.listdir(install_path) if f.lower().endswith('.exe') and 'uninstall' not in f.lower()]
-                game_word = game_name.split()[-1].lower()
-                game_exe = next((e for e in exe_candidates if game_word in e.lower()), exe_candidates[0] if exe_candidates else None)
-
-            if game_exe:
-                exe_path = f'"{os.path.join(install_path, game_exe)}"'
-                dir_path = f'"{install_path}"'
-                launch_options = f'STEAM_COMPAT_DATA_PATH="{compat_path}" %command%'
-                create_new_entry(exe_path, game_name, launch_options, dir_path, launcher_name="Rockstar Games Launcher")
-                track_game(game_name, "Rockstar Games Launcher")
-                print(f"Added Rockstar game: {game_name}")
-            else:
-                print(f"Could not find game executable for {game_name} in {install_path}")
+                if current_game and '"InstallFolder"' in line:
+                    folder_match = re.search(r'"InstallFolder"="(.+)"', line)
+                    if folder_match:
+                        install_folder = folder_match.group(1)
+                        linux_path = install_folder.replace(
+                            "C:\\\\",
+                            f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{rockstar_launcher_id}/pfx/drive_c/"
+                        ).replace("\\\\", "/")
+                        if os.path.exists(linux_path):
+                            if current_game not in rockstar_games:
+                                rockstar_games[current_game] = linux_path
+                        else:
+                            print(f"Rockstar game '{current_game}' found in registry but install path not in launcher prefix: {linux_path}")
 
-# End of Rockstar Games Scanner
+        if not rockstar_games:
+            print("No Rockstar games found in registry. Skipping Rockstar Games Scanner.")
+        else:
+            compat_path = f"{logged_in_home}/.local/share/Steam/steamapps/compatdata/{rockstar_launcher_id}/"
+
+            for game_name, install_path in rockstar_games.items():
+                game_exe = None
+                if os.path.isdir(install_path):
+                    exe_candidates = [f for f in os.listdir(install_path) if f.lower().endswith('.exe') and 'uninstall' not in f.lower()]
+                    game_word = game_name.split()[-1].lower()
+                    game_exe = next((e for e in exe_candidates if game_word in e.lower()), exe_candidates[0] if exe_candidates else None)
+
+                if game_exe:
+                    exe_path = f'"{os.path.join(install_path, game_exe)}"'
+                    dir_path = f'"{install_path}"'
+                    launch_options = f'STEAM_COMPAT_DATA_PATH="{compat_path}" %command%'
+                    yield game_entry(exe_path, game_name, launch_options, dir_path, launcher_name="Rockstar Games Launcher")
+                    print(f"Added Rockstar game: {game_name}")
+                else:
+                    print(f"Could not find game executable for {game_name} in {install_path}")
 
+# End of Rockstar Games Scanner
+#End of Scanners
 
-# Call finalize_tracking and capture removed apps
-removed_apps = finalize_tracking()
 
 # List of game names to skip fetching descriptions for
 skip_games = {'Epic Games', 'GOG Galaxy', 'Ubisoft Connect', 'Battle.net', 'EA App',
@@ -6730,14 +8526,120 @@ skip_games = {'Epic Games', 'GOG Galaxy', 'Ubisoft Connect', 'Battle.net', 'EA A
 
 
 # --- Boot Video Logic ---
+# The steamdeckrepo listing is kept on disk and only revalidated (ETag / Last-Modified) once it is older than
+# BOOT_VIDEO_CATALOG_TTL. Boot videos are indexed by title token, most liked first
+BOOT_VIDEO_API_URL = "https://steamdeckrepo.com/api/posts/all"
+BOOT_VIDEO_CATALOG_PATH = f"{logged_in_home}/.config/systemd/user/steamdeckrepo.json"
+BOOT_VIDEO_CATALOG_TTL = 12 * 3600
+
+def title_tokens(title):
+    return re.findall(r'[a-z0-9]+', title.lower())
+
+class BootVideoCatalog:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.catalog = None
+        self.videos = []
+        self.tokens = {}
+        self.matches = {}
+
+    def read_disk(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def write_disk(self, catalog):
+        try:
+            with open(self.path + ".tmp", 'w', encoding='utf-8') as f:
+                json.dump(catalog, f)
+            os.replace(self.path + ".tmp", self.path)
+        except OSError as e:
+            print(f"Could not save the steamdeckrepo catalog: {e}")
+
+    def revalidate(self, catalog):
+        headers = {"User-Agent": "SteamDeckBootFetcher/1.0"}
+        if catalog:
+            if catalog.get("etag"):
+                headers["If-None-Match"] = catalog["etag"]
+            if catalog.get("last_modified"):
+                headers["If-Modified-Since"] = catalog["last_modified"]
+
+        # Retries, and waiting out a 429, happen in http_request
+        response = http_request("GET", BOOT_VIDEO_API_URL, headers=headers, timeout=20)
+        if response.status == 304 and catalog:
+            print("steamdeckrepo catalog not modified.")
+            catalog["fetched_at"] = time.time()
+            self.write_disk(catalog)
+            return catalog
+        if response.status != 200:
+            raise Exception(f"steamdeckrepo fetch failed, status={response.status}")
+
+        posts = json.loads(response.data.decode('utf-8')).get('posts', [])
+        catalog = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "videos": [
+                {'id': entry['id'], 'title': entry['title'], 'video': entry['video'], 'likes': entry['likes']}
+                for entry in posts if entry.get('type') == 'boot_video'
+            ],
+        }
+        print(f"Fetched steamdeckrepo catalog, {len(catalog['videos'])} boot videos.")
+        self.write_disk(catalog)
+        return catalog
+
+    def load(self):
+        with self.lock:
+            if self.catalog is not None and time.time() - self.catalog.get("fetched_at", 0) < BOOT_VIDEO_CATALOG_TTL:
+                return
+            catalog = self.catalog or self.read_disk()
+            if not catalog or time.time() - catalog.get("fetched_at", 0) >= BOOT_VIDEO_CATALOG_TTL:
+                try:
+                    catalog = self.revalidate(catalog)
+                except Exception as e:
+                    # A stale catalog still finds videos
+                    if not catalog:
+                        raise
+                    print(f"Using the saved steamdeckrepo catalog: {e}")
+            if catalog is self.catalog:
+                return
+
+            self.catalog = catalog
+            self.videos = sorted(catalog.get("videos", []), key=lambda x: x['likes'], reverse=True)
+            self.tokens = {}
+            for i, video in enumerate(self.videos):
+                for token in set(title_tokens(video['title'])):
+                    self.tokens.setdefault(token, []).append(i)
+            self.matches = {}
+
+    # Most liked boot video whose title contains the whole term
+    def find(self, term):
+        self.load()
+        term = term.lower()
+        if term in self.matches:
+            return self.matches[term]
+
+        postings = sorted((self.tokens.get(token, []) for token in set(title_tokens(term))), key=len)
+        match = None
+        if postings and postings[0]:
+            others = [set(p) for p in postings[1:]]
+            for i in postings[0]:
+                if all(i in other for other in others) and term in self.videos[i]['title'].lower():
+                    match = self.videos[i]
+                    break
+        self.matches[term] = match
+        return match
+
+boot_video_catalog = BootVideoCatalog(BOOT_VIDEO_CATALOG_PATH)
+
 def get_boot_video(game_name, logged_in_home):
     excluded_apps = skip_games
 
     OVERRIDE_PATH = os.path.expanduser(f'{logged_in_home}/.steam/root/config/uioverrides/movies')
-    REQUEST_RETRIES = 5
-    API_URL = "https://steamdeckrepo.com/api/posts/all"
     DOWNLOAD_BASE = "https://steamdeckrepo.com/post/download"
-    ssl_ctx = ssl.create_default_context()
 
     def sanitize_filename(filename):
         return re.sub(r'[<>:"/\\|?*]', '_', filename)
@@ -6756,18 +8658,12 @@ def get_boot_video(game_name, logged_in_home):
         download_url = video.get('download_url')
         if download_url:
             try:
-                with urllib.request.urlopen(download_url, context=ssl_ctx, timeout=60) as response:
-                    if response.status == 200:
-                        with open(file_path, 'wb') as f:
-                            while True:
-                                chunk = response.read(8192)
-                                if not chunk:
-                                    break
-                                f.write(chunk)
-                        print(f"Downloaded {file_path}")
-                    else:
-                        print(f"Failed to download {file_path}, status code: {response.status}")
-            except urllib.error.URLError as e:
+                status = download_file(download_url, file_path)
+                if status == 200:
+                    print(f"Downloaded {file_path}")
+                else:
+                    print(f"Failed to download {file_path}, status code: {status}")
+            except Exception as e:
                 print(f"Download failed for {file_path}: {e}")
         else:
             print("No download URL found for video.")
@@ -6778,72 +8674,29 @@ def get_boot_video(game_name, logged_in_home):
             print(f"Skipping boot video for {game_name}, as it's in the excluded apps list.")
             return
 
-        data = []
-        for attempt in range(REQUEST_RETRIES):
-            try:
-                req = urllib.request.Request(API_URL, headers={"User-Agent": "SteamDeckBootFetcher/1.0"})
-                with urllib.request.urlopen(req, context=ssl_ctx, timeout=20) as response:
-                    if response.status == 200:
-                        data = json.loads(response.read().decode('utf-8')).get('posts', [])
-                        break
-                    elif response.status == 429:
-                        raise Exception('Rate limit exceeded, try again in a minute')
-                    else:
-                        print(f"steamdeckrepo fetch failed, status={response.status}")
-            except urllib.error.URLError as e:
-                print(f"Request failed: {e}")
-            time.sleep(2)  # brief wait before retry
-        else:
-            raise Exception("Retry attempts exceeded")
-
-        search_terms = [game_name.lower()]
+        def as_download(entry):
+            return {
+                'id': entry['id'],
+                'name': entry['title'],
+                'preview_video': entry['video'],
+                'download_url': f"{DOWNLOAD_BASE}/{entry['id']}",
+                'target': 'boot',
+                'likes': entry['likes'],
+            }
 
         # First try full game name
-        for term in search_terms:
-            filtered_videos = sorted(
-                (
-                    {
-                        'id': entry['id'],
-                        'name': entry['title'],
-                        'preview_video': entry['video'],
-                        'download_url': f"{DOWNLOAD_BASE}/{entry['id']}",
-                        'target': 'boot',
-                        'likes': entry['likes'],
-                    }
-                    for entry in data
-                    if term in entry['title'].lower() and entry['type'] == 'boot_video'
-                ),
-                key=lambda x: x['likes'], reverse=True
-            )
-
-            if filtered_videos:
-                video = filtered_videos[0]
-                print(f"Downloading boot video: {video['name']}")
-                download_video(video, OVERRIDE_PATH)
-                return
+        entry = boot_video_catalog.find(game_name)
+        if entry:
+            video = as_download(entry)
+            print(f"Downloading boot video: {video['name']}")
+            download_video(video, OVERRIDE_PATH)
+            return
 
         # If no video, try first two words of game name
         if len(game_name.split()) > 1:
-            first_two_words = ' '.join(game_name.split()[:2]).lower()
-            filtered_videos = sorted(
-                (
-                    {
-                        'id': entry['id'],
-                        'name': entry['title'],
-                        'preview_video': entry['video'],
-                        'download_url': f"{DOWNLOAD_BASE}/{entry['id']}",
-                        'target': 'boot',
-                        'likes': entry['likes'],
-                    }
-                    for entry in data
-                    if first_two_words in entry['title'].lower() and entry['type'] == 'boot_video'
-                ),
-                key=lambda x: x['likes'], reverse=True
-            )
-
-            if filtered_videos:
-                video = filtered_videos[0]
-                download_video(video, OVERRIDE_PATH)
+            entry = boot_video_catalog.find(' '.join(game_name.split()[:2]))
+            if entry:
+                download_video(as_download(entry), OVERRIDE_PATH)
                 return
 
         # No video found
@@ -6853,120 +8706,478 @@ def get_boot_video(game_name, logged_in_home):
         print(f"Failed to fetch steamdeckrepo: {e}")
 # --- End of Boot Video Logic ---
 
-# --- Main block (MUST remain untouched) ---
-if new_shortcuts_added or shortcuts_updated:
+def report_scan_results(removed_apps):
+    # --- Main block (MUST remain untouched) ---
+    if new_shortcuts_added or shortcuts_updated:
 
-    # --- Additional Logic ---
-    notified_games = set()
-    if created_shortcuts:
-        print("Created Shortcuts:")
+        # --- Additional Logic ---
+        notified_games = set()
+        if created_shortcuts:
+            print("Created Shortcuts:")
 
-        for name in created_shortcuts:
-            print(name)
+            for name in created_shortcuts:
+                print(name)
 
-            if name.lower() not in [app.lower() for app in skip_games]:
-                print(f"Fetching boot video for: {name}")
-                get_boot_video(name, logged_in_home)
+                if name.lower() not in [app.lower() for app in skip_games]:
+                    print(f"Fetching boot video for: {name}")
+                    get_boot_video(name, logged_in_home)
 
-        for name in created_shortcuts:
-            if name in notified_games:
-                continue
+            for name in created_shortcuts:
+                if name in notified_games:
+                    continue
 
-            shortcut_entry = next(
-                (entry for entry in shortcuts.get('shortcuts', {}).values()
-                 if entry.get('appname') == name), None
-            )
+                shortcut_entry = shortcut_index.find_by_name(name)
 
-            if shortcut_entry:
-                message = f"A new game has been added to your library! {name}"
+                if shortcut_entry:
+                    message = f"A new game has been added to your library! {name}"
 
-                # send_steam_notification(ws_socket, message)
-                notified_games.add(name)
-                time.sleep(0.1)  # Stagger notifications
-            else:
-                print(f"Warning: Game '{name}' not found in shortcuts dictionary.")
+                    # send_steam_notification(ws_socket, message)
+                    notified_games.add(name)
+                    time.sleep(0.1)  # Stagger notifications
+                else:
+                    print(f"Warning: Game '{name}' not found in shortcuts dictionary.")
 
+            print("All finished, Scanner was successful!")
+    else:
+        print("No new shortcuts were added.")
         print("All finished, Scanner was successful!")
-else:
-    print("No new shortcuts were added.")
-    print("All finished, Scanner was successful!")
-
-# Notify about removed games (if any)
-if removed_apps:
-    removed_game_names = [f"{app} ({launcher})" for launcher, apps in removed_apps.items() for app in apps]
-    removed_message = "Removed from library:\n" + "\n".join(removed_game_names)
-
-    ws_socket = None
-    try:
-        ws_url = get_ws_url_by_title(WS_HOST, WS_PORT, TARGET_TITLE)
-        print(f"Connecting to WebSocket URL: {ws_url}")
-        ws_socket = create_websocket_connection(ws_url)
-
-        # Inject JS once
-        inject_js_only(ws_socket)
 
-        # Send notification and remove empty collections
-        result = send_launcher_notification(ws_socket, removed_message, removed_apps)
+    # Notify about removed games (if any)
+    if removed_apps:
+        removed_game_names = [f"{app} ({launcher})" for launcher, apps in removed_apps.items() for app in apps]
+        removed_message = "Removed from library:\n" + "\n".join(removed_game_names)
 
-    except Exception as e:
-        print(f"Failed to send removal notification or cleanup collections: {e}")
+        try:
+            client = get_devtools_client(TARGET_TITLE)
 
-    finally:
-        if ws_socket:
-            ws_socket.close()
+            # Inject JS once
+            inject_js_only(client)
 
-    directories = [
-        os.path.join(logged_in_home, 'Desktop'),
-        os.path.join(logged_in_home, '.local', 'share', 'applications')
-    ]
+            # Send notification and remove empty collections
+            result = send_launcher_notification(client, removed_message, removed_apps)
 
-    for game_name in removed_game_names:
-        base_game_name = game_name.split(' (')[0].strip()
-        desktop_filename = f"{base_game_name}.desktop"
-
-        found_file = False
+        except Exception as e:
+            print(f"Failed to send removal notification or cleanup collections: {e}")
 
-        print(f"Looking for .desktop file for: {game_name}")
+        directories = [
+            os.path.join(logged_in_home, 'Desktop'),
+            os.path.join(logged_in_home, '.local', 'share', 'applications')
+        ]
 
         for game_name in removed_game_names:
             base_game_name = game_name.split(' (')[0].strip()
+            desktop_filename = f"{base_game_name}.desktop"
 
             found_file = False
+
             print(f"Looking for .desktop file for: {game_name}")
 
-            for directory in directories:
-                try:
-                    files_in_directory = os.listdir(directory)
-                except Exception:
-                    continue
+            for game_name in removed_game_names:
+                base_game_name = game_name.split(' (')[0].strip()
+
+                found_file = False
+                print(f"Looking for .desktop file for: {game_name}")
 
-                for f in files_in_directory:
-                    if not f.endswith(".desktop"):
+                for directory in directories:
+                    try:
+                        files_in_directory = os.listdir(directory)
+                    except Exception:
                         continue
 
-                    full_path = os.path.join(directory, f)
+                    for f in files_in_directory:
+                        if not f.endswith(".desktop"):
+                            continue
+
+                        full_path = os.path.join(directory, f)
 
-                    try:
-                        config = configparser.ConfigParser(interpolation=None)
-                        config.read(full_path)
+                        try:
+                            config = configparser.ConfigParser(interpolation=None)
+                            config.read(full_path)
 
-                        if "Desktop Entry" not in config:
+                            if "Desktop Entry" not in config:
+                                continue
+
+                            desktop_name = config["Desktop Entry"].get("Name", "").strip()
+
+                            if desktop_name == base_game_name:
+                                os.remove(full_path)
+                                print(f"Deleted .desktop file for: {game_name} from {directory}")
+                                found_file = True
+                                break
+
+                        except Exception as e:
+                            print(f"Failed reading {full_path}: {e}")
                             continue
 
-                        desktop_name = config["Desktop Entry"].get("Name", "").strip()
+                    if found_file:
+                        break
 
-                        if desktop_name == base_game_name:
-                            os.remove(full_path)
-                            print(f"Deleted .desktop file for: {game_name} from {directory}")
-                            found_file = True
-                            break
+                if not found_file:
+                    print(f"No .desktop file found for: {game_name}")
+# End of scan results
+
+
+
+# Scan cycle, run once per invocation or repeatedly by the daemon
+# changed lists the launcher scanners the change watcher saw activity for, None checks all of them
+def run_scan_cycle(changed=None):
+    global track_game, finalize_tracking
+    global created_shortcuts, new_shortcuts_added, shortcuts_updated
+
+    created_shortcuts = []
+    new_shortcuts_added = False
+    shortcuts_updated = False
+
+    track_game, finalize_tracking = scan_and_track_games(logged_in_home, steamid3)
+    compat_tools.refresh()
+    invalidate_grid_indexes()
+    begin_shortcut_batch()
+
+    add_launcher_shortcuts()
+    add_website_shortcuts()
+    add_nsl_shortcut()
+    link_launcher_compatdata()
+
+    for entry in discover_games(changed):
+        add_game(entry)
+    commit_shortcut_batch()
+    api_cache.report()
+
+    # Call finalize_tracking and capture removed apps
+    removed_apps = finalize_tracking()
+    report_scan_results(removed_apps)
+    save_scan_index()
+
+
+
+#Change Watcher
+# Tells the daemon which launcher scanners have to run, instead of rescanning everything on a timer
+WATCH_DEBOUNCE = 2
+# A burst of changes that never settles (a game download) is still dispatched after this many seconds
+WATCH_MAX_DELAY = 15
+
+def scanner_watch_paths():
+    paths_by_scanner = {}
+    for scanner in launcher_scanners:
+        paths = set(scanner.inputs())
+        record = scan_index.get(scanner.name) or {}
+        paths.update(record.get("inputs", {}))
+        paths.update(record.get("files", {}))
+        paths_by_scanner[scanner.name] = sorted({os.path.normpath(path) for path in paths if path})
+    return paths_by_scanner
+
+def nearest_existing_dir(path):
+    path = os.path.dirname(path)
+    while not os.path.isdir(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+def affected_scanners(paths_by_scanner, changed_path):
+    affected = set()
+    for name, paths in paths_by_scanner.items():
+        for path in paths:
+            # The file itself, something inside a watched folder, or a missing parent folder that just appeared
+            if path == changed_path or path.startswith(changed_path + os.sep) or changed_path.startswith(path + os.sep) \
+                    or (input_pattern(path) and fnmatch.fnmatchcase(changed_path, path)):
+                affected.add(name)
+                break
+    return affected
+
+class InotifyWatcher:
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+                  IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, on_change):
+        self.libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.on_change = on_change
+        self.lock = threading.Lock()
+        self.paths_by_scanner = {}
+        self.dirs = {}
+        self.watches = {}
+
+    # Only folders are watched: the parent of every input file, plus input folders themselves
+    def refresh(self, paths_by_scanner):
+        wanted = set()
+        for paths in paths_by_scanner.values():
+            for path in paths:
+                wanted.add(nearest_existing_dir(path))
+                if os.path.isdir(path):
+                    wanted.add(path)
+
+        with self.lock:
+            self.paths_by_scanner = paths_by_scanner
+            for folder in list(self.dirs):
+                if folder not in wanted:
+                    wd = self.dirs.pop(folder)
+                    self.watches.pop(wd, None)
+                    self.libc.inotify_rm_watch(self.fd, wd)
+            for folder in wanted - set(self.dirs):
+                wd = self.libc.inotify_add_watch(self.fd, os.fsencode(folder), self.WATCH_MASK)
+                if wd < 0:
+                    print(f"Could not watch {folder}: {os.strerror(ctypes.get_errno())}")
+                    continue
+                self.dirs[folder] = wd
+                self.watches[wd] = folder
 
-                    except Exception as e:
-                        print(f"Failed reading {full_path}: {e}")
-                        continue
+    def read_events(self):
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return [], False
+
+        changed_paths = []
+        overflow = False
+        offset = 0
+        with self.lock:
+            while offset + self.EVENT_HEADER.size <= len(data):
+                wd, mask, cookie, length = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & self.IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                folder = self.watches.get(wd)
+                if folder is None:
+                    continue
+                if mask & self.IN_IGNORED:
+                    # The kernel dropped the watch because the folder is gone
+                    self.watches.pop(wd, None)
+                    self.dirs.pop(folder, None)
+                changed_paths.append(os.path.join(folder, os.fsdecode(name)) if name else folder)
+        return changed_paths, overflow
+
+    def run(self):
+        pending = set()
+        first_change = last_change = None
+        while True:
+            timeout = None
+            if pending:
+                timeout = max(0, min(last_change + WATCH_DEBOUNCE, first_change + WATCH_MAX_DELAY) - time.monotonic())
+            try:
+                ready, _, _ = select.select([self.fd], [], [], timeout)
+                if ready:
+                    changed_paths, overflow = self.read_events()
+                    with self.lock:
+                        paths_by_scanner = self.paths_by_scanner
+                    affected = set(paths_by_scanner) if overflow else set()
+                    folders_changed = False
+                    for path in changed_paths:
+                        scanners = affected_scanners(paths_by_scanner, path)
+                        affected |= scanners
+                        if scanners and (os.path.isdir(path) or not os.path.exists(path)):
+                            folders_changed = True
+                    if folders_changed:
+                        # A launcher prefix or game folder appeared or vanished, move the watches along with it
+                        self.refresh(paths_by_scanner)
+                    if affected:
+                        now = time.monotonic()
+                        if not pending:
+                            first_change = now
+                        last_change = now
+                        pending |= affected
+
+                if pending and time.monotonic() >= min(last_change + WATCH_DEBOUNCE, first_change + WATCH_MAX_DELAY):
+                    self.on_change(sorted(pending))
+                    pending = set()
+            except Exception as e:
+                print(f"Change watcher error: {e}")
+                time.sleep(1)
+
+    def start(self):
+        threading.Thread(target=self.run, name="inotify-watcher", daemon=True).start()
+
+# Used when inotify is not available, compares size and mtime of every input on an interval
+class PollingWatcher:
+    def __init__(self, on_change, interval):
+        self.on_change = on_change
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.paths_by_scanner = {}
+
+    def refresh(self, paths_by_scanner):
+        with self.lock:
+            self.paths_by_scanner = paths_by_scanner
+
+    @staticmethod
+    def stat_path(path):
+        if input_pattern(path):
+            return pattern_matches(path)
+        try:
+            st = os.stat(path)
+            return (st.st_size, st.st_mtime_ns)
+        except OSError:
+            return None
+
+    def run(self):
+        previous = {}
+        while True:
+            time.sleep(self.interval)
+            try:
+                with self.lock:
+                    paths_by_scanner = self.paths_by_scanner
+                current = {}
+                affected = set()
+                for name, paths in paths_by_scanner.items():
+                    for path in paths:
+                        if path not in current:
+                            current[path] = self.stat_path(path)
+                        if path in previous and previous[path] != current[path]:
+                            affected.add(name)
+                previous = current
+                if affected:
+                    self.on_change(sorted(affected))
+            except Exception as e:
+                print(f"Change poller error: {e}")
+
+    def start(self):
+        threading.Thread(target=self.run, name="change-poller", daemon=True).start()
+
+def start_change_watcher(scheduler):
+    def on_change(names):
+        scheduler.request_scan(f"changes for {', '.join(names)}", scanners=names)
+
+    try:
+        watcher = InotifyWatcher(on_change)
+        print("Watching launcher files with inotify.")
+    except (OSError, AttributeError) as e:
+        print(f"inotify not available ({e}), polling launcher files every {scheduler.interval}s instead.")
+        watcher = PollingWatcher(on_change, scheduler.interval)
+    watcher.refresh(scanner_watch_paths())
+    watcher.start()
+    return watcher
+#End of Change Watcher
+
+
+
+#Daemon mode
+# Seconds between checks of the Steam frontend and env_vars, can be overridden with NSL_SCAN_INTERVAL in env_vars.
+# Launcher scanners only run when the change watcher reports something, or every FULL_RESCAN_INTERVAL
+DEFAULT_SCAN_INTERVAL = 20
+
+def get_scan_interval():
+    try:
+        return max(1, int(os.environ.get('NSL_SCAN_INTERVAL', DEFAULT_SCAN_INTERVAL)))
+    except ValueError:
+        return DEFAULT_SCAN_INTERVAL
+
+class ScanScheduler:
+    def __init__(self, interval):
+        self.interval = interval
+        self.wakeup = threading.Event()
+        self.lock = threading.Lock()
+        self.pending = set()
+        self.full_scan = True
+        self.last_full_scan = time.monotonic()
+
+    # Wake the loop up early. Without scanners every launcher gets checked
+    def request_scan(self, reason=None, scanners=None):
+        if reason:
+            print(f"Scan requested: {reason}")
+        with self.lock:
+            if scanners is None:
+                self.full_scan = True
+            else:
+                self.pending.update(scanners)
+        self.wakeup.set()
+
+    def wait(self):
+        self.wakeup.wait(self.interval)
+        self.wakeup.clear()
+
+    # None when there is nothing to scan, otherwise the scanners to check
+    def take_scan_request(self):
+        with self.lock:
+            if time.monotonic() - self.last_full_scan >= FULL_RESCAN_INTERVAL:
+                self.full_scan = True
+            if self.full_scan:
+                self.last_full_scan = time.monotonic()
+                scanners = {scanner.name for scanner in launcher_scanners}
+            elif self.pending:
+                scanners = self.pending
+            else:
+                return None
+            self.full_scan = False
+            self.pending = set()
+            return scanners
+
+def run_daemon():
+    global frontend_targets
+
+    scheduler = ScanScheduler(get_scan_interval())
+    watcher = start_change_watcher(scheduler)
+    print(f"Scanner daemon started, checking Steam every {scheduler.interval}s.")
+
+    while True:
+        try:
+            if reload_env_vars_if_changed():
+                scheduler.interval = get_scan_interval()
+                scheduler.request_scan("env_vars changed")
+            reload_shortcuts_if_changed()
+
+            try:
+                targets = get_frontend_targets()
+            except Exception as e:
+                print(f"Steam debugger not reachable, skipping this scan: {e}")
+                continue
+
+            if targets != frontend_targets:
+                close_devtools_clients()
+                inject_frontend_scripts()
+                frontend_targets = targets
+                scheduler.request_scan("Steam frontend (re)started")
+            elif sync_scanner_controls():
+                scheduler.request_scan("manual scan from Steam")
+
+            scanners = scheduler.take_scan_request()
+            if scanners is None:
+                continue
+            run_scan_cycle(scanners)
+            watcher.refresh(scanner_watch_paths())
+        except Exception as e:
+            print(f"Scan cycle failed: {e}")
+        finally:
+            scheduler.wait()
+#End of Daemon mode
+
+
+
+def main():
+    if "--benchmark" in sys.argv[1:]:
+        run_websocket_benchmark()
+        run_vdf_benchmark()
+        return
+
+    install_service()
+    single_instance()
+    load_shortcuts()
+    load_scan_index()
+
+    if "--daemon" in sys.argv[1:]:
+        run_daemon()
+    else:
+        inject_frontend_scripts()
+        run_scan_cycle()
 
-                if found_file:
-                    break
 
-            if not found_file:
-                print(f"No .desktop file found for: {game_name}")
+if __name__ == "__main__":
+    main()
@@ -104,6 +104,16 @@ nsl_safe_rm() {
         "${logged_in_home}/.config/systemd/user/descriptions.json"|\
         "${logged_in_home}/.config/systemd/user/nslgamescanner.service"|\
         "${logged_in_home}/.config/systemd/user/env_vars"|\
+        "${logged_in_home}/.config/systemd/user/apicache.db"|\
+        "${logged_in_home}/.config/systemd/user/apicache.db-journal"|\
+        "${logged_in_home}/.config/systemd/user/installedapps.db"|\
+        "${logged_in_home}/.config/systemd/user/installedapps.db-journal"|\
+        "${logged_in_home}/.config/systemd/user/installedapps.json"|\
+        "${logged_in_home}/.config/systemd/user/steamapplist.json"|\
+        "${logged_in_home}/.config/systemd/user/umuindex.json"|\
+        "${logged_in_home}/.config/systemd/user/umu-database.csv"|\
+        "${logged_in_home}/.config/systemd/user/scanindex.json"|\
+        "${logged_in_home}/.config/systemd/user/steamdeckrepo.json"|\
         "${logged_in_home}/.local/share/applications/RemotePlayWhatever"|\
         "${logged_in_home}/.local/share/applications/RemotePlayWhatever.desktop"|\
         /tmp/NonSteamLaunchersDecky|/tmp/NonSteamLaunchersDecky.zip|/tmp/NonSteamLaunchersDecky-main|\
@@ -1354,6 +1364,16 @@ StartFreshFunction() {
             "${logged_in_home}/.config/systemd/user/NSLGameScanner.py"|\
             "${logged_in_home}/.config/systemd/user/env_vars"|\
             "${logged_in_home}/.config/systemd/user/nslgamescanner.service"|\
+            "${logged_in_home}/.config/systemd/user/apicache.db"|\
+            "${logged_in_home}/.config/systemd/user/apicache.db-journal"|\
+            "${logged_in_home}/.config/systemd/user/installedapps.db"|\
+            "${logged_in_home}/.config/systemd/user/installedapps.db-journal"|\
+            "${logged_in_home}/.config/systemd/user/installedapps.json"|\
+            "${logged_in_home}/.config/systemd/user/steamapplist.json"|\
+            "${logged_in_home}/.config/systemd/user/umuindex.json"|\
+            "${logged_in_home}/.config/systemd/user/umu-database.csv"|\
+            "${logged_in_home}/.config/systemd/user/scanindex.json"|\
+            "${logged_in_home}/.config/systemd/user/steamdeckrepo.json"|\
             "${logged_in_home}/.local/share/applications/RemotePlayWhatever"|\
             "${logged_in_home}/.local/share/applications/RemotePlayWhatever.desktop"|\
             "${logged_in_home}/Downloads/NonSteamLaunchers-install.log")
@@ -1471,6 +1491,18 @@ StartFreshFunction() {
     delete_path "${logged_in_home}/.config/systemd/user/NSLGameScanner.py"
     delete_path "${logged_in_home}/.config/systemd/user/env_vars"
 
+    # Caches and state the scanner keeps next to itself
+    delete_path "${logged_in_home}/.config/systemd/user/apicache.db"
+    delete_path "${logged_in_home}/.config/systemd/user/apicache.db-journal"
+    delete_path "${logged_in_home}/.config/systemd/user/installedapps.db"
+    delete_path "${logged_in_home}/.config/systemd/user/installedapps.db-journal"
+    delete_path "${logged_in_home}/.config/systemd/user/installedapps.json"
+    delete_path "${logged_in_home}/.config/systemd/user/steamapplist.json"
+    delete_path "${logged_in_home}/.config/systemd/user/umuindex.json"
+    delete_path "${logged_in_home}/.config/systemd/user/umu-database.csv"
+    delete_path "${logged_in_home}/.config/systemd/user/scanindex.json"
+    delete_path "${logged_in_home}/.config/systemd/user/steamdeckrepo.json"
+
     delete_path "${logged_in_home}/.config/systemd/user/nslgamescanner.service"
 
     if [[ "$NSL_DRY_RUN" == "1" ]]; then